@@ -0,0 +1,75 @@
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional
+import numpy as np
+from app.core.config import get_settings
+from app.utils.ngram_matcher import NgramMatcher
+
+
+def build_catalog(foods: Iterable[Mapping[str, Any]], directory: str | Path, *, n: int = 3) -> int:
+    """
+    Write a catalog snapshot: food records as NDJSON with a byte-offset index, plus the
+    n-gram matrix over their descriptions. Returns the number of foods written.
+    """
+    d = Path(directory)
+    d.mkdir(parents=True, exist_ok=True)
+    offsets = [0]
+    descriptions = []
+    with open(d / "foods.ndjson", "wb") as fh:
+        for food in foods:
+            line = json.dumps(food, separators=(",", ":")).encode() + b"\n"
+            fh.write(line)
+            offsets.append(offsets[-1] + len(line))
+            descriptions.append(str(food.get("description") or ""))
+    np.save(d / "offsets.npy", np.asarray(offsets, dtype=np.int64))
+    NgramMatcher.build(descriptions, n=n).save(d)
+    return len(descriptions)
+
+
+class LocalCatalogSearchClient:
+    """
+    FoodSearchClient over a local snapshot of USDA food records. The n-gram matcher picks the
+    top candidates; CalorieService then reranks them with its usual composite score.
+    """
+
+    def __init__(self, directory: str | Path, *, default_page_size: Optional[int] = None):
+        d = Path(directory)
+        self._matcher = NgramMatcher.load(d)
+        self._offsets = np.load(d / "offsets.npy", mmap_mode="r")
+        self._fd = os.open(d / "foods.ndjson", os.O_RDONLY)
+        self._default_page_size = int(default_page_size or get_settings().USDA_PAGE_SIZE)
+
+    def __len__(self) -> int:
+        return len(self._matcher)
+
+    def food(self, doc_id: int) -> Mapping[str, Any]:
+        start, end = int(self._offsets[doc_id]), int(self._offsets[doc_id + 1])
+        return json.loads(os.pread(self._fd, end - start, start))
+
+    def _search(self, query: str, page_size: int) -> Mapping[str, Any]:
+        foods = [self.food(doc_id) for doc_id, _ in self._matcher.top_k(query, page_size)]
+        return {"foods": foods, "totalHits": len(foods)}
+
+    async def search(self, query: str, *, page_size: Optional[int] = None) -> Mapping[str, Any]:
+        # scoring and record reads are CPU and disk work; keep them off the event loop
+        return await asyncio.to_thread(
+            self._search, query, int(page_size or self._default_page_size)
+        )
+
+    async def aclose(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+if __name__ == "__main__":
+    # Build a snapshot from an NDJSON file of USDA food records (one food per line):
+    #   python -m app.adapters.catalog.local_catalog_client foods.ndjson catalog_dir
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m app.adapters.catalog.local_catalog_client <foods.ndjson> <dir>")
+    with open(sys.argv[1], encoding="utf-8") as src:
+        count = build_catalog((json.loads(line) for line in src if line.strip()), sys.argv[2])
+    print(f"catalog of {count} foods -> {sys.argv[2]}")
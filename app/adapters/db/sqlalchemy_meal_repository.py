@@ -0,0 +1,101 @@
+from datetime import date, datetime, timezone
+from typing import Optional, Sequence
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from app.ports.meal_repository import MealRepository
+from app.models.meal import MealEntry, DailyCalorieTotal
+
+
+def utc_day(ts: datetime) -> date:
+    """Calendar day (UTC) a meal is counted under; naive timestamps are taken as UTC."""
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc)
+    return ts.date()
+
+
+class SqlAlchemyMealRepository(MealRepository):
+    """Concrete implementation of MealRepository using SQLAlchemy."""
+
+    def __init__(self, db: Session):
+        self._db = db
+
+    def add(self, user_id: int, dish_name: str, servings: float, total_calories: float,
+            eaten_at: datetime) -> MealEntry:
+        entry = MealEntry(
+            user_id=user_id,
+            dish_name=dish_name,
+            servings=servings,
+            total_calories=total_calories,
+            eaten_at=eaten_at,
+        )
+        self._db.add(entry)
+        self._db.flush()
+        self._bump_daily(user_id, utc_day(eaten_at), total_calories, 1)
+        return entry
+
+    def get(self, user_id: int, entry_id: int) -> MealEntry | None:
+        stmt = select(MealEntry).where(MealEntry.id == entry_id, MealEntry.user_id == user_id)
+        return self._db.execute(stmt).scalar_one_or_none()
+
+    def delete(self, entry: MealEntry) -> None:
+        self._bump_daily(entry.user_id, utc_day(entry.eaten_at), -entry.total_calories, -1)
+        self._db.delete(entry)
+        self._db.flush()
+
+    def list_page(self, user_id: int, *, limit: int,
+                  before: Optional[tuple[datetime, int]] = None) -> Sequence[MealEntry]:
+        stmt = select(MealEntry).where(MealEntry.user_id == user_id)
+        if before is not None:
+            eaten_at, entry_id = before
+            stmt = stmt.where(or_(
+                MealEntry.eaten_at < eaten_at,
+                and_(MealEntry.eaten_at == eaten_at, MealEntry.id < entry_id),
+            ))
+        stmt = stmt.order_by(MealEntry.eaten_at.desc(), MealEntry.id.desc()).limit(limit)
+        return self._db.execute(stmt).scalars().all()
+
+    def daily_totals(self, user_id: int, start: date, end: date) -> Sequence[DailyCalorieTotal]:
+        stmt = (
+            select(DailyCalorieTotal)
+            .where(
+                DailyCalorieTotal.user_id == user_id,
+                DailyCalorieTotal.day >= start,
+                DailyCalorieTotal.day <= end,
+            )
+            .order_by(DailyCalorieTotal.day)
+        )
+        return self._db.execute(stmt).scalars().all()
+
+    def _bump_daily(self, user_id: int, day: date, calories: float, count: int) -> None:
+        """Apply a delta to the day's running total as a single upsert (no read-modify-write)."""
+        dialect = self._db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            insert = pg_insert if dialect == "postgresql" else sqlite_insert
+            stmt = insert(DailyCalorieTotal).values(
+                user_id=user_id, day=day, total_calories=calories, entry_count=count
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[DailyCalorieTotal.user_id, DailyCalorieTotal.day],
+                set_={
+                    "total_calories": DailyCalorieTotal.total_calories + stmt.excluded.total_calories,
+                    "entry_count": DailyCalorieTotal.entry_count + stmt.excluded.entry_count,
+                },
+            )
+            self._db.execute(stmt)
+            return
+
+        updated = self._db.execute(
+            update(DailyCalorieTotal)
+            .where(DailyCalorieTotal.user_id == user_id, DailyCalorieTotal.day == day)
+            .values(
+                total_calories=DailyCalorieTotal.total_calories + calories,
+                entry_count=DailyCalorieTotal.entry_count + count,
+            )
+        )
+        if updated.rowcount == 0:
+            self._db.add(DailyCalorieTotal(
+                user_id=user_id, day=day, total_calories=calories, entry_count=count
+            ))
+            self._db.flush()
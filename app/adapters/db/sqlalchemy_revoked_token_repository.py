@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+from typing import Sequence, Tuple
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.ports.revoked_token_repository import RevokedTokenRepository
+from app.models.revoked_token import RevokedToken
+
+
+class SqlAlchemyRevokedTokenRepository(RevokedTokenRepository):
+    """Concrete implementation of RevokedTokenRepository using SQLAlchemy."""
+
+    def __init__(self, db: Session):
+        self._db = db
+
+    def add(self, jti: str, token_type: str, expires_at: datetime) -> bool:
+        row = RevokedToken(
+            jti=jti,
+            token_type=token_type,
+            expires_at=expires_at,
+            revoked_at=datetime.now(timezone.utc),
+        )
+        # savepoint so a duplicate (e.g. a refresh token replayed concurrently) leaves the
+        # outer transaction usable
+        try:
+            with self._db.begin_nested():
+                self._db.add(row)
+        except IntegrityError:
+            return False
+        return True
+
+    def is_revoked(self, jti: str) -> bool:
+        stmt = select(RevokedToken.id).where(RevokedToken.jti == jti)
+        return self._db.execute(stmt).first() is not None
+
+    def revoked_since(self, since: datetime, now: datetime) -> Sequence[Tuple[str, datetime]]:
+        stmt = select(RevokedToken.jti, RevokedToken.revoked_at).where(
+            RevokedToken.revoked_at >= since, RevokedToken.expires_at > now
+        )
+        return [(jti, revoked_at) for jti, revoked_at in self._db.execute(stmt)]
@@ -0,0 +1,34 @@
+from typing import Any, Dict, Mapping, Optional, Sequence
+from app.core.admission import AdmissionController
+from app.ports.food_search import FoodSearchClient
+
+
+class AdmittedFoodSearchClient:
+    """
+    FoodSearchClient decorator that sends only cache misses through admission control,
+    so answers already in the provider's cache are never queued or shed.
+    """
+
+    def __init__(self, inner: FoodSearchClient, admission: AdmissionController):
+        self._inner = inner
+        self._admission = admission
+
+    async def search(self, query: str, *, page_size: Optional[int] = None) -> Mapping[str, Any]:
+        cached = getattr(self._inner, "cached", None)
+        if cached is not None:
+            hit = cached(query, page_size=page_size)
+            if hit is not None:
+                return hit
+        async with self._admission.slot():
+            return await self._inner.search(query, page_size=page_size)
+
+    async def foods(self, fdc_ids: Sequence[int]) -> Dict[int, Mapping[str, Any]]:
+        foods = getattr(self._inner, "foods", None)
+        if foods is None:
+            return {}  # provider can't fetch details
+        cached = getattr(self._inner, "cached_foods", None)
+        hit = cached(fdc_ids) if cached is not None else None
+        if hit is not None:
+            return hit
+        async with self._admission.slot():
+            return await foods(fdc_ids)
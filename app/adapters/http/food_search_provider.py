@@ -0,0 +1,60 @@
+from typing import Optional
+from app.adapters.http.usda_client import get_usda_client, close_usda_client
+from app.adapters.http.peer_search import PeerFoodSearchClient
+from app.adapters.http.recorded_search import (RecordingFoodSearchClient, ReplayFoodSearchClient,
+                                               SearchRecordingStore)
+from app.core.config import get_settings
+from app.ports.food_search import FoodSearchClient
+from app.utils.hash_ring import HashRing
+
+_wrapped: Optional[FoodSearchClient] = None
+
+
+def get_food_search_client() -> FoodSearchClient:
+    """
+    The app's food search provider, chosen by FOOD_SEARCH_MODE:
+    live (USDA), record (USDA + append to FOOD_SEARCH_RECORDING_PATH), replay (recording only)
+    or local (n-gram matcher over the FOOD_CATALOG_DIR snapshot; needs numpy).
+    With PEER_CACHE_ENABLED, live mode shares its cache with the other PEER_URLS nodes.
+    """
+    global _wrapped
+    s = get_settings()
+    if s.FOOD_SEARCH_MODE == "live":
+        if not s.PEER_CACHE_ENABLED:
+            return get_usda_client()
+        if _wrapped is None:
+            _wrapped = PeerFoodSearchClient(
+                get_usda_client(),
+                HashRing(s.peer_urls_list or [s.PEER_SELF_URL], vnodes=s.PEER_VNODES),
+                s.PEER_SELF_URL,
+                token=s.PEER_TOKEN.get_secret_value(),
+                timeout_s=s.PEER_TIMEOUT_S,
+                hot_cache_ttl_s=s.CACHE_TTL_S,
+                hot_cache_maxsize=s.PEER_HOT_CACHE_MAXSIZE,
+            )
+        return _wrapped
+    if _wrapped is None and s.FOOD_SEARCH_MODE == "local":
+        # imported here so numpy stays an optional dependency for the other modes
+        from app.adapters.catalog.local_catalog_client import LocalCatalogSearchClient
+        _wrapped = LocalCatalogSearchClient(s.FOOD_CATALOG_DIR)
+    if _wrapped is None:
+        store = SearchRecordingStore(s.FOOD_SEARCH_RECORDING_PATH)
+        if s.FOOD_SEARCH_MODE == "record":
+            _wrapped = RecordingFoodSearchClient(get_usda_client(), store)
+        else:
+            _wrapped = ReplayFoodSearchClient(
+                store,
+                latency_ms=s.REPLAY_LATENCY_MS,
+                use_recorded_latency=s.REPLAY_USE_RECORDED_LATENCY,
+                strict=s.REPLAY_STRICT,
+            )
+    return _wrapped
+
+
+async def close_food_search_client() -> None:
+    """Flush any recording and close the underlying HTTP client (app shutdown)."""
+    global _wrapped
+    if _wrapped is not None:
+        await _wrapped.aclose()  # type: ignore[attr-defined]
+        _wrapped = None
+    await close_usda_client()
@@ -0,0 +1,139 @@
+import asyncio
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+import httpx
+from cachetools import TTLCache
+from app.adapters.http.usda_client import USDAError
+from app.core.admission import Overloaded
+from app.core.quota import Priority, current_priority
+from app.ports.food_search import FoodSearchClient
+from app.utils.hash_ring import HashRing
+
+PEER_PATH = "/internal/peer/search"
+PEER_TOKEN_HEADER = "X-Peer-Token"
+
+
+class _LeaderCancelled(Exception):
+    """Set on a coalesced fetch whose leading request went away; waiters fetch again."""
+
+
+def peer_key(query: str) -> str:
+    # same normalization as the USDA client's cache key, so owner and cache agree
+    return query.strip().lower()
+
+
+class PeerFoodSearchClient:
+    """
+    FoodSearchClient that shares one logical cache across API nodes (groupcache-style).
+
+    Each query key has one owner on a consistent-hash ring. On a local miss a node asks the
+    owner over the internal peer endpoint; only the owner calls upstream, and it coalesces
+    concurrent fetches of the same key into one call. Answers fetched from peers are kept in
+    a small "hot" cache. If the owner is unreachable the node fetches upstream itself.
+    """
+
+    def __init__(
+        self,
+        inner: FoodSearchClient,
+        ring: HashRing,
+        self_url: str,
+        *,
+        token: str = "",
+        client: Optional[httpx.AsyncClient] = None,
+        timeout_s: float = 1.0,
+        hot_cache_ttl_s: int = 600,
+        hot_cache_maxsize: int = 128,
+    ):
+        self._inner = inner
+        self._ring = ring
+        self._self_url = self_url.rstrip("/")
+        self._token = token
+        self._client = client or httpx.AsyncClient(timeout=timeout_s)
+        self._hot: Optional[TTLCache[Tuple[str, Optional[int]], Mapping[str, Any]]] = (
+            TTLCache(maxsize=hot_cache_maxsize, ttl=hot_cache_ttl_s) if hot_cache_ttl_s > 0 else None
+        )
+        self._inflight: Dict[Tuple[str, Optional[int]], asyncio.Future] = {}
+
+    def owner(self, query: str) -> str:
+        return self._ring.owner(peer_key(query))
+
+    def cached(self, query: str, *, page_size: Optional[int] = None) -> Optional[Mapping[str, Any]]:
+        cached = getattr(self._inner, "cached", None)
+        hit = cached(query, page_size=page_size) if cached is not None else None
+        if hit is None and self._hot is not None:
+            hit = self._hot.get((peer_key(query), page_size))
+        return hit
+
+    async def search(self, query: str, *, page_size: Optional[int] = None) -> Mapping[str, Any]:
+        hit = self.cached(query, page_size=page_size)
+        if hit is not None:
+            return hit
+        owner = self.owner(query)
+        if owner != self._self_url:
+            try:
+                data = await self._from_peer(owner, query, page_size)
+            except (httpx.TransportError, httpx.HTTPStatusError):
+                pass  # owner down or misbehaving: serve the request ourselves
+            else:
+                if self._hot is not None:
+                    self._hot[(peer_key(query), page_size)] = data
+                return data
+        return await self.fetch_as_owner(query, page_size=page_size)
+
+    def cached_foods(self, fdc_ids: Sequence[int]) -> Optional[Dict[int, Mapping[str, Any]]]:
+        cached = getattr(self._inner, "cached_foods", None)
+        return cached(fdc_ids) if cached is not None else None
+
+    async def foods(self, fdc_ids: Sequence[int]) -> Dict[int, Mapping[str, Any]]:
+        # details are cached by id on each node; rarer than searches, so not routed to owners
+        foods = getattr(self._inner, "foods", None)
+        return await foods(fdc_ids) if foods is not None else {}
+
+    async def _from_peer(self, owner: str, query: str, page_size: Optional[int]) -> Mapping[str, Any]:
+        params: Dict[str, Any] = {"q": query}
+        if page_size:
+            params["page_size"] = page_size
+        if current_priority() is Priority.BACKGROUND:
+            params["priority"] = "background"  # so the owner spends quota at our priority
+        resp = await self._client.get(
+            owner + PEER_PATH, params=params, headers={PEER_TOKEN_HEADER: self._token}
+        )
+        if resp.status_code == 503:
+            # the owner shed the request or failed upstream; retrying from here would only add load
+            retry_after = resp.headers.get("retry-after")
+            if retry_after is not None and retry_after.isdigit():
+                raise Overloaded(int(retry_after))
+            raise USDAError(f"Peer {owner} could not reach USDA")
+        resp.raise_for_status()
+        return resp.json()
+
+    async def fetch_as_owner(self, query: str, *, page_size: Optional[int] = None) -> Mapping[str, Any]:
+        """Fetch through the local cache, joining any in-flight fetch of the same key."""
+        key = (peer_key(query), page_size)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except _LeaderCancelled:
+                # the leader's client disconnected; the first waiter back here leads a new fetch
+                return await self.fetch_as_owner(query, page_size=page_size)
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            data = await self._inner.search(query, page_size=page_size)
+        except asyncio.CancelledError:
+            # cancelling `fut` would cancel every unrelated waiter along with the leader
+            fut.set_exception(_LeaderCancelled())
+            fut.exception()
+            raise
+        except Exception as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved when nobody else was waiting
+            raise
+        else:
+            fut.set_result(data)
+            return data
+        finally:
+            self._inflight.pop(key, None)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
@@ -0,0 +1,155 @@
+import asyncio
+import gzip
+import json
+import time
+from pathlib import Path
+from typing import IO, Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from app.adapters.http.usda_client import USDAError
+from app.ports.food_search import FoodSearchClient
+
+RecordKey = Tuple[str, Optional[int]]
+
+
+def _key(query: str, page_size: Optional[int] = None) -> RecordKey:
+    # same normalization as the USDA client's cache key; page sizes are recorded apart
+    return query.strip().lower(), page_size
+
+
+class SearchRecordingStore:
+    """
+    Append-only log of search query/response pairs, one JSON object per line:
+    {"q": query, "ps": page size (omitted for the default), "ms": upstream latency,
+    "r": response}. A path ending in `.gz` is written as gzip members (one per flush), which
+    `gzip` reads back as a single stream.
+    """
+
+    def __init__(self, path: str | Path):
+        self._path = Path(path)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _open(self, mode: str) -> IO[str]:
+        if self._path.suffix == ".gz":
+            return gzip.open(self._path, mode + "t", encoding="utf-8")
+        return open(self._path, mode, encoding="utf-8")
+
+    def append(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._open("a") as fh:
+            for rec in records:
+                fh.write(json.dumps(rec, separators=(",", ":")) + "\n")
+
+    def load(self) -> Dict[RecordKey, Dict[str, Any]]:
+        """Map (normalized query, page size) -> latest record."""
+        out: Dict[RecordKey, Dict[str, Any]] = {}
+        if not self._path.exists():
+            return out
+        with self._open("r") as fh:
+            for line in fh:
+                if line.strip():
+                    rec = json.loads(line)
+                    out[_key(rec["q"], rec.get("ps"))] = rec
+        return out
+
+
+class RecordingFoodSearchClient:
+    """FoodSearchClient that forwards to a live client and records each new query it sees."""
+
+    def __init__(self, inner: FoodSearchClient, store: SearchRecordingStore, *, flush_every: int = 50):
+        self._inner = inner
+        self._store = store
+        self._flush_every = flush_every
+        self._seen = set(store.load())
+        self._buffer: List[Dict[str, Any]] = []
+        self._flush_lock = asyncio.Lock()  # one append at a time keeps records whole and in order
+
+    def cached(self, query: str, *, page_size: Optional[int] = None) -> Optional[Mapping[str, Any]]:
+        cached = getattr(self._inner, "cached", None)
+        return cached(query, page_size=page_size) if cached is not None else None
+
+    async def search(self, query: str, *, page_size: Optional[int] = None) -> Mapping[str, Any]:
+        started = time.perf_counter()
+        data = await self._inner.search(query, page_size=page_size)
+        key = _key(query, page_size)
+        if key not in self._seen:
+            self._seen.add(key)
+            elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+            rec: Dict[str, Any] = {"q": query, "ms": elapsed_ms, "r": data}
+            if page_size is not None:
+                rec["ps"] = page_size
+            self._buffer.append(rec)
+            if len(self._buffer) >= self._flush_every:
+                await self.flush()
+        return data
+
+    def cached_foods(self, fdc_ids: Sequence[int]) -> Optional[Dict[int, Mapping[str, Any]]]:
+        cached = getattr(self._inner, "cached_foods", None)
+        return cached(fdc_ids) if cached is not None else None
+
+    async def foods(self, fdc_ids: Sequence[int]) -> Dict[int, Mapping[str, Any]]:
+        # detail lookups pass through unrecorded; a replay has no details to offer
+        foods = getattr(self._inner, "foods", None)
+        return await foods(fdc_ids) if foods is not None else {}
+
+    async def flush(self) -> None:
+        """Write buffered records; encoding (and gzip) run in a worker thread, off the loop."""
+        buffered, self._buffer = self._buffer, []
+        if not buffered:
+            return
+        async with self._flush_lock:
+            await asyncio.to_thread(self._store.append, buffered)
+
+    async def aclose(self) -> None:
+        await self.flush()
+        aclose = getattr(self._inner, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+class ReplayFoodSearchClient:
+    """
+    FoodSearchClient answering from a recording, with optional latency injection: a fixed
+    `latency_ms`, or the latency observed when recording (`use_recorded_latency`).
+    Unrecorded queries return no foods, or raise USDAError with `strict=True`.
+    """
+
+    def __init__(
+        self,
+        store: SearchRecordingStore,
+        *,
+        latency_ms: float = 0.0,
+        use_recorded_latency: bool = False,
+        strict: bool = False,
+    ):
+        self._records = store.load()
+        self._latency_s = latency_ms / 1000.0
+        self._use_recorded = use_recorded_latency
+        self._strict = strict
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def cached(self, query: str, *, page_size: Optional[int] = None) -> Optional[Mapping[str, Any]]:
+        # a replay never touches the network, but injected latency should still be admitted
+        if self._latency_s or self._use_recorded:
+            return None
+        rec = self._records.get(_key(query, page_size))
+        return rec["r"] if rec is not None else None
+
+    async def search(self, query: str, *, page_size: Optional[int] = None) -> Mapping[str, Any]:
+        rec = self._records.get(_key(query, page_size))
+        delay = (rec or {}).get("ms", 0) / 1000.0 if self._use_recorded else self._latency_s
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if rec is None:
+            if self._strict:
+                raise USDAError(f"No recording for query {query!r}")
+            return {"foods": []}
+        return rec["r"]
+
+    async def aclose(self) -> None:
+        return None
@@ -1,31 +1,46 @@
 import httpx
 import asyncio
-from typing import Any, Mapping, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 from cachetools import TTLCache
 from app.core.config import get_settings
+from app.core.quota import QuotaGovernor, get_quota_governor
+
+
+# Nutrient numbers of energy (kcal, kJ, Atwater general/specific) requested from /foods
+ENERGY_NUTRIENT_NUMBERS = (208, 268, 957, 958)
 
 
 class USDAError(RuntimeError):
     pass
 
 
+def _retry_after(resp: httpx.Response) -> Optional[float]:
+    try:
+        return float(resp.headers["retry-after"])
+    except (KeyError, ValueError):
+        return None
+
+
 class USDAClient:
-    """ HTTP client (Async) for USDA FoodData Central search with TTL cache."""
+    """ HTTP client (Async) for USDA FoodData Central search and food details with TTL caches."""
 
     def __init__(
         self,
         *,
         client: Optional[httpx.AsyncClient] = None,
         base_url: Optional[str] = None,
+        foods_url: Optional[str] = None,
         api_key: Optional[str] = None,
         timeout_s: Optional[float] = None,
         retries: Optional[int] = None,
         default_page_size: Optional[int] = None,
         cache_ttl_s: Optional[int] = None,
         cache_maxsize: Optional[int] = None,
+        quota: Optional[QuotaGovernor] = None,
     ):
         settings = get_settings()
         self._base_url = base_url or settings.USDA_BASE_URL
+        self._foods_url = foods_url or settings.USDA_FOODS_URL
         self._api_key = (api_key or settings.USDA_API_KEY.get_secret_value())
         self._timeout_s = float(timeout_s or settings.USDA_TIMEOUT_S)
         self._retries = int(retries or settings.USDA_RETRIES)
@@ -36,7 +51,11 @@ class USDAClient:
         self._cache: Optional[TTLCache[Tuple[str, int], Mapping[str, Any]]] = (
             TTLCache(maxsize=maxsize, ttl=ttl) if ttl and ttl > 0 else None
         )
+        self._details: Optional[TTLCache[int, Mapping[str, Any]]] = (
+            TTLCache(maxsize=settings.DETAILS_CACHE_MAXSIZE, ttl=ttl) if ttl and ttl > 0 else None
+        )
         self._lock = asyncio.Lock()  # protect cache in concurrent scenarios
+        self._quota = quota if quota is not None else get_quota_governor()
 
     @property
     def base_url(self) -> str:
@@ -50,9 +69,18 @@ class USDAClient:
     def timeout_s(self) -> float:
         return self._timeout_s
 
+    def _cache_key(self, query: str, page_size: Optional[int]) -> Tuple[str, int]:
+        return query.strip().lower(), int(page_size or self._default_page_size)
+
+    def cached(self, query: str, *, page_size: Optional[int] = None) -> Optional[Mapping[str, Any]]:
+        """Return the cached search result without any I/O, or None on a miss."""
+        if self._cache is None:
+            return None
+        return self._cache.get(self._cache_key(query, page_size))
+
     async def search(self, query: str, *, page_size: Optional[int] = None) -> Mapping[str, Any]:
         """Call USDA search endpoint and return JSON. Uses TTL cache when enabled."""
-        keys = (query.strip().lower(), int(page_size or self._default_page_size))
+        keys = self._cache_key(query, page_size)
 
         if self._cache is not None:
             result = self._cache.get(keys)
@@ -60,22 +88,75 @@ class USDAClient:
                 return result
 
         params = {"query": query, "api_key": self._api_key, "pageSize": keys[1]}
+        data = await self._request("GET", self._base_url, params=params, not_found={"foods": []})
 
+        # store in cache (including empty lists) to avoid refetch storms
+        if self._cache is not None:
+            async with self._lock:
+                self._cache[keys] = data
+        return data
+
+    def cached_foods(self, fdc_ids: Sequence[int]) -> Optional[Dict[int, Mapping[str, Any]]]:
+        """Details for `fdc_ids` if every one is cached (unknown ids map to nothing), else None."""
+        if self._details is None:
+            return None
+        out: Dict[int, Mapping[str, Any]] = {}
+        for fdc_id in fdc_ids:
+            food = self._details.get(fdc_id)
+            if food is None:
+                return None
+            if food:
+                out[fdc_id] = food
+        return out
+
+    async def foods(self, fdc_ids: Sequence[int]) -> Dict[int, Mapping[str, Any]]:
+        """
+        Full food details by FDC id. Ids not cached yet are fetched in one call to the multi-id
+        /foods endpoint; details (and ids USDA doesn't know) are cached by id across queries.
+        """
+        out: Dict[int, Mapping[str, Any]] = {}
+        missing: List[int] = []
+        for fdc_id in dict.fromkeys(fdc_ids):
+            food = self._details.get(fdc_id) if self._details is not None else None
+            if food is None:
+                missing.append(fdc_id)
+            elif food:
+                out[fdc_id] = food
+        if not missing:
+            return out
+
+        data = await self._request(
+            "POST",
+            self._foods_url,
+            params={"api_key": self._api_key},
+            json={"fdcIds": missing, "format": "full", "nutrients": list(ENERGY_NUTRIENT_NUMBERS)},
+            not_found=[],
+        )
+        fetched = {f["fdcId"]: f for f in data or [] if isinstance(f, dict) and "fdcId" in f}
+        if self._details is not None:
+            async with self._lock:
+                for fdc_id in missing:
+                    self._details[fdc_id] = fetched.get(fdc_id, {})  # {}: known to be absent
+        out.update(fetched)
+        return out
+
+    async def _request(self, method: str, url: str, *, params: Mapping[str, Any],
+                       json: Any = None, not_found: Any) -> Any:
+        """One USDA call with quota accounting and retries; a 404 returns `not_found`."""
         last_exc: Optional[Exception] = None
         for attempt in range(self._retries + 1):
+            if self._quota is not None:
+                await self._quota.acquire()  # may wait, or shed interactive calls (Overloaded)
             try:
-                resp = await self._client.get(self._base_url, params=params)
+                resp = await self._client.request(method, url, params=params, json=json)
+                if self._quota is not None:
+                    self._quota.observe(resp.headers)
+                    if resp.status_code == 429:
+                        self._quota.throttled(_retry_after(resp))
                 if resp.status_code == 404:
-                    data = {"foods": []}
-                else:
-                    resp.raise_for_status()
-                    data = resp.json()
-
-                # store in cache (including empty lists) to avoid refetch storms
-                if self._cache is not None:
-                    async with self._lock:
-                        self._cache[keys] = data
-                return data
+                    return not_found
+                resp.raise_for_status()
+                return resp.json()
 
             except (httpx.HTTPStatusError, httpx.RequestError) as e:
                 last_exc = e
@@ -97,3 +178,12 @@ def get_usda_client() -> USDAClient:
     if _singleton is None:
         _singleton = USDAClient()
     return _singleton
+
+
+async def close_usda_client() -> None:
+    """Close the shared client (app shutdown); the next call to get_usda_client() rebuilds it."""
+    global _singleton
+    if _singleton is not None:
+        await _singleton.aclose()
+        _singleton = None
+
@@ -1,20 +1,59 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from typing import Any, Optional
+import jwt
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
-from app.core.config import get_settings
-from app.core.rate_limit import limiter
+from app.core.security import decode_access_token
+from app.core.rate_limit import limiter, default_rate_limit, login_rate_limit
+from app.core.revocation import RevocationList, get_revocation_list
 from app.db.session import get_db
 from app.adapters.db.sqlalchemy_user_repository import SqlAlchemyUserRepository
-from app.schemas.auth import Register, LoginIn, User, LoginOut
+from app.adapters.db.sqlalchemy_revoked_token_repository import SqlAlchemyRevokedTokenRepository
+from app.schemas.auth import Register, LoginIn, User, LoginOut, RefreshIn, LogoutIn, TokenPair
 from app.services.auth_service import AuthService
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
-_settings = get_settings()
+_bearer = HTTPBearer(auto_error=False)
 
 
-def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
+def get_auth_service(
+    db: Session = Depends(get_db), revocations: RevocationList = Depends(get_revocation_list)
+) -> AuthService:
     repo = SqlAlchemyUserRepository(db)
-    return AuthService(repo)
+    return AuthService(repo, SqlAlchemyRevokedTokenRepository(db), revocations)
+
+
+def get_current_claims(
+    creds: HTTPAuthorizationCredentials | None = Depends(_bearer),
+    db: Session = Depends(get_db),
+    revocations: RevocationList = Depends(get_revocation_list),
+) -> dict[str, Any]:
+    """
+    Verify the bearer token. Revocation is checked against the in-memory filter; the DB is
+    only queried on a possible match (and for the periodic filter sync).
+    """
+    unauthorized = HTTPException(
+        status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Bearer"}
+    )
+    if creds is None:
+        raise unauthorized
+    try:
+        claims = decode_access_token(creds.credentials)
+    except jwt.PyJWTError:
+        raise unauthorized
+    if revocations.is_revoked(claims["jti"], SqlAlchemyRevokedTokenRepository(db)):
+        raise unauthorized
+    return claims
+
+
+def get_current_user_id(claims: dict[str, Any] = Depends(get_current_claims)) -> int:
+    try:
+        return int(claims["sub"])
+    except ValueError:
+        raise HTTPException(
+            status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Bearer"}
+        )
 
 
 @router.post(
@@ -23,7 +62,7 @@ def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
     status_code=201,
     summary="Register a new user"
 )
-@limiter.limit(f"{_settings.RATE_LIMIT_PER_MIN}/minute")
+@limiter.limit(default_rate_limit)
 def register(payload: Register, request: Request, svc: AuthService = Depends(get_auth_service)) -> User:
     try:
         user = svc.register(
@@ -44,10 +83,34 @@ def register(payload: Register, request: Request, svc: AuthService = Depends(get
     response_model=LoginOut,
     summary="Login and receive a JWT"
 )
-@limiter.limit(f"{_settings.LOGIN_RATE_LIMIT_PER_MIN}/minute")
+@limiter.limit(login_rate_limit)
 def login(payload: LoginIn, request: Request, svc: AuthService = Depends(get_auth_service)) -> LoginOut:
     try:
-        token, user = svc.login(email=payload.email, raw_password=payload.password)
-        return LoginOut(access_token=token, user=user)
+        access, refresh, user = svc.login(email=payload.email, raw_password=payload.password)
+        return LoginOut(access_token=access, refresh_token=refresh, user=user)
     except ValueError:
         raise HTTPException(status_code=401, detail="Incorrect credentials")
+
+
+@router.post(
+    "/refresh",
+    response_model=TokenPair,
+    summary="Exchange a refresh token for a new access/refresh pair (rotation)"
+)
+@limiter.limit(login_rate_limit)
+def refresh(payload: RefreshIn, request: Request, svc: AuthService = Depends(get_auth_service)) -> TokenPair:
+    try:
+        access, refresh_token = svc.refresh(refresh_token=payload.refresh_token)
+        return TokenPair(access_token=access, refresh_token=refresh_token)
+    except ValueError:
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+
+
+@router.post("/logout", status_code=204, summary="Revoke the current access token (and refresh token)")
+def logout(
+    payload: Optional[LogoutIn] = None,
+    claims: dict[str, Any] = Depends(get_current_claims),
+    svc: AuthService = Depends(get_auth_service),
+) -> Response:
+    svc.logout(access_claims=claims, refresh_token=payload.refresh_token if payload else None)
+    return Response(status_code=204)
@@ -1,20 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
-from app.core.rate_limit import limiter
+import hashlib
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from app.core.config import get_settings
+from app.core.rate_limit import limiter, default_rate_limit
 from app.schemas.calories import CaloriesIn, CaloriesEstimate
-from app.services.calorie_service import CalorieService
-from app.adapters.http.usda_client import get_usda_client, USDAError
+from app.services.calorie_service import CalorieService, canonical_dish_key
+from app.services.dish_suggestion_service import DishSuggester, get_dish_suggester
+from app.adapters.http.usda_client import USDAError
+from app.adapters.http.food_search_provider import get_food_search_client
+from app.adapters.http.admitted_search import AdmittedFoodSearchClient
+from app.core.admission import get_admission_controller
+from app.core.content_negotiation import (MSGPACK, encode, negotiated_body, openapi_body,
+                                          preferred_media_type, render)
 
 router = APIRouter()
-_settings = get_settings()
 
-def get_service() -> CalorieService:
-    return CalorieService(get_usda_client())
+def get_service(suggester: DishSuggester = Depends(get_dish_suggester)) -> CalorieService:
+    # interactive callers: cache misses go through admission control and may be shed (503),
+    # and resolved dishes feed autocomplete
+    return CalorieService(
+        AdmittedFoodSearchClient(get_food_search_client(), get_admission_controller()), suggester
+    )
 
 response_dict = {
-    200: {"description": "Calories calculated"},
+    200: {"description": "Calories calculated (JSON, or MessagePack via Accept)",
+          "content": {MSGPACK: {}}},
     404: {"description": "Dish not found"},
-    503: {"description": "USDA service unavailable"}
+    503: {"description": "USDA service unavailable or overloaded (see Retry-After)"}
 }
 
 @router.post(
@@ -22,13 +33,69 @@ response_dict = {
     response_model=CaloriesEstimate,
     summary="Estimate calories for a dish using USDA data",
     responses=response_dict,
+    openapi_extra=openapi_body(CaloriesIn),
 )
-@limiter.limit(f"{_settings.RATE_LIMIT_PER_MIN}/minute")
-async def get_calories(payload: CaloriesIn, request: Request, svc: CalorieService = Depends(get_service))->CaloriesEstimate:
+@limiter.limit(default_rate_limit)
+async def get_calories(
+    request: Request,
+    payload: CaloriesIn = Depends(negotiated_body(CaloriesIn)),
+    svc: CalorieService = Depends(get_service),
+) -> Response:
+    # body and response are JSON or MessagePack (Content-Type / Accept), same schemas either way
     try:
         result = await svc.calculate(dish_name=payload.dish_name, servings=payload.servings)
-        return result
+        return render(request, result)
     except LookupError:
         raise HTTPException(status_code=404, detail="Dish not found")
     except USDAError:
         raise HTTPException(status_code=503, detail="USDA service unavailable")
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    # If-None-Match uses weak comparison, so a W/ prefix on the client's copy still matches
+    if not if_none_match:
+        return False
+    candidates = [t.strip() for t in if_none_match.split(",")]
+    return "*" in candidates or any(t.removeprefix("W/") == etag for t in candidates)
+
+
+@router.get(
+    "/calories",
+    response_model=CaloriesEstimate,
+    summary="Cacheable calorie estimate (ETag + Cache-Control)",
+    responses={**response_dict, 304: {"description": "Not modified"}},
+)
+@limiter.limit(default_rate_limit)
+async def get_calories_cacheable(
+    request: Request,
+    dish: str = Query(..., min_length=1),
+    servings: float = Query(1.0, gt=0),
+    svc: CalorieService = Depends(get_service),
+) -> Response:
+    # answer for the canonical key so every spelling of a dish yields byte-identical bodies
+    dish_key = canonical_dish_key(dish)
+    if not dish_key:
+        raise HTTPException(status_code=404, detail="Dish not found")
+    try:
+        result = await svc.calculate(dish_name=dish_key, servings=servings)
+    except LookupError:
+        raise HTTPException(status_code=404, detail="Dish not found")
+    except USDAError:
+        raise HTTPException(status_code=503, detail="USDA service unavailable")
+
+    media_type = preferred_media_type(request.headers.get("accept"))
+    body = encode(result, media_type)
+    ttl = get_settings().CACHE_TTL_S
+    headers = {
+        "ETag": _etag(body),  # per representation: JSON and MessagePack bodies differ
+        "Vary": "Accept",
+        # the estimate can only change once the upstream cache entry expires
+        "Cache-Control": f"public, max-age={ttl}" if ttl > 0 else "no-cache",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, Query, Request
+from app.core.rate_limit import limiter, suggest_rate_limit
+from app.schemas.dishes import DishSuggestions
+from app.services.dish_suggestion_service import DishSuggester, get_dish_suggester
+
+router = APIRouter(prefix="/dishes", tags=["dishes"])
+
+
+@router.get(
+    "/suggest",
+    response_model=DishSuggestions,
+    summary="Autocomplete dish names from names already seen (never calls USDA)",
+)
+@limiter.limit(suggest_rate_limit)
+async def suggest_dishes(
+    request: Request,
+    prefix: str = Query(..., min_length=1, max_length=100),
+    limit: int | None = Query(default=None, ge=1, le=50, description="Capped at SUGGEST_MAX_RESULTS"),
+    suggester: DishSuggester = Depends(get_dish_suggester),
+) -> DishSuggestions:
+    return DishSuggestions(prefix=prefix, suggestions=suggester.suggest(prefix, limit))
@@ -0,0 +1,89 @@
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from app.core.rate_limit import limiter, default_rate_limit
+from app.core.content_negotiation import MSGPACK, MSGPACK_TYPES
+from app.adapters.http.food_search_provider import get_food_search_client
+from app.schemas.jobs import JobStatus
+from app.services.calorie_service import CalorieService
+from app.services.meal_log_job_service import (MealLogJob, MealLogJobService, TooManyActiveJobs,
+                                               UploadTooLarge, get_job_service)
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+UPLOAD_TYPES = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    **{media_type: "msgpack" for media_type in MSGPACK_TYPES},
+}
+RESULT_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv", "msgpack": MSGPACK}
+JOB_RETRY_AFTER_S = 30
+
+
+def get_bulk_service() -> CalorieService:
+    # background work queues on the USDA client instead of being shed by admission control;
+    # no suggester, so bulk rows never surface in other users' autocomplete
+    return CalorieService(get_food_search_client())
+
+
+def _get_job(job_id: str, jobs: MealLogJobService) -> MealLogJob:
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.post(
+    "/meal-logs",
+    response_model=JobStatus,
+    status_code=202,
+    summary="Upload a CSV, NDJSON or MessagePack meal log for bulk calorie estimation",
+    responses={
+        413: {"description": "Upload too large"},
+        415: {"description": "Unsupported upload content type"},
+        503: {"description": "Every retained job is still in progress (see Retry-After)"},
+    },
+)
+@limiter.limit(default_rate_limit)
+async def create_meal_log_job(
+    request: Request,
+    background: BackgroundTasks,
+    jobs: MealLogJobService = Depends(get_job_service),
+    svc: CalorieService = Depends(get_bulk_service),
+) -> JobStatus:
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    fmt = UPLOAD_TYPES.get(content_type)
+    if fmt is None:
+        raise HTTPException(status_code=415,
+                            detail="Use text/csv, application/x-ndjson or application/msgpack")
+    try:
+        job = await jobs.create(request.stream(), fmt)
+    except UploadTooLarge:
+        raise HTTPException(status_code=413, detail="Upload too large")
+    except TooManyActiveJobs:
+        raise HTTPException(status_code=503, detail="Too many jobs in progress, retry later",
+                            headers={"Retry-After": str(JOB_RETRY_AFTER_S)})
+    background.add_task(jobs.run, job, svc)
+    return job.status
+
+
+@router.get("/{job_id}", response_model=JobStatus, summary="Job status and progress")
+def get_job(job_id: str, jobs: MealLogJobService = Depends(get_job_service)) -> JobStatus:
+    return _get_job(job_id, jobs).status
+
+
+@router.get(
+    "/{job_id}/results",
+    summary="Stream per-row results as NDJSON, CSV or MessagePack",
+    responses={409: {"description": "Job not finished"}},
+)
+def get_job_results(
+    job_id: str,
+    format: str = Query(default="ndjson", pattern="^(ndjson|csv|msgpack)$"),
+    jobs: MealLogJobService = Depends(get_job_service),
+) -> StreamingResponse:
+    job = _get_job(job_id, jobs)
+    if job.status.status != "completed":
+        raise HTTPException(status_code=409, detail=f"Job is {job.status.status}")
+    return StreamingResponse(jobs.iter_results(job, format), media_type=RESULT_TYPES[format])
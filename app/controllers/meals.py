@@ -0,0 +1,119 @@
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.orm import Session
+from app.core.rate_limit import limiter, default_rate_limit
+from app.db.session import get_db
+from app.adapters.db.sqlalchemy_meal_repository import SqlAlchemyMealRepository
+from app.adapters.http.usda_client import USDAError
+from app.controllers.auth import get_current_user_id
+from app.controllers.calories import get_service
+from app.core.config import get_settings
+from app.schemas.meals import (MealEntry, MealEntryIn, MealEntryPage, DailySummary,
+                               WeeklySummary, MealEstimate, MealEstimateIn)
+from app.services.calorie_service import CalorieService
+from app.services.meal_estimate_service import MealEstimateService, TooManyItems
+from app.services.meal_service import MealService
+from app.utils.meal_text_parser import InvalidQuantity
+
+router = APIRouter(prefix="/meals", tags=["meals"])
+
+
+def get_meal_service(
+    db: Session = Depends(get_db), calories: CalorieService = Depends(get_service)
+) -> MealService:
+    return MealService(SqlAlchemyMealRepository(db), calories)
+
+
+def get_meal_estimate_service(
+    calories: CalorieService = Depends(get_service),
+) -> MealEstimateService:
+    return MealEstimateService(calories, max_items=get_settings().MEAL_ESTIMATE_MAX_ITEMS)
+
+
+@router.post(
+    "/estimate",
+    response_model=MealEstimate,
+    summary="Estimate a whole meal from free text (no login needed, nothing is logged)",
+    responses={
+        422: {"description": "Invalid input or too many items"},
+        503: {"description": "USDA service overloaded (see Retry-After)"},
+    },
+)
+@limiter.limit(default_rate_limit)
+async def estimate_meal(
+    payload: MealEstimateIn,
+    request: Request,
+    svc: MealEstimateService = Depends(get_meal_estimate_service),
+) -> MealEstimate:
+    # items that can't be resolved are reported per item rather than failing the meal
+    try:
+        return await svc.estimate(payload.text)
+    except (TooManyItems, InvalidQuantity) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@router.post(
+    "",
+    response_model=MealEntry,
+    status_code=201,
+    summary="Log a meal (calories estimated from USDA unless given)",
+    responses={404: {"description": "Dish not found"}, 503: {"description": "USDA service unavailable"}},
+)
+@limiter.limit(default_rate_limit)
+async def create_meal(
+    payload: MealEntryIn,
+    request: Request,
+    user_id: int = Depends(get_current_user_id),
+    svc: MealService = Depends(get_meal_service),
+) -> MealEntry:
+    try:
+        return await svc.log(user_id=user_id, payload=payload)
+    except LookupError:
+        raise HTTPException(status_code=404, detail="Dish not found")
+    except USDAError:
+        raise HTTPException(status_code=503, detail="USDA service unavailable")
+
+
+@router.get("", response_model=MealEntryPage, summary="List meals, newest first (keyset paginated)")
+def list_meals(
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = Query(default=None),
+    user_id: int = Depends(get_current_user_id),
+    svc: MealService = Depends(get_meal_service),
+) -> MealEntryPage:
+    try:
+        return svc.list(user_id=user_id, limit=limit, cursor=cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@router.delete("/{entry_id}", status_code=204, summary="Delete a meal entry")
+def delete_meal(
+    entry_id: int,
+    user_id: int = Depends(get_current_user_id),
+    svc: MealService = Depends(get_meal_service),
+) -> Response:
+    try:
+        svc.delete(user_id=user_id, entry_id=entry_id)
+    except LookupError:
+        raise HTTPException(status_code=404, detail="Meal entry not found")
+    return Response(status_code=204)
+
+
+@router.get("/summary/daily", response_model=DailySummary, summary="Calories for one day (UTC)")
+def daily_summary(
+    day: date = Query(...),
+    user_id: int = Depends(get_current_user_id),
+    svc: MealService = Depends(get_meal_service),
+) -> DailySummary:
+    return svc.daily(user_id=user_id, day=day)
+
+
+@router.get("/summary/weekly", response_model=WeeklySummary, summary="Calories for 7 days from start")
+def weekly_summary(
+    start: date = Query(...),
+    user_id: int = Depends(get_current_user_id),
+    svc: MealService = Depends(get_meal_service),
+) -> WeeklySummary:
+    return svc.weekly(user_id=user_id, start=start)
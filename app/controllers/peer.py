@@ -0,0 +1,50 @@
+import hmac
+from typing import Literal
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+from app.core.config import get_settings
+from app.core.rate_limit import limiter
+from app.core.admission import AdmissionController, get_admission_controller
+from app.core.quota import Priority, call_priority
+from app.adapters.http.usda_client import USDAError
+from app.adapters.http.peer_search import PeerFoodSearchClient
+from app.adapters.http.food_search_provider import get_food_search_client
+
+# Only mounted when PEER_CACHE_ENABLED; called by other API nodes, not by clients.
+router = APIRouter(prefix="/internal/peer", tags=["internal"], include_in_schema=False)
+
+
+def get_peer_client() -> PeerFoodSearchClient:
+    client = get_food_search_client()
+    if not isinstance(client, PeerFoodSearchClient):
+        raise HTTPException(status_code=404, detail="Peer cache disabled")
+    return client
+
+
+def require_peer_token(x_peer_token: str = Header(default="")) -> None:
+    expected = get_settings().PEER_TOKEN.get_secret_value()
+    if not expected or not hmac.compare_digest(x_peer_token.encode(), expected.encode()):
+        raise HTTPException(status_code=403, detail="Invalid peer token")
+
+
+@router.get("/search", dependencies=[Depends(require_peer_token)], response_model=None)
+@limiter.exempt
+async def peer_search(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    page_size: int | None = Query(default=None, ge=1, le=200),
+    priority: Literal["interactive", "background"] = Query(default="interactive"),
+    client: PeerFoodSearchClient = Depends(get_peer_client),
+    admission: AdmissionController = Depends(get_admission_controller),
+) -> JSONResponse:
+    # served as owner even if this node's ring disagrees, so requests never bounce between peers
+    try:
+        data = client.cached(q, page_size=page_size)
+        if data is None:
+            # misses spend this node's upstream capacity, so they queue or shed like local ones
+            async with admission.slot():
+                with call_priority(Priority[priority.upper()]):
+                    data = await client.fetch_as_owner(q, page_size=page_size)
+    except USDAError:
+        raise HTTPException(status_code=503, detail="USDA service unavailable")
+    return JSONResponse(content=data)  # upstream JSON as-is, no response-model pass
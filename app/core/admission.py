@@ -0,0 +1,90 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from app.core.config import get_settings
+
+
+class Overloaded(RuntimeError):
+    """Raised when a request is shed instead of queued; mapped to 503 + Retry-After."""
+
+    def __init__(self, retry_after_s: int):
+        super().__init__("Service overloaded")
+        self.retry_after_s = retry_after_s
+
+
+class AdmissionController:
+    """
+    Caps concurrent upstream work. Up to `max_in_flight` callers run at once, up to
+    `max_queue` more wait at most `queue_timeout_s` for a slot, and anyone beyond that is
+    rejected immediately with Overloaded.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_in_flight: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        queue_timeout_s: Optional[float] = None,
+        retry_after_s: Optional[int] = None,
+    ):
+        s = get_settings()
+        self._max_in_flight = s.ADMISSION_MAX_IN_FLIGHT if max_in_flight is None else max_in_flight
+        self._max_queue = s.ADMISSION_MAX_QUEUE if max_queue is None else max_queue
+        self._timeout = s.ADMISSION_QUEUE_TIMEOUT_S if queue_timeout_s is None else queue_timeout_s
+        self._retry_after = s.ADMISSION_RETRY_AFTER_S if retry_after_s is None else retry_after_s
+        self._sem = asyncio.Semaphore(max(1, self._max_in_flight))
+        self._in_flight = 0
+        self._waiting = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        if self._max_in_flight <= 0:  # disabled
+            yield
+            return
+
+        if self._sem.locked():
+            if self._waiting >= self._max_queue:
+                raise Overloaded(self._retry_after)
+            self._waiting += 1
+            try:
+                await asyncio.wait_for(self._sem.acquire(), self._timeout)
+            except asyncio.TimeoutError:
+                raise Overloaded(self._retry_after)
+            finally:
+                self._waiting -= 1
+        else:
+            await self._sem.acquire()
+
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._sem.release()
+
+
+async def overloaded_handler(request: Request, exc: Overloaded) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Service overloaded, retry later"},
+        headers={"Retry-After": str(exc.retry_after_s)},
+    )
+
+
+_singleton: Optional[AdmissionController] = None
+
+def get_admission_controller() -> AdmissionController:
+    global _singleton
+    if _singleton is None:
+        _singleton = AdmissionController()
+    return _singleton
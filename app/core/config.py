@@ -1,7 +1,7 @@
 from functools import lru_cache
-from typing import List
+from typing import List, Literal
 
-from pydantic import Field, SecretStr, field_validator
+from pydantic import Field, SecretStr, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -22,10 +22,17 @@ class Settings(BaseSettings):
     JWT_SECRET: SecretStr = Field(..., description="Secret for signing JWTs")
     JWT_ALGO: str = Field(default="HS256", description="JWT signing algorithm")
     JWT_EXPIRES_MIN: int = Field(default=60, ge=5, le=24 * 60, description="Access token expiry in minutes")
+    JWT_REFRESH_EXPIRES_DAYS: int = Field(default=14, ge=1, le=90, description="Refresh token expiry in days")
+
+    # --- Token revocation ---
+    REVOCATION_SYNC_S: float = Field(default=5.0, ge=0, le=300, description="Seconds between revocation syncs")
+    REVOCATION_FILTER_CAPACITY: int = Field(default=100_000, ge=100, description="Revoked ids per Bloom filter")
+    REVOCATION_FILTER_ERROR_RATE: float = Field(default=0.001, gt=0, lt=0.5, description="Bloom false-positive rate")
 
     # --- Rate limiting ---
     RATE_LIMIT_PER_MIN: int = Field(default=60, ge=1, description="Default requests/min per IP")
     LOGIN_RATE_LIMIT_PER_MIN: int = Field(default=20, ge=1, description="Requests/min for /auth/login")
+    SUGGEST_RATE_LIMIT_PER_MIN: int = Field(default=600, ge=1, description="Requests/min for /dishes/suggest (per keystroke)")
 
     # --- USDA API ---
     USDA_BASE_URL: str = Field(
@@ -33,16 +40,83 @@ class Settings(BaseSettings):
         description="USDA FoodData Central search endpoint",
     )
     USDA_API_KEY: SecretStr = Field(..., description="USDA API key")
+    USDA_FOODS_URL: str = Field(
+        default="https://api.nal.usda.gov/fdc/v1/foods",
+        description="USDA FoodData Central multi-id food details endpoint",
+    )
     USDA_PAGE_SIZE: int = Field(default=25, ge=1, le=200, description="Default page size for USDA search")
     USDA_TIMEOUT_S: float = Field(default=10.0, ge=1.0, le=60.0, description="HTTP timeout seconds")
     USDA_RETRIES: int = Field(default=3, ge=0, le=10, description="Max HTTP retries for USDA")
 
+    # --- USDA quota governor (client-side token bucket) ---
+    USDA_QUOTA_PER_HOUR: int = Field(default=1000, ge=0, description="Requests/hour for the API key; 0 disables")
+    USDA_QUOTA_BACKGROUND_RESERVE: float = Field(
+        default=0.2, ge=0, lt=1, description="Fraction of quota background calls may not use"
+    )
+    USDA_QUOTA_MAX_WAIT_S: float = Field(default=2.0, ge=0, le=60, description="Interactive wait before 503")
+
+    # --- Record / replay of food search (load tests, offline staging) ---
+    FOOD_SEARCH_MODE: Literal["live", "record", "replay", "local"] = Field(
+        default="live",
+        description="live: USDA; record: USDA + save responses; replay: saved responses; local: catalog snapshot",
+    )
+    FOOD_CATALOG_DIR: str = Field(default="", description="Local catalog snapshot directory (local mode)")
+    FOOD_SEARCH_RECORDING_PATH: str = Field(
+        default="food_search_recording.ndjson.gz", description="Recording file (.gz = gzip)"
+    )
+    REPLAY_LATENCY_MS: float = Field(default=0.0, ge=0, le=60_000, description="Fixed latency per replayed search")
+    REPLAY_USE_RECORDED_LATENCY: bool = Field(default=False, description="Replay with the latency seen when recording")
+    REPLAY_STRICT: bool = Field(default=False, description="Unrecorded query -> 503 instead of no results")
+
+    # --- Admission control (USDA cache misses on interactive routes) ---
+    ADMISSION_MAX_IN_FLIGHT: int = Field(default=32, ge=0, description="Concurrent upstream lookups; 0 disables")
+    ADMISSION_MAX_QUEUE: int = Field(default=64, ge=0, description="Lookups allowed to wait for a slot")
+    ADMISSION_QUEUE_TIMEOUT_S: float = Field(default=2.0, gt=0, le=30, description="Max wait for a slot")
+    ADMISSION_RETRY_AFTER_S: int = Field(default=2, ge=1, le=300, description="Retry-After sent when shedding")
+
+    # --- Peer cache (share USDA results across API nodes; live mode only) ---
+    PEER_CACHE_ENABLED: bool = Field(default=False, description="Route cache misses to the key's owner node")
+    PEER_SELF_URL: str = Field(default="", description="This node's base URL as listed in PEER_URLS")
+    PEER_URLS: str = Field(default="", description="Comma-separated base URLs of all nodes (including self)")
+    PEER_TOKEN: SecretStr = Field(default=SecretStr(""), description="Shared secret for the internal peer endpoint")
+    PEER_TIMEOUT_S: float = Field(default=1.0, gt=0, le=30, description="Timeout for a peer request")
+    PEER_VNODES: int = Field(default=64, ge=1, le=1024, description="Ring points per node")
+    PEER_HOT_CACHE_MAXSIZE: int = Field(default=128, ge=1, le=10000, description="Peer answers kept locally")
+
     # --- Caching (for USDA search) ---
     CACHE_TTL_S: int = Field(default=600, ge=0, le=24 * 3600, description="TTL seconds; 0 disables caching")
     CACHE_MAXSIZE: int = Field(default=512, ge=1, le=10000, description="Max entries in cache")
+    DETAILS_CACHE_MAXSIZE: int = Field(default=2048, ge=1, le=100_000, description="Max food details cached by FDC id")
 
     # --- Fuzzy matching ---
     FUZZ_THRESHOLD: int = Field(default=55, ge=0, le=100, description="Minimum score to accept a match")
+    DETAILS_FALLBACK_CANDIDATES: int = Field(
+        default=5, ge=0, le=20, description="Top hits fetched from /foods when the best lacks energy; 0 disables"
+    )
+
+    # --- Spell correction (query typos) ---
+    SPELL_CORRECTION_ENABLED: bool = Field(default=True, description="Correct query typos before matching")
+    SPELL_INDEX_PATH: str = Field(
+        default="",
+        description="Spell index (JSON) built from USDA descriptions; empty disables correction",
+    )
+    SPELL_MAX_EDIT_DISTANCE: int = Field(default=2, ge=1, le=3, description="Max edits when building an index")
+
+    # --- Dish-name autocomplete ---
+    SUGGEST_MAX_TERMS: int = Field(default=50_000, ge=100, description="Max names held in the suggestion trie")
+    SUGGEST_MAX_RESULTS: int = Field(default=10, ge=1, le=50, description="Max suggestions per prefix")
+    SUGGEST_MIN_QUERY_COUNT: int = Field(
+        default=3, ge=1, le=1000, description="Resolutions before a user query is suggested to others"
+    )
+
+    # --- Free-text meal estimates ---
+    MEAL_ESTIMATE_MAX_ITEMS: int = Field(default=20, ge=1, le=100, description="Max items parsed per meal")
+
+    # --- Bulk meal-log jobs ---
+    BULK_JOB_CONCURRENCY: int = Field(default=8, ge=1, le=64, description="Dishes resolved in parallel per job")
+    BULK_JOB_DIR: str = Field(default="", description="Spool directory for uploads/results; empty uses temp dir")
+    BULK_JOB_MAX_RETAINED: int = Field(default=100, ge=1, description="Jobs kept; the oldest finished one is purged, or uploads get 503")
+    BULK_JOB_MAX_UPLOAD_MB: int = Field(default=200, ge=1, description="Max upload size per job in MB")
 
     # --- CORS ---
     CORS_ORIGINS: str = Field(
@@ -51,6 +125,15 @@ class Settings(BaseSettings):
     )
     CORS_ALLOW_CREDENTIALS: bool = Field(default=True, description="Whether to allow cookies/credentials")
 
+    # --- Request profiling (middleware is only installed when enabled) ---
+    PROFILING_ENABLED: bool = Field(default=False, description="Install the request profiling middleware")
+    PROFILING_TOKEN: SecretStr = Field(
+        default=SecretStr(""), description="X-Profile-Token value that profiles a request on demand"
+    )
+    PROFILING_SAMPLE_EVERY_N: int = Field(default=0, ge=0, description="Profile 1 in N requests; 0 disables")
+    PROFILING_DIR: str = Field(default="", description="Where 1-in-N profiles go; empty disables sampling")
+    PROFILING_INTERVAL_MS: float = Field(default=1.0, ge=0.1, le=100, description="Stack sampling interval")
+
     # --- Feature flags ---
     QUERY_LOG_ENABLED: bool = Field(default=False, description="Persist successful calorie queries (if model present)")
 
@@ -67,6 +150,17 @@ class Settings(BaseSettings):
             return []
         return [o.strip() for o in self.CORS_ORIGINS.split(",") if o.strip()]
 
+    @property
+    def peer_urls_list(self) -> List[str]:
+        return [u.strip().rstrip("/") for u in self.PEER_URLS.split(",") if u.strip()]
+
+    @model_validator(mode="after")
+    def _peer_cache_needs_token(self) -> "Settings":
+        # without a token every peer call is refused with 403 and silently falls back upstream
+        if self.PEER_CACHE_ENABLED and not self.PEER_TOKEN.get_secret_value():
+            raise ValueError("PEER_CACHE_ENABLED requires a non-empty PEER_TOKEN")
+        return self
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -0,0 +1,87 @@
+from typing import Any, Awaitable, Callable, Dict, Optional, Type, TypeVar
+import msgpack
+from fastapi import HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+MSGPACK_TYPES = frozenset({MSGPACK, "application/x-msgpack", "application/vnd.msgpack"})
+_JSON_TYPES = frozenset({JSON, "application/*", "*/*"})
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def _media_type(header: Optional[str]) -> str:
+    return (header or "").split(";")[0].strip().lower()
+
+
+def is_msgpack(content_type: Optional[str]) -> bool:
+    return _media_type(content_type) in MSGPACK_TYPES
+
+
+def preferred_media_type(accept: Optional[str]) -> str:
+    """MessagePack when Accept names it with a q at least as high as JSON's; JSON otherwise."""
+    if not accept:
+        return JSON
+    q_json = q_msgpack = 0.0
+    for part in accept.split(","):
+        media, *params = part.split(";")
+        q = 1.0
+        for p in params:
+            name, _, value = p.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        media = media.strip().lower()
+        if media in MSGPACK_TYPES:
+            q_msgpack = max(q_msgpack, q)
+        elif media in _JSON_TYPES:
+            q_json = max(q_json, q)
+    return MSGPACK if q_msgpack > 0 and q_msgpack >= q_json else JSON
+
+
+def encode(model: BaseModel, media_type: str) -> bytes:
+    if media_type == MSGPACK:
+        return msgpack.packb(model.model_dump(mode="json"))
+    return model.model_dump_json().encode()
+
+
+def render(request: Request, model: BaseModel, *, status_code: int = 200,
+           headers: Optional[Dict[str, str]] = None) -> Response:
+    """Serialize `model` in the format the client's Accept header prefers."""
+    media_type = preferred_media_type(request.headers.get("accept"))
+    return Response(content=encode(model, media_type), status_code=status_code,
+                    media_type=media_type, headers={"Vary": "Accept", **(headers or {})})
+
+
+def negotiated_body(model: Type[M]) -> Callable[[Request], Awaitable[M]]:
+    """
+    Dependency that parses the request body as `model` from MessagePack (by Content-Type) or
+    JSON (anything else), with the same validation and 422 errors for both.
+    """
+
+    async def _parse(request: Request) -> M:
+        body = await request.body()
+        try:
+            if is_msgpack(request.headers.get("content-type")):
+                return model.model_validate(msgpack.unpackb(body, raw=False))
+            return model.model_validate_json(body)
+        except ValidationError as e:
+            # no "input": a MessagePack bin value is raw bytes, which the JSON 422 can't carry
+            errors = e.errors(include_url=False, include_context=False, include_input=False)
+            raise RequestValidationError([{**err, "loc": ("body", *err["loc"])} for err in errors])
+        except (ValueError, TypeError, msgpack.UnpackException):  # ExtraData, FormatError, ...
+            raise HTTPException(status_code=400, detail="Malformed MessagePack body")
+
+    return _parse
+
+
+def openapi_body(model: Type[BaseModel]) -> Dict[str, Any]:
+    """`openapi_extra` documenting a body accepted as JSON or MessagePack."""
+    schema = model.model_json_schema()
+    return {"requestBody": {"required": True, "content": {
+        JSON: {"schema": schema}, MSGPACK: {"schema": schema},
+    }}}
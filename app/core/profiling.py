@@ -0,0 +1,182 @@
+import asyncio
+import hmac
+import json
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+PROFILE_HEADER = b"x-profile-token"
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+class SamplingProfiler:
+    """
+    Samples one thread's Python stack on a timer from a background thread. Pointed at the
+    event-loop thread it captures async handlers (CalorieService.calculate, USDAClient.search)
+    while they run; time spent awaiting I/O shows up as the loop's selector.
+
+    The stack is the thread's, not a request's: other requests running on the same loop land
+    in the same profile, and work handed to other threads (sync endpoints in the threadpool,
+    asyncio.to_thread) is not seen at all.
+    """
+
+    def __init__(self, thread_id: int, interval_s: float = 0.001):
+        self._thread_id = thread_id
+        self._interval = interval_s
+        self._frame_index: Dict[Tuple[str, str, int], int] = {}
+        self._frames: List[Dict[str, Any]] = []
+        self._samples: List[List[int]] = []
+        self._weights: List[float] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._duration = 0.0
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._duration = time.perf_counter() - self._started
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while not self._stop.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            now = time.perf_counter()
+            if frame is not None:
+                self._record(frame, now - last)
+            last = now
+
+    def _record(self, frame: Any, weight: float) -> None:
+        stack: List[int] = []
+        while frame is not None:
+            code = frame.f_code
+            key = (code.co_name, code.co_filename, code.co_firstlineno)
+            idx = self._frame_index.get(key)
+            if idx is None:
+                idx = self._frame_index[key] = len(self._frames)
+                self._frames.append({"name": key[0], "file": key[1], "line": key[2]})
+            stack.append(idx)
+            frame = frame.f_back
+        stack.reverse()  # speedscope wants root first
+        self._samples.append(stack)
+        self._weights.append(weight)
+
+    @property
+    def sample_count(self) -> int:
+        return len(self._samples)
+
+    def to_speedscope(self, name: str) -> Dict[str, Any]:
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "meal-calorie-api",
+            "shared": {"frames": self._frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": self._duration,
+                "samples": self._samples,
+                "weights": self._weights,
+            }],
+        }
+
+
+class ProfilingMiddleware:
+    """
+    Opt-in request profiler (only installed when PROFILING_ENABLED).
+
+    * A request carrying `X-Profile-Token: <PROFILING_TOKEN>` is profiled and its response
+      body is replaced by speedscope JSON; the handler's status goes in `X-Profiled-Status`.
+    * With `sample_every_n` > 0 and an `out_dir`, every Nth request is profiled in the
+      background and the profile written there; the client sees the normal response.
+    Other requests pass straight through. Profiles cover the event-loop thread for the span of
+    the request (see SamplingProfiler), so concurrent requests bleed in and sync endpoints,
+    which run in the threadpool, show up only as the loop waiting.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        token: str = "",
+        sample_every_n: int = 0,
+        out_dir: str = "",
+        interval_s: float = 0.001,
+    ):
+        self.app = app
+        self._token = token.encode()
+        self._out_dir = Path(out_dir) if out_dir else None
+        # a 1-in-N profile with nowhere to go would only cost the request its sampling overhead
+        self._every_n = sample_every_n if self._out_dir is not None else 0
+        self._interval = interval_s
+        self._counter = 0
+        if self._out_dir is not None:
+            self._out_dir.mkdir(parents=True, exist_ok=True)
+
+    def _authorized(self, scope: Scope) -> bool:
+        if not self._token:
+            return False
+        for k, v in scope["headers"]:
+            if k == PROFILE_HEADER:
+                return hmac.compare_digest(v, self._token)
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        on_demand = self._authorized(scope)
+        sampled = False
+        if not on_demand and self._every_n:
+            self._counter += 1
+            sampled = self._counter % self._every_n == 0
+        if not (on_demand or sampled):
+            await self.app(scope, receive, send)
+            return
+
+        status: Optional[int] = None
+
+        async def capture(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            # on-demand: swallow the handler's response, the profile is sent instead
+            if not on_demand:
+                await send(message)
+
+        profile_id = uuid.uuid4().hex[:12]
+        name = f"{scope['method']} {scope['path']} ({profile_id})"
+        profiler = SamplingProfiler(threading.get_ident(), self._interval)
+        profiler.start()
+        try:
+            await self.app(scope, receive, capture)
+        finally:
+            profiler.stop()
+            body = json.dumps(profiler.to_speedscope(name)).encode()
+            if self._out_dir is not None:
+                path = self._out_dir / f"profile-{profile_id}.speedscope.json"
+                await asyncio.to_thread(path.write_bytes, body)
+
+        if on_demand:
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"content-disposition",
+                     f'attachment; filename="profile-{profile_id}.speedscope.json"'.encode()),
+                    (b"x-profiled-status", str(status or 500).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
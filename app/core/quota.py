@@ -0,0 +1,153 @@
+import asyncio
+import contextvars
+import math
+import time
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Callable, Iterator, Mapping, Optional
+from app.core.admission import Overloaded
+from app.core.config import get_settings
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+# Priority of the upstream calls made by the current task; request handlers are interactive.
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "usda_call_priority", default=Priority.INTERACTIVE
+)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+@contextmanager
+def call_priority(priority: Priority) -> Iterator[None]:
+    """Run the enclosed upstream calls (in this task) at `priority`."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> Optional[int]:
+    value = headers.get(name)
+    try:
+        return int(float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+class QuotaGovernor:
+    """
+    Client-side token bucket for the USDA hourly quota.
+
+    The bucket refills at `per_hour / 3600` tokens per second. USDA's X-RateLimit-Limit and
+    X-RateLimit-Remaining response headers, when present, overwrite the local estimate, and a
+    429 empties it until Retry-After has passed. The last `background_reserve` fraction of the
+    quota is for interactive calls: background calls wait while the bucket is below it, or
+    while any interactive call is waiting. Interactive calls wait at most `max_wait_s` and are
+    then shed with Overloaded (503 + Retry-After) instead of spending retries on 429s.
+    """
+
+    def __init__(
+        self,
+        *,
+        per_hour: Optional[int] = None,
+        background_reserve: Optional[float] = None,
+        max_wait_s: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        s = get_settings()
+        self._capacity = float(s.USDA_QUOTA_PER_HOUR if per_hour is None else per_hour)
+        self._reserve = s.USDA_QUOTA_BACKGROUND_RESERVE if background_reserve is None else background_reserve
+        self._max_wait = s.USDA_QUOTA_MAX_WAIT_S if max_wait_s is None else max_wait_s
+        self._clock = clock
+        self._tokens = self._capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._interactive_waiting = 0
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    @property
+    def _rate(self) -> float:
+        return self._capacity / 3600.0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def _floor(self, priority: Priority) -> float:
+        return self._capacity * self._reserve if priority is Priority.BACKGROUND else 0.0
+
+    def _delay(self, priority: Priority) -> float:
+        """Seconds until a token above this priority's floor is available (0 = now)."""
+        self._refill()
+        blocked = max(0.0, self._blocked_until - self._clock())
+        missing = self._floor(priority) + 1.0 - self._tokens
+        if missing <= 0:
+            return blocked
+        return max(blocked, missing / self._rate if self._rate > 0 else math.inf)
+
+    async def acquire(self, priority: Optional[Priority] = None) -> None:
+        priority = current_priority() if priority is None else priority
+        if priority is Priority.INTERACTIVE:
+            await self._acquire_interactive()
+            return
+        while True:
+            delay = self._delay(priority)
+            if delay == 0 and self._interactive_waiting == 0:
+                self._tokens -= 1
+                return
+            await asyncio.sleep(min(delay or 0.05, 5.0))  # re-check: headers may refill sooner
+
+    async def _acquire_interactive(self) -> None:
+        delay = self._delay(Priority.INTERACTIVE)
+        if delay > self._max_wait:
+            raise Overloaded(max(1, math.ceil(min(delay, 3600))))
+        self._interactive_waiting += 1
+        try:
+            while delay > 0:
+                await asyncio.sleep(delay)
+                delay = self._delay(Priority.INTERACTIVE)
+        finally:
+            self._interactive_waiting -= 1
+        self._tokens -= 1
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Sync the bucket with USDA's rate-limit headers (api.data.gov sends them)."""
+        if not hasattr(headers, "multi_items"):  # plain mapping: match names case-insensitively
+            headers = {k.lower(): v for k, v in headers.items()}
+        limit = _header_int(headers, "x-ratelimit-limit")
+        remaining = _header_int(headers, "x-ratelimit-remaining")
+        self._refill()
+        if limit is not None and limit > 0:
+            self._capacity = float(limit)
+        if remaining is not None:
+            self._tokens = float(min(remaining, self._capacity))
+
+    def throttled(self, retry_after_s: Optional[float] = None) -> None:
+        """Upstream answered 429: nothing left until Retry-After (or one token's refill)."""
+        self._refill()
+        self._tokens = 0.0
+        wait = retry_after_s if retry_after_s is not None else (1.0 / self._rate if self._rate else 60.0)
+        self._blocked_until = max(self._blocked_until, self._clock() + wait)
+
+
+_singleton: Optional[QuotaGovernor] = None
+
+def get_quota_governor() -> Optional[QuotaGovernor]:
+    """The process-wide governor, or None when USDA_QUOTA_PER_HOUR is 0."""
+    global _singleton
+    if _singleton is None and get_settings().USDA_QUOTA_PER_HOUR > 0:
+        _singleton = QuotaGovernor()
+    return _singleton
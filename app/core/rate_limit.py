@@ -3,8 +3,21 @@ from slowapi.util import get_remote_address
 
 from app.core.config import get_settings
 
-_settings = get_settings()
+
+# Limits are callables so settings are read per request rather than at import time.
+def default_rate_limit() -> str:
+    return f"{get_settings().RATE_LIMIT_PER_MIN}/minute"
+
+
+def login_rate_limit() -> str:
+    return f"{get_settings().LOGIN_RATE_LIMIT_PER_MIN}/minute"
+
+
+def suggest_rate_limit() -> str:
+    return f"{get_settings().SUGGEST_RATE_LIMIT_PER_MIN}/minute"
+
+
 limiter = Limiter(
     key_func=get_remote_address,
-    default_limits=[f"{_settings.RATE_LIMIT_PER_MIN}/minute"],
+    default_limits=[default_rate_limit],
 )
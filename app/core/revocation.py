@@ -0,0 +1,87 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+from app.core.config import get_settings
+from app.ports.revoked_token_repository import RevokedTokenRepository
+from app.utils.bloom_filter import BloomFilter
+
+# Re-read this much history on each incremental sync: rows from transactions that committed
+# late can carry a revoked_at slightly older than the watermark. Re-adding is harmless.
+SYNC_GRACE = timedelta(seconds=60)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _as_utc(ts: datetime) -> datetime:
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts.astimezone(timezone.utc)
+
+
+class RevocationList:
+    """
+    Per-worker view of revoked token ids. A Bloom filter answers "definitely not revoked" in
+    memory; only a possible match is confirmed against the database. The filter is synced
+    incrementally from the revocation table at most every `sync_interval_s` seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        capacity: Optional[int] = None,
+        error_rate: Optional[float] = None,
+        sync_interval_s: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        s = get_settings()
+        self._capacity = int(capacity or s.REVOCATION_FILTER_CAPACITY)
+        self._error_rate = float(error_rate or s.REVOCATION_FILTER_ERROR_RATE)
+        self._interval = s.REVOCATION_SYNC_S if sync_interval_s is None else sync_interval_s
+        self._clock = clock
+        self._filter = BloomFilter(self._capacity, self._error_rate)
+        self._watermark: Optional[datetime] = None
+        self._synced_at: Optional[float] = None
+        self._lock = threading.Lock()  # sync routes run in the threadpool
+
+    def sync(self, repo: RevokedTokenRepository, *, force: bool = False) -> None:
+        now = self._clock()
+        if not force and self._synced_at is not None and now - self._synced_at < self._interval:
+            return
+        with self._lock:
+            if not force and self._synced_at is not None and now - self._synced_at < self._interval:
+                return
+            utc_now = datetime.now(timezone.utc)
+            if self._watermark is None or len(self._filter) > self._capacity:
+                # first load, or the filter is saturated: rebuild from unexpired rows only
+                self._filter = BloomFilter(self._capacity, self._error_rate)
+                since = _EPOCH
+            else:
+                since = self._watermark - SYNC_GRACE
+            watermark = self._watermark or _EPOCH
+            for jti, revoked_at in repo.revoked_since(since, utc_now):
+                if jti not in self._filter:  # keeps the count honest across grace re-reads
+                    self._filter.add(jti)
+                watermark = max(watermark, _as_utc(revoked_at))
+            self._watermark = watermark
+            self._synced_at = now
+
+    def is_revoked(self, jti: str, repo: RevokedTokenRepository) -> bool:
+        self.sync(repo)
+        if jti not in self._filter:
+            return False
+        return repo.is_revoked(jti)  # possible match (or false positive): ask the table
+
+    def revoke(self, jti: str, token_type: str, expires_at: datetime,
+               repo: RevokedTokenRepository) -> bool:
+        """Record a revocation and make it visible in this worker immediately."""
+        added = repo.add(jti, token_type, expires_at)
+        if jti not in self._filter:
+            self._filter.add(jti)
+        return added
+
+
+_singleton: Optional[RevocationList] = None
+
+def get_revocation_list() -> RevocationList:
+    global _singleton
+    if _singleton is None:
+        _singleton = RevocationList()
+    return _singleton
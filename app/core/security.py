@@ -1,4 +1,5 @@
 import jwt
+import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Mapping, Any
 from passlib.context import CryptContext
@@ -18,23 +19,63 @@ def verify_password(password: str, password_hash: str) -> bool:
     return _pwd.verify(password, password_hash)
 
 
-def create_access_token(
-    subject: str,
-    *,
-    minutes: Optional[int] = None,
-    extra: Optional[Mapping[str, Any]] = None,
-) -> str:
-    """Create a signed JWT for the subject"""
+def _encode(subject: str, token_type: str, ttl: timedelta,
+            extra: Optional[Mapping[str, Any]] = None) -> str:
     s = get_settings()
-    exp_minutes = minutes or s.JWT_EXPIRES_MIN
-
     now = datetime.now(timezone.utc)
     payload: dict[str, Any] = {
         "sub": subject,
         "iat": int(now.timestamp()),
-        "exp": int((now + timedelta(minutes=exp_minutes)).timestamp()),
+        "exp": int((now + ttl).timestamp()),
+        "jti": uuid.uuid4().hex,  # lets a single token be revoked
+        "type": token_type,
     }
     if extra:
         payload.update(extra)
 
     return jwt.encode(payload, s.JWT_SECRET.get_secret_value(), algorithm=s.JWT_ALGO)
+
+
+def _decode(token: str, token_type: str) -> dict[str, Any]:
+    s = get_settings()
+    claims = jwt.decode(
+        token,
+        s.JWT_SECRET.get_secret_value(),
+        algorithms=[s.JWT_ALGO],
+        options={"require": ["sub", "exp", "jti", "type"]},
+    )
+    if claims["type"] != token_type:
+        raise jwt.InvalidTokenError(f"Expected a {token_type} token")
+    return claims
+
+
+def create_access_token(
+    subject: str,
+    *,
+    minutes: Optional[int] = None,
+    extra: Optional[Mapping[str, Any]] = None,
+) -> str:
+    """Create a signed JWT for the subject"""
+    exp_minutes = minutes or get_settings().JWT_EXPIRES_MIN
+    return _encode(subject, "access", timedelta(minutes=exp_minutes), extra)
+
+
+def create_refresh_token(
+    subject: str,
+    *,
+    days: Optional[int] = None,
+    extra: Optional[Mapping[str, Any]] = None,
+) -> str:
+    """Create a long-lived refresh token; each one is single-use (rotated on refresh)."""
+    exp_days = days or get_settings().JWT_REFRESH_EXPIRES_DAYS
+    return _encode(subject, "refresh", timedelta(days=exp_days), extra)
+
+
+def decode_access_token(token: str) -> dict[str, Any]:
+    """Verify signature/expiry and return the claims; raises jwt.PyJWTError when invalid."""
+    return _decode(token, "access")
+
+
+def decode_refresh_token(token: str) -> dict[str, Any]:
+    """Like decode_access_token, but only accepts refresh tokens."""
+    return _decode(token, "refresh")
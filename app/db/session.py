@@ -1,20 +1,32 @@
+from functools import lru_cache
 from typing import Generator
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 from app.core.config import get_settings
 
-settings = get_settings()
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True
-)
+@lru_cache
+def get_engine() -> Engine:
+    """Create the engine on first use so importing the app never touches the DB driver."""
+    return create_engine(get_settings().DATABASE_URL, pool_pre_ping=True)
 
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+
+@lru_cache
+def get_sessionmaker() -> sessionmaker[Session]:
+    return sessionmaker(bind=get_engine(), autoflush=False, autocommit=False, expire_on_commit=False)
+
+
+def dispose_engine() -> None:
+    """Close pooled connections (app shutdown); the next use builds a fresh engine."""
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
+    get_sessionmaker.cache_clear()
+    get_engine.cache_clear()
 
 
 def get_db() -> Generator[Session, None, None]:
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         yield db
         db.commit()
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi.errors import RateLimitExceeded
@@ -6,17 +7,40 @@ from slowapi import _rate_limit_exceeded_handler
 
 from app.core.config import get_settings
 from app.core.rate_limit import limiter
+from app.core.admission import Overloaded, overloaded_handler
+from app.core.profiling import ProfilingMiddleware
+from app.db.session import get_engine, dispose_engine
+from app.adapters.http.food_search_provider import get_food_search_client, close_food_search_client
+from app.utils.spell_correction import get_spell_index
+from app.services.dish_suggestion_service import get_dish_suggester
 from app.controllers.health import router as health_router
 from app.controllers.calories import router as calories_router
 from app.controllers.auth import router as auth_router
+from app.controllers.jobs import router as jobs_router
+from app.controllers.meals import router as meals_router
+from app.controllers.dishes import router as dishes_router
+from app.controllers.peer import router as peer_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build heavy subsystems here rather than at import so workers boot (and tests collect) fast.
+    get_engine()
+    get_food_search_client()
+    get_spell_index()
+    get_dish_suggester()
+    yield
+    await close_food_search_client()
+    dispose_engine()
 
-settings = get_settings()
 
 def create_app() -> FastAPI:
+    settings = get_settings()
     app = FastAPI(
         title=settings.APP_NAME,
         version="0.1.0",
         description="Meal Calorie Count API — USDA-backed calorie estimates",
+        lifespan=lifespan,
     )
 
     # CORS
@@ -33,10 +57,28 @@ def create_app() -> FastAPI:
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
     app.add_middleware(SlowAPIMiddleware)
 
+    # Load shedding (admission control on upstream cache misses)
+    app.add_exception_handler(Overloaded, overloaded_handler)
+
+    # Profiling: not installed at all unless enabled, so normal requests pay nothing
+    if settings.PROFILING_ENABLED:
+        app.add_middleware(
+            ProfilingMiddleware,
+            token=settings.PROFILING_TOKEN.get_secret_value(),
+            sample_every_n=settings.PROFILING_SAMPLE_EVERY_N,
+            out_dir=settings.PROFILING_DIR,
+            interval_s=settings.PROFILING_INTERVAL_MS / 1000.0,
+        )
+
     # Controllers
     app.include_router(health_router)
     app.include_router(auth_router)
     app.include_router(calories_router)
+    app.include_router(jobs_router)
+    app.include_router(meals_router)
+    app.include_router(dishes_router)
+    if settings.PEER_CACHE_ENABLED:
+        app.include_router(peer_router)
 
     return app
 
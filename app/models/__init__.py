@@ -1 +1,3 @@
-from .user import User
\ No newline at end of file
+from .user import User
+from .meal import MealEntry, DailyCalorieTotal
+from .revoked_token import RevokedToken
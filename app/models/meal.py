@@ -0,0 +1,36 @@
+from datetime import date, datetime
+from sqlalchemy import Date, DateTime, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+
+class MealEntry(Base):
+    __tablename__ = "meal_entries"
+    __table_args__ = (
+        # keyset pagination walks (user_id, eaten_at, id) newest-first
+        Index("ix_meal_entries_user_eaten_id", "user_id", "eaten_at", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    dish_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    servings: Mapped[float] = mapped_column(Float, nullable=False)
+    total_calories: Mapped[float] = mapped_column(Float, nullable=False)
+    eaten_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+class DailyCalorieTotal(Base):
+    """Per-user running totals, updated in the same transaction as every meal entry write."""
+
+    __tablename__ = "daily_calorie_totals"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    total_calories: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    entry_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -1,4 +1,4 @@
-from typing import Protocol, Mapping, Any, Optional
+from typing import Protocol, Mapping, Any, Optional, Dict, Sequence
 
 
 class FoodSearchClient(Protocol):
@@ -7,3 +7,11 @@ class FoodSearchClient(Protocol):
     async def search(self, query: str, *, page_size: Optional[int] = None) -> Mapping[str, Any]:
         """Return a JSON-like mapping containing provider results."""
         pass
+
+
+class FoodDetailsClient(Protocol):
+    """Optional capability: full food records by FDC id (providers without it simply lack it)."""
+
+    async def foods(self, fdc_ids: Sequence[int]) -> Dict[int, Mapping[str, Any]]:
+        """Return details for the ids the provider knows, keyed by FDC id."""
+        pass
@@ -0,0 +1,23 @@
+from datetime import date, datetime
+from typing import Protocol, Optional, Sequence
+from app.models.meal import MealEntry, DailyCalorieTotal
+
+class MealRepository(Protocol):
+    """Repository interface for meal diary entries and their daily totals."""
+
+    def add(self, user_id: int, dish_name: str, servings: float, total_calories: float,
+            eaten_at: datetime) -> MealEntry:
+        pass
+
+    def get(self, user_id: int, entry_id: int) -> MealEntry | None:
+        pass
+
+    def delete(self, entry: MealEntry) -> None:
+        pass
+
+    def list_page(self, user_id: int, *, limit: int,
+                  before: Optional[tuple[datetime, int]] = None) -> Sequence[MealEntry]:
+        pass
+
+    def daily_totals(self, user_id: int, start: date, end: date) -> Sequence[DailyCalorieTotal]:
+        pass
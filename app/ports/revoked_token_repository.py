@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Protocol, Sequence, Tuple
+
+class RevokedTokenRepository(Protocol):
+    """Repository interface for the token revocation list."""
+
+    def add(self, jti: str, token_type: str, expires_at: datetime) -> bool:
+        """Record a revocation; False if the jti was already revoked."""
+        pass
+
+    def is_revoked(self, jti: str) -> bool:
+        pass
+
+    def revoked_since(self, since: datetime, now: datetime) -> Sequence[Tuple[str, datetime]]:
+        """(jti, revoked_at) for unexpired revocations recorded at or after `since`."""
+        pass
@@ -31,5 +31,20 @@ class User(BaseModel):
 
 class LoginOut(BaseModel):
     access_token: str
+    refresh_token: str
     token_type: str = "bearer"
     user: User
+
+
+class RefreshIn(BaseModel):
+    refresh_token: str = Field(..., min_length=1)
+
+
+class LogoutIn(BaseModel):
+    refresh_token: Optional[str] = None
+
+
+class TokenPair(BaseModel):
+    access_token: str
+    refresh_token: str
+    token_type: str = "bearer"
@@ -0,0 +1,7 @@
+from typing import List
+from pydantic import BaseModel
+
+
+class DishSuggestions(BaseModel):
+    prefix: str
+    suggestions: List[str]
@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Literal, Optional
+from pydantic import BaseModel
+
+JobState = Literal["queued", "running", "completed", "failed"]
+
+
+class JobStatus(BaseModel):
+    id: str
+    status: JobState
+    format: str
+    rows_read: int = 0
+    rows_written: int = 0
+    rows_failed: int = 0
+    dishes_total: int = 0
+    dishes_resolved: int = 0
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+
+class MealLogRowResult(BaseModel):
+    row: int
+    dish_name: Optional[str] = None
+    servings: Optional[float] = None
+    calories_per_serving: Optional[float] = None
+    total_calories: Optional[float] = None
+    basis: Optional[str] = None
+    error: Optional[str] = None
@@ -0,0 +1,61 @@
+from datetime import date, datetime
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class MealEntryIn(BaseModel):
+    dish_name: str = Field(..., min_length=1, max_length=255)
+    servings: float = Field(..., gt=0, description="Must be > 0")
+    eaten_at: Optional[datetime] = Field(default=None, description="Defaults to now (UTC)")
+    total_calories: Optional[float] = Field(
+        default=None, ge=0, description="Known calories; estimated from USDA when omitted"
+    )
+
+
+class MealEntry(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    id: int
+    dish_name: str
+    servings: float
+    total_calories: float
+    eaten_at: datetime
+
+
+class MealEntryPage(BaseModel):
+    items: List[MealEntry]
+    next_cursor: Optional[str] = None
+
+
+class DailySummary(BaseModel):
+    day: date
+    total_calories: float
+    entry_count: int
+
+
+class WeeklySummary(BaseModel):
+    start: date
+    end: date
+    total_calories: float
+    entry_count: int
+    days: List[DailySummary]
+
+
+class MealEstimateIn(BaseModel):
+    text: str = Field(..., min_length=1, max_length=1000,
+                      description='Free text, e.g. "2 eggs, 1 slice toast and a cup of orange juice"')
+
+
+class MealItemEstimate(BaseModel):
+    text: str
+    dish_name: str
+    quantity: float
+    unit: Optional[str] = None
+    calories_per_serving: Optional[float] = None
+    total_calories: Optional[float] = None
+    error: Optional[str] = None
+
+
+class MealEstimate(BaseModel):
+    items: List[MealItemEstimate]
+    total_calories: float
+    unresolved: int = 0
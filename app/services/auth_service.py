@@ -1,10 +1,17 @@
-from typing import Tuple
+import jwt
+from datetime import datetime, timezone
+from typing import Any, Mapping, Optional, Tuple
 from app.ports.user_repository import UserRepository
+from app.ports.revoked_token_repository import RevokedTokenRepository
 from app.core import security
+from app.core.revocation import RevocationList
 
 class AuthService:
-    def __init__(self, users: UserRepository):
+    def __init__(self, users: UserRepository, revoked: Optional[RevokedTokenRepository] = None,
+                 revocations: Optional[RevocationList] = None):
         self._users = users
+        self._revoked = revoked
+        self._revocations = revocations
 
     def register(self, *, first_name: str, last_name: str, email: str, raw_password: str):
         existing = self._users.get_by_email(email)
@@ -13,9 +20,44 @@ class AuthService:
         password_hash = security.hash_password(raw_password)
         return self._users.create(first_name, last_name, email, password_hash)
 
-    def login(self, *, email: str, raw_password: str) -> Tuple[str, object]:
+    def login(self, *, email: str, raw_password: str) -> Tuple[str, str, object]:
         user = self._users.get_by_email(email)
         if not user or not security.verify_password(raw_password, user.password_hash):
             raise ValueError("Invalid Credentials")
-        token = security.create_access_token(subject=str(user.id), extra={"email": user.email})
-        return token, user
+        access, refresh = self._issue(str(user.id), user.email)
+        return access, refresh, user
+
+    def refresh(self, *, refresh_token: str) -> Tuple[str, str]:
+        """Rotate: the presented refresh token is revoked and a new pair issued."""
+        try:
+            claims = security.decode_refresh_token(refresh_token)
+        except jwt.PyJWTError:
+            raise ValueError("Invalid refresh token")
+        # the unique jti insert is the authority here, so a replayed or concurrently reused
+        # refresh token loses even before other workers have synced their filters
+        if not self._revoke(claims):
+            raise ValueError("Refresh token already used")
+        return self._issue(claims["sub"], claims.get("email"))
+
+    def logout(self, *, access_claims: Mapping[str, Any], refresh_token: Optional[str] = None) -> None:
+        self._revoke(access_claims)
+        if refresh_token:
+            try:
+                claims = security.decode_refresh_token(refresh_token)
+            except jwt.PyJWTError:
+                return
+            if claims["sub"] == access_claims["sub"]:
+                self._revoke(claims)
+
+    def _issue(self, subject: str, email: Optional[str]) -> Tuple[str, str]:
+        extra = {"email": email} if email else None
+        return (
+            security.create_access_token(subject=subject, extra=extra),
+            security.create_refresh_token(subject, extra=extra),
+        )
+
+    def _revoke(self, claims: Mapping[str, Any]) -> bool:
+        if self._revoked is None or self._revocations is None:
+            raise RuntimeError("AuthService was built without a revocation store")
+        expires_at = datetime.fromtimestamp(claims["exp"], tz=timezone.utc)
+        return self._revocations.revoke(claims["jti"], claims["type"], expires_at, self._revoked)
@@ -1,27 +1,44 @@
-from typing import Any, List, Mapping
+from typing import Any, List, Mapping, Optional, Tuple
 from app.core.config import get_settings
+from app.adapters.http.usda_client import USDAError
 from app.schemas.calories import CaloriesEstimate
 from app.ports.food_search import FoodSearchClient
+from app.services.dish_suggestion_service import DishSuggester
 from app.utils.calorie_estimation_utils import (normalize, tokens,
                                                 composite_score, find_energy_kcal, serving_grams)
+from app.utils.spell_correction import correct_query
+
+
+def canonical_dish_key(dish_name: str) -> str:
+    """Spell-corrected, normalized dish name; equal keys always resolve to the same estimate."""
+    return normalize(correct_query(dish_name))
 
 
 class CalorieService:
-    """Calculate calorie estimate using a FoodSearchClient."""
+    """
+    Calculate calorie estimate using a FoodSearchClient. With a `suggester`, result pages and
+    resolved queries feed dish autocomplete; pass one only for interactive callers.
+    """
 
-    def __init__(self, food_client: FoodSearchClient):
+    def __init__(self, food_client: FoodSearchClient, suggester: Optional[DishSuggester] = None):
         self._client = food_client
+        self._suggester = suggester
         s = get_settings()
         self._threshold = s.FUZZ_THRESHOLD
+        self._detail_candidates = s.DETAILS_FALLBACK_CANDIDATES
 
     async def calculate(self, *, dish_name: str, servings: float) -> CaloriesEstimate:
-        data = await self._client.search(dish_name)
+        # fix typos first so the provider sees (and caches) the corrected query
+        query = correct_query(dish_name) or dish_name
+        data = await self._client.search(query)
         foods: List[Mapping[str, Any]] = list(data.get("foods") or [])
         if not foods:
             raise LookupError("No matches")
+        if self._suggester is not None:
+            self._suggester.add_foods(foods)  # autocomplete learns from every result page
 
-        normalized_dish_name = normalize(dish_name)
-        dish_tokens = set(tokens(dish_name))
+        normalized_dish_name = normalize(query)
+        dish_tokens = set(tokens(query))
 
         def _score(f: Mapping[str, Any]) -> float:
             desc = str(f.get("description") or "")
@@ -33,14 +50,19 @@ class CalorieService:
             bonus_cov = 10.0 * coverage
             return base + bonus_cov
 
-        best = max(foods, key=_score)
-        best_score = _score(best)
+        scored = [(_score(f), i) for i, f in enumerate(foods)]
+        best_score, best_idx = max(scored, key=lambda t: (t[0], -t[1]))  # first of equals wins
         if best_score < self._threshold:
             raise LookupError("Low confidence match")
+        if self._suggester is not None:
+            self._suggester.add_query(query)
 
+        best = foods[best_idx]
         kcal, basis = find_energy_kcal(best)
         if kcal is None:
-            raise LookupError("Energy not found")
+            # e.g. Branded hits with partial foodNutrients: fetch full details for the top few
+            ranked = sorted((-score, i) for score, i in scored if score >= self._threshold)
+            best, kcal, basis = await self._energy_from_details([foods[i] for _, i in ranked])
 
         grams = serving_grams(best)
         if basis.startswith("per serving"):
@@ -71,3 +93,28 @@ class CalorieService:
             basis=final_basis,
             ingredients=ingredients,
         )
+
+    async def _energy_from_details(
+        self, candidates: List[Mapping[str, Any]]
+    ) -> Tuple[Mapping[str, Any], float, str]:
+        """
+        One batched details call for the best-scoring candidates; the first whose full record
+        has energy wins. Providers without details (or a failed call) keep the old 404.
+        """
+        foods = getattr(self._client, "foods", None)
+        candidates = candidates[:self._detail_candidates]
+        ids = [f["fdcId"] for f in candidates if isinstance(f.get("fdcId"), int)]
+        if foods is None or not ids:
+            raise LookupError("Energy not found")
+        try:
+            details = await foods(ids)
+        except USDAError:
+            raise LookupError("Energy not found")
+        for hit in candidates:
+            detail = details.get(hit.get("fdcId"))
+            if detail:
+                merged = {**hit, **detail}
+                kcal, basis = find_energy_kcal(merged)
+                if kcal is not None:
+                    return merged, kcal, basis
+        raise LookupError("Energy not found")
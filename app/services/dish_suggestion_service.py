@@ -0,0 +1,87 @@
+from typing import Any, Iterable, List, Mapping, Optional, Set
+from cachetools import LRUCache
+from app.adapters.http.recorded_search import SearchRecordingStore
+from app.core.config import get_settings
+from app.core.constants import ALIASES
+from app.utils.calorie_estimation_utils import normalize
+from app.utils.prefix_trie import PrefixTrie
+
+# Resolved queries outrank descriptions that merely appeared in a result page.
+QUERY_WEIGHT = 3.0
+DESCRIPTION_WEIGHT = 1.0
+
+
+class DishSuggester:
+    """
+    Dish-name autocomplete over a prefix trie keyed by normalized name. Fed from the ALIASES
+    targets, queries in the search recording (if any), and, as the app runs, every search
+    result page (descriptions) and interactive queries that keep resolving. Never calls a
+    provider.
+
+    Suggestions are shared by every user, so a typed query only counts once it has resolved
+    `min_query_count` times; one-off text (or someone else's diary entry) never surfaces.
+    """
+
+    def __init__(self, *, max_terms: Optional[int] = None, max_results: Optional[int] = None,
+                 min_query_count: Optional[int] = None):
+        s = get_settings()
+        self._max_terms = int(max_terms or s.SUGGEST_MAX_TERMS)
+        self._trie = PrefixTrie(top_k=int(max_results or s.SUGGEST_MAX_RESULTS),
+                                max_terms=self._max_terms)
+        self._seen: Set[str] = set()  # raw descriptions already indexed (skips normalize)
+        self._min_query_count = int(min_query_count or s.SUGGEST_MIN_QUERY_COUNT)
+        # resolutions per normalized query; LRU-bounded so rare text ages out before it counts
+        self._query_counts: LRUCache[str, int] = LRUCache(maxsize=self._max_terms)
+
+    def __len__(self) -> int:
+        return len(self._trie)
+
+    def add_aliases(self, aliases: Mapping[str, str] = ALIASES) -> None:
+        for phrase in set(aliases.values()):
+            self._trie.add(normalize(phrase), DESCRIPTION_WEIGHT, only_new=True)
+
+    def add_query(self, query: str, weight: float = QUERY_WEIGHT) -> None:
+        """Count a resolved user query; it only carries weight from its `min_query_count`th."""
+        key = normalize(query)
+        if not key:
+            return
+        count = self._query_counts[key] = self._query_counts.get(key, 0) + 1
+        if count >= self._min_query_count:
+            self._trie.add(key, weight)
+
+    def add_foods(self, foods: Iterable[Mapping[str, Any]]) -> None:
+        """Index result descriptions; each distinct description counts once."""
+        for food in foods:
+            desc = food.get("description")
+            if not isinstance(desc, str) or desc in self._seen:
+                continue
+            if len(self._seen) < 2 * self._max_terms:
+                self._seen.add(desc)
+            self._trie.add(normalize(desc), DESCRIPTION_WEIGHT, display=desc.strip(), only_new=True)
+
+    def add_recording(self, store: SearchRecordingStore) -> None:
+        for rec in store.load().values():
+            foods = list((rec.get("r") or {}).get("foods") or [])
+            if foods:
+                # recordings are curated by the operator, so their queries count right away
+                self._trie.add(normalize(rec["q"]), QUERY_WEIGHT)
+                self.add_foods(foods)
+
+    def suggest(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        key = normalize(prefix)
+        return [display for display, _ in self._trie.top(key, limit)] if key else []
+
+
+_singleton: Optional[DishSuggester] = None
+
+def get_dish_suggester() -> DishSuggester:
+    global _singleton
+    if _singleton is None:
+        s = get_settings()
+        suggester = DishSuggester()
+        suggester.add_aliases()
+        store = SearchRecordingStore(s.FOOD_SEARCH_RECORDING_PATH)
+        if store.path.exists():
+            suggester.add_recording(store)
+        _singleton = suggester
+    return _singleton
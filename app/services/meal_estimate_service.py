@@ -0,0 +1,59 @@
+import asyncio
+from typing import Dict, List
+from app.adapters.http.usda_client import USDAError
+from app.schemas.calories import CaloriesEstimate
+from app.schemas.meals import MealEstimate, MealItemEstimate
+from app.services.calorie_service import CalorieService, canonical_dish_key
+from app.utils.meal_text_parser import MealItem, parse_meal_text
+
+
+class TooManyItems(ValueError):
+    pass
+
+
+class MealEstimateService:
+    """Estimate a whole meal typed as free text; each distinct dish is resolved once."""
+
+    def __init__(self, calories: CalorieService, *, max_items: int):
+        self._calories = calories
+        self._max_items = max_items
+
+    async def estimate(self, text: str) -> MealEstimate:
+        items = parse_meal_text(text)
+        if len(items) > self._max_items:
+            raise TooManyItems(f"At most {self._max_items} items per meal")
+
+        # one lookup per canonical key, all in flight together (bounded by max_items)
+        item_keys = [canonical_dish_key(item.dish_name) for item in items]
+        unique: Dict[str, str] = {}
+        for key, item in zip(item_keys, items):
+            unique.setdefault(key, item.dish_name)
+        results = await asyncio.gather(*(self._resolve(dish) for dish in unique.values()))
+        resolved: Dict[str, CaloriesEstimate | str] = dict(zip(unique, results))
+
+        out: List[MealItemEstimate] = []
+        total, unresolved = 0.0, 0
+        for key, item in zip(item_keys, items):
+            hit = resolved[key]
+            if isinstance(hit, CaloriesEstimate):
+                item_total = round(hit.calories_per_serving * item.quantity, 2)
+                total += item_total
+                out.append(self._item(item, calories_per_serving=hit.calories_per_serving,
+                                      total_calories=item_total))
+            else:
+                unresolved += 1
+                out.append(self._item(item, error=hit))
+        return MealEstimate(items=out, total_calories=round(total, 2), unresolved=unresolved)
+
+    async def _resolve(self, dish_name: str) -> CaloriesEstimate | str:
+        try:
+            return await self._calories.calculate(dish_name=dish_name, servings=1)
+        except LookupError:
+            return "Dish not found"
+        except USDAError:
+            return "USDA service unavailable"
+
+    @staticmethod
+    def _item(item: MealItem, **kw) -> MealItemEstimate:
+        return MealItemEstimate(text=item.text, dish_name=item.dish_name, quantity=item.quantity,
+                                unit=item.unit, **kw)
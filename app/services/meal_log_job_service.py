@@ -0,0 +1,278 @@
+import asyncio
+import csv
+import io
+import json
+import tempfile
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, AsyncIterable, Dict, Iterator, Optional, Tuple
+import msgpack
+from pydantic import ValidationError
+from app.adapters.http.usda_client import USDAError
+from app.core.config import get_settings
+from app.core.quota import Priority, call_priority
+from app.schemas.calories import CaloriesEstimate, CaloriesIn
+from app.schemas.jobs import JobStatus, MealLogRowResult
+from app.services.calorie_service import CalorieService, canonical_dish_key
+
+SUPPORTED_FORMATS = ("csv", "ndjson", "msgpack")
+FINISHED_STATES = ("completed", "failed")
+RESULT_COLUMNS = list(MealLogRowResult.model_fields)
+
+
+class UploadTooLarge(ValueError):
+    pass
+
+
+class TooManyActiveJobs(RuntimeError):
+    """Every retained job is still queued or running, so none can be purged for a new one."""
+
+
+class MealLogJob:
+    """Book-keeping for one bulk job; rows live on disk, only unique dishes are held in memory."""
+
+    def __init__(self, job_id: str, fmt: str, workdir: Path):
+        self.status = JobStatus(
+            id=job_id, status="queued", format=fmt, created_at=datetime.now(timezone.utc)
+        )
+        self.input_path = workdir / f"{job_id}.in"
+        self.results_path = workdir / f"{job_id}.out.ndjson"
+
+    @property
+    def id(self) -> str:
+        return self.status.id
+
+    def cleanup(self) -> None:
+        for p in (self.input_path, self.results_path):
+            p.unlink(missing_ok=True)
+
+
+def _unpack_rows(fh: IO[bytes]) -> Iterator[Any]:
+    """Objects from a concatenated MessagePack stream; a corrupt tail yields one bad row and ends."""
+    try:
+        yield from msgpack.Unpacker(fh, raw=False)
+    except (ValueError, TypeError, msgpack.UnpackException):
+        yield None
+
+
+def _iter_rows(path: Path, fmt: str) -> Iterator[Tuple[int, Optional[CaloriesIn], Optional[str]]]:
+    """Yield (row number, parsed row or None, error) one row at a time from the spooled upload."""
+    if fmt == "msgpack":
+        with open(path, "rb") as fh:
+            yield from _validate_rows(_unpack_rows(fh), fmt)
+        return
+    with open(path, encoding="utf-8", newline="") as fh:
+        if fmt == "csv":
+            raw_rows: Iterator[Any] = csv.DictReader(fh)
+        else:
+            raw_rows = (line for line in fh if line.strip())
+        yield from _validate_rows(raw_rows, fmt)
+
+
+def _validate_rows(raw_rows: Iterator[Any], fmt: str
+                   ) -> Iterator[Tuple[int, Optional[CaloriesIn], Optional[str]]]:
+    for n, raw in enumerate(raw_rows, start=1):
+        try:
+            if fmt == "ndjson":
+                raw = json.loads(raw)
+            if not isinstance(raw, dict):
+                raise ValueError("row is not an object")
+            servings = raw.get("servings")
+            row = CaloriesIn(
+                dish_name=str(raw.get("dish_name") or "").strip(),
+                servings=1 if servings in (None, "") else servings,
+            )
+            yield n, row, None
+        except (ValueError, ValidationError):
+            yield n, None, "Invalid row"
+
+
+class MealLogJobService:
+    """
+    Runs bulk meal-log imports: the upload is spooled to disk, unique dishes are resolved
+    through CalorieService with bounded concurrency, and per-row results are written to disk
+    so they can be streamed back in either format.
+    """
+
+    def __init__(
+        self,
+        *,
+        workdir: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        max_retained: Optional[int] = None,
+        max_upload_bytes: Optional[int] = None,
+    ):
+        s = get_settings()
+        base = workdir or s.BULK_JOB_DIR or tempfile.gettempdir()
+        self._workdir = Path(base) / "meal-log-jobs"
+        self._workdir.mkdir(parents=True, exist_ok=True)
+        self._concurrency = int(concurrency or s.BULK_JOB_CONCURRENCY)
+        self._max_retained = int(max_retained or s.BULK_JOB_MAX_RETAINED)
+        self._max_upload_bytes = int(max_upload_bytes or s.BULK_JOB_MAX_UPLOAD_MB * 1024 * 1024)
+        self._jobs: "OrderedDict[str, MealLogJob]" = OrderedDict()
+
+    def get(self, job_id: str) -> Optional[MealLogJob]:
+        return self._jobs.get(job_id)
+
+    async def create(self, chunks: AsyncIterable[bytes], fmt: str) -> MealLogJob:
+        """Spool the request body to disk chunk by chunk and register a queued job."""
+        if fmt not in SUPPORTED_FORMATS:
+            raise ValueError(f"Unsupported format: {fmt}")
+        self._make_room()  # fail before spooling anything
+        job = MealLogJob(uuid.uuid4().hex, fmt, self._workdir)
+        size = 0
+        try:
+            # file I/O goes through a worker thread so a large upload never blocks the loop
+            fh = await asyncio.to_thread(open, job.input_path, "wb")
+            try:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if size > self._max_upload_bytes:
+                        raise UploadTooLarge("Upload too large")
+                    await asyncio.to_thread(fh.write, chunk)
+            finally:
+                await asyncio.to_thread(fh.close)
+        except BaseException:
+            job.cleanup()
+            raise
+        self._register(job)
+        return job
+
+    def _register(self, job: MealLogJob) -> None:
+        try:
+            self._make_room()  # again: other uploads may have registered while this one spooled
+        except TooManyActiveJobs:
+            job.cleanup()
+            raise
+        self._jobs[job.id] = job
+
+    def _make_room(self) -> None:
+        """Purge the oldest finished jobs until one more fits; active jobs keep their files."""
+        while len(self._jobs) >= self._max_retained:
+            old = next((j for j in self._jobs.values() if j.status.status in FINISHED_STATES), None)
+            if old is None:
+                raise TooManyActiveJobs("Too many jobs in progress")
+            del self._jobs[old.id]
+            old.cleanup()
+
+    async def run(self, job: MealLogJob, calorie_service: CalorieService) -> None:
+        status = job.status
+        status.status = "running"
+        try:
+            # both file passes parse and canonicalize every row, so they run in a worker thread
+            # to keep a large upload from stalling interactive requests on the event loop
+            dishes = await asyncio.to_thread(self._collect_dishes, job)
+            status.dishes_total = len(dishes)
+
+            # background priority: USDA quota is kept for interactive callers as it runs low
+            with call_priority(Priority.BACKGROUND):
+                resolved = await self._resolve(dishes, calorie_service, status)
+
+            await asyncio.to_thread(self._write_results, job, resolved)
+            status.status = "completed"
+        except Exception as e:
+            status.status = "failed"
+            status.error = str(e) or e.__class__.__name__
+        finally:
+            status.finished_at = datetime.now(timezone.utc)
+            job.input_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _collect_dishes(job: MealLogJob) -> Dict[str, str]:
+        """Pass 1: unique dishes (by canonical key) without holding rows in memory."""
+        status = job.status
+        dishes: Dict[str, str] = {}
+        for _, row, _ in _iter_rows(job.input_path, status.format):
+            status.rows_read += 1
+            if row is not None:
+                dishes.setdefault(canonical_dish_key(row.dish_name), row.dish_name)
+        return dishes
+
+    def _write_results(self, job: MealLogJob, resolved: Dict[str, CaloriesEstimate | str]) -> None:
+        """Pass 2: stream rows again and write one result line per row."""
+        status = job.status
+        with open(job.results_path, "w", encoding="utf-8") as out:
+            for n, row, err in _iter_rows(job.input_path, status.format):
+                result = self._row_result(n, row, err, resolved)
+                if result.error:
+                    status.rows_failed += 1
+                out.write(result.model_dump_json() + "\n")
+                status.rows_written += 1
+
+    async def _resolve(
+        self, dishes: Dict[str, str], calorie_service: CalorieService, status: JobStatus
+    ) -> Dict[str, CaloriesEstimate | str]:
+        resolved: Dict[str, CaloriesEstimate | str] = {}
+        pending = iter(dishes.items())
+
+        # a fixed pool of workers pulls from one shared iterator, so concurrency stays bounded
+        # without creating a task per dish
+        async def _worker() -> None:
+            for key, dish_name in pending:
+                try:
+                    resolved[key] = await calorie_service.calculate(dish_name=dish_name, servings=1)
+                except LookupError:
+                    resolved[key] = "Dish not found"
+                except USDAError:
+                    resolved[key] = "USDA service unavailable"
+                status.dishes_resolved += 1
+
+        workers = max(1, min(self._concurrency, len(dishes)))
+        await asyncio.gather(*(_worker() for _ in range(workers)))
+        return resolved
+
+    @staticmethod
+    def _row_result(
+        n: int,
+        row: Optional[CaloriesIn],
+        err: Optional[str],
+        resolved: Dict[str, CaloriesEstimate | str],
+    ) -> MealLogRowResult:
+        if row is None:
+            return MealLogRowResult(row=n, error=err)
+        hit = resolved.get(canonical_dish_key(row.dish_name))
+        if not isinstance(hit, CaloriesEstimate):
+            return MealLogRowResult(
+                row=n, dish_name=row.dish_name, servings=row.servings, error=hit or "Dish not found"
+            )
+        return MealLogRowResult(
+            row=n,
+            dish_name=row.dish_name,
+            servings=row.servings,
+            calories_per_serving=hit.calories_per_serving,
+            total_calories=round(hit.calories_per_serving * row.servings, 2),
+            basis=hit.basis,
+        )
+
+    def iter_results(self, job: MealLogJob, fmt: str) -> Iterator[str | bytes]:
+        """Stream the results file back line by line, converting to CSV/MessagePack if asked."""
+        with open(job.results_path, encoding="utf-8") as fh:
+            if fmt == "ndjson":
+                yield from fh
+                return
+            if fmt == "msgpack":
+                # one MessagePack map per row, concatenated (read back with msgpack.Unpacker)
+                for line in fh:
+                    yield msgpack.packb(json.loads(line))
+                return
+            buf = io.StringIO()
+            writer = csv.DictWriter(buf, fieldnames=RESULT_COLUMNS)
+            writer.writeheader()
+            for line in fh:
+                writer.writerow(json.loads(line))
+                yield buf.getvalue()
+                buf.seek(0)
+                buf.truncate()
+            if buf.tell():
+                yield buf.getvalue()  # empty result set: header only
+
+
+_singleton: Optional[MealLogJobService] = None
+
+def get_job_service() -> MealLogJobService:
+    global _singleton
+    if _singleton is None:
+        _singleton = MealLogJobService()
+    return _singleton
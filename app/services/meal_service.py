@@ -0,0 +1,86 @@
+import base64
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Tuple
+from app.ports.meal_repository import MealRepository
+from app.schemas.meals import (MealEntry, MealEntryIn, MealEntryPage, DailySummary,
+                               WeeklySummary)
+from app.services.calorie_service import CalorieService
+
+
+def encode_cursor(eaten_at: datetime, entry_id: int) -> str:
+    raw = f"{eaten_at.isoformat()}|{entry_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        ts, entry_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(ts), int(entry_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
+
+
+class MealService:
+    """Meal diary: entries plus per-day totals that the repository keeps in step on each write."""
+
+    def __init__(self, meals: MealRepository, calories: CalorieService):
+        self._meals = meals
+        self._calories = calories
+
+    async def log(self, *, user_id: int, payload: MealEntryIn) -> MealEntry:
+        total = payload.total_calories
+        if total is None:
+            estimate = await self._calories.calculate(
+                dish_name=payload.dish_name, servings=payload.servings
+            )
+            total = estimate.total_calories
+        eaten_at = payload.eaten_at or datetime.now(timezone.utc)
+        if eaten_at.tzinfo is not None:
+            eaten_at = eaten_at.astimezone(timezone.utc)
+        entry = self._meals.add(user_id, payload.dish_name, payload.servings, total, eaten_at)
+        return MealEntry.model_validate(entry)
+
+    def list(self, *, user_id: int, limit: int, cursor: Optional[str] = None) -> MealEntryPage:
+        before = decode_cursor(cursor) if cursor else None
+        # fetch one extra row to know whether another page exists
+        rows = list(self._meals.list_page(user_id, limit=limit + 1, before=before))
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].eaten_at, rows[-1].id)
+        return MealEntryPage(items=[MealEntry.model_validate(r) for r in rows],
+                             next_cursor=next_cursor)
+
+    def delete(self, *, user_id: int, entry_id: int) -> None:
+        entry = self._meals.get(user_id, entry_id)
+        if entry is None:
+            raise LookupError("Meal entry not found")
+        self._meals.delete(entry)
+
+    def daily(self, *, user_id: int, day: date) -> DailySummary:
+        rows = self._meals.daily_totals(user_id, day, day)
+        if not rows:
+            return DailySummary(day=day, total_calories=0.0, entry_count=0)
+        return DailySummary(day=day, total_calories=round(rows[0].total_calories, 2),
+                            entry_count=rows[0].entry_count)
+
+    def weekly(self, *, user_id: int, start: date) -> WeeklySummary:
+        end = start + timedelta(days=6)
+        by_day = {r.day: r for r in self._meals.daily_totals(user_id, start, end)}
+        days = []
+        for i in range(7):
+            d = start + timedelta(days=i)
+            r = by_day.get(d)
+            days.append(DailySummary(
+                day=d,
+                total_calories=round(r.total_calories, 2) if r else 0.0,
+                entry_count=r.entry_count if r else 0,
+            ))
+        return WeeklySummary(
+            start=start,
+            end=end,
+            total_calories=round(sum(d.total_calories for d in days), 2),
+            entry_count=sum(d.entry_count for d in days),
+            days=days,
+        )
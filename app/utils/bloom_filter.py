@@ -0,0 +1,42 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings. `in` never gives false negatives; false positives
+    stay near `error_rate` until more than `capacity` items have been added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be >= 1 and 0 < error_rate < 1")
+        self._capacity = capacity
+        self._m = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self._k = max(1, round(self._m / capacity * math.log(2)))
+        self._bits = bytearray((self._m + 7) // 8)
+        self._count = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _positions(self, item: str):
+        # double hashing: k positions from one 128-bit digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self._m for i in range(self._k))
+
+    def add(self, item: str) -> None:
+        for p in self._positions(item):
+            self._bits[p >> 3] |= 1 << (p & 7)
+        self._count += 1
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, str):
+            return False
+        return all(self._bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
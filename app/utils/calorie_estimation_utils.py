@@ -43,9 +43,11 @@ def find_energy_kcal(food: Mapping[str, Any]) -> Tuple[Optional[float], str]:
             return float(cal["value"]), "per serving (label)"
 
     for n in (food.get("foodNutrients") or []):
-        name = (n.get("nutrientName") or "").lower()
-        unit = (n.get("unitName") or "").lower()
-        val = n.get("value")
+        # search hits: nutrientName/unitName/value; /foods details: nested "nutrient" + amount
+        nutrient = n.get("nutrient") if isinstance(n.get("nutrient"), dict) else n
+        name = (n.get("nutrientName") or nutrient.get("name") or "").lower()
+        unit = (n.get("unitName") or nutrient.get("unitName") or "").lower()
+        val = n.get("value", n.get("amount"))
         if not isinstance(val, (int, float)):
             continue
         if "energy" in name:
@@ -0,0 +1,31 @@
+import bisect
+import hashlib
+from typing import Iterable, List
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    Consistent-hash ring. Each node is placed at `vnodes` points so keys spread evenly, and
+    adding or removing a node only moves the keys that node gains or loses (~1/N of them).
+    Every node building the ring from the same node list agrees on each key's owner.
+    """
+
+    def __init__(self, nodes: Iterable[str], *, vnodes: int = 64):
+        self._nodes = sorted(set(nodes))
+        if not self._nodes:
+            raise ValueError("HashRing needs at least one node")
+        points = sorted((_hash(f"{node}#{i}"), node) for node in self._nodes for i in range(vnodes))
+        self._points = [p for p, _ in points]
+        self._owners = [node for _, node in points]
+
+    @property
+    def nodes(self) -> List[str]:
+        return list(self._nodes)
+
+    def owner(self, key: str) -> str:
+        idx = bisect.bisect(self._points, _hash(key)) % len(self._points)
+        return self._owners[idx]
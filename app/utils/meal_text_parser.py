@@ -0,0 +1,128 @@
+import re
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import List, Optional, Tuple
+
+NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6,
+    "seven": 7, "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12,
+    "half": 0.5, "dozen": 12, "couple": 2, "few": 3,
+}
+
+# Portion words are kept for display; one portion counts as one serving.
+UNITS = {
+    "slice", "slices", "cup", "cups", "bowl", "bowls", "plate", "plates", "piece", "pieces",
+    "serving", "servings", "portion", "portions", "glass", "glasses", "mug", "mugs",
+    "can", "cans", "bottle", "bottles", "handful", "handfuls", "scoop", "scoops",
+    "tbsp", "tablespoon", "tablespoons", "tsp", "teaspoon", "teaspoons", "bar", "bars",
+    "stick", "sticks", "packet", "packets", "pack", "packs", "spoon", "spoons",
+}
+
+# "1/2", "1", "1.5", "1 1/2", "½"; the plain fraction goes first so "1/2" isn't read as "1"
+_NUMBER = r"\d+/\d+|\d+(?:\.\d+)?(?:\s+\d+/\d+)?|[½¼¾]"
+_QUANTITY_RE = re.compile(rf"^(?:(?P<num>{_NUMBER})|(?P<word>{'|'.join(NUMBER_WORDS)}))\b\s*(?:of\s+)?",
+                          re.IGNORECASE)
+_UNIT_RE = re.compile(rf"^(?P<unit>{'|'.join(sorted(UNITS, key=len, reverse=True))})\b\.?\s*(?:of\s+)?",
+                      re.IGNORECASE)
+_SEPARATOR_RE = re.compile(r"[,;\n+&]|\bplus\b", re.IGNORECASE)
+# " and " only splits when a quantity follows, so "macaroni and cheese" stays one item
+_AND_RE = re.compile(rf"\s+and\s+(?=(?:{_NUMBER})|(?:{'|'.join(NUMBER_WORDS)})\b)", re.IGNORECASE)
+_AND_PREFIX_RE = re.compile(r"^and\s+", re.IGNORECASE)
+_VULGAR = {"½": 0.5, "¼": 0.25, "¾": 0.75}
+# More servings than anyone eats in one meal is a typo (or an attack on float parsing).
+MAX_QUANTITY = 1000
+
+
+class InvalidQuantity(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class MealItem:
+    text: str
+    dish_name: str
+    quantity: float
+    unit: Optional[str] = None
+
+
+def _parse_number(raw: str) -> float:
+    if raw in _VULGAR:
+        return _VULGAR[raw]
+    try:
+        value = sum(Fraction(part) for part in raw.split())
+    except ZeroDivisionError:
+        raise InvalidQuantity(f"Invalid quantity: {raw}")
+    if value > MAX_QUANTITY:  # checked on the exact Fraction, before float() can overflow
+        raise InvalidQuantity(f"Quantity above {MAX_QUANTITY}: {raw[:20]}")
+    return float(value)
+
+
+def _is_bare_quantity(text: str) -> bool:
+    m = _QUANTITY_RE.match(text.strip())
+    return m is not None and not text.strip()[m.end():]
+
+
+def _leading_quantity(text: str) -> Tuple[float, Optional[str], str]:
+    original = text
+    quantity = 1.0
+    m = _QUANTITY_RE.match(text)
+    if m:
+        first = (m.group("word") or "").lower()
+        quantity = float(NUMBER_WORDS[first]) if first else _parse_number(m.group("num"))
+        text = text[m.end():]
+        # two-word quantities: "2 dozen", "a couple of", "a few", "half a"
+        m = _QUANTITY_RE.match(text)
+        second = (m.group("word") or "").lower() if m else ""
+        if second == "dozen":
+            quantity *= 12
+            if quantity > MAX_QUANTITY:
+                raise InvalidQuantity(f"Quantity above {MAX_QUANTITY}")
+        elif first in ("a", "an") and second in ("couple", "few", "half"):
+            quantity = float(NUMBER_WORDS[second])
+        elif not (first == "half" and second in ("a", "an")):
+            m = None
+        if m:
+            text = text[m.end():]
+        m = _AND_PREFIX_RE.match(text)
+        if m:
+            # "1 and 1/2 cups rice", "two and a half eggs": a whole number plus a fraction;
+            # anything else joined by "and" ("half and half") is the dish's own name
+            extra, unit, rest = _leading_quantity(text[m.end():])
+            if quantity.is_integer() and 0 < extra < 1 and rest:
+                return quantity + extra, unit, rest
+            return 1.0, None, original.strip()
+    unit = None
+    m = _UNIT_RE.match(text)
+    if m and text[m.end():].strip():
+        unit = m.group("unit").lower()
+        text = text[m.end():]
+    return quantity, unit, text.strip()
+
+
+def parse_meal_text(text: str) -> List[MealItem]:
+    """
+    Split free text like "2 eggs, 1 slice toast and a cup of orange juice" into items with
+    quantities. Items are separated by commas, semicolons, newlines, "+", "&", "plus", or "and"
+    between an item and a quantity ("1 and 1/2 cups" is one quantity, "half and half" a dish). Portion units are recorded but not converted: one portion is one
+    serving. Items with no dish name left after the quantity are dropped. Raises
+    InvalidQuantity for a fraction with a zero denominator or a quantity above MAX_QUANTITY.
+    """
+    items: List[MealItem] = []
+    for chunk in _SEPARATOR_RE.split(text):
+        parts: List[str] = []
+        for part in _AND_RE.split(chunk):
+            # never split right after a bare quantity: "1 and 1/2 cups", "half and half"
+            if parts and _is_bare_quantity(parts[-1]):
+                parts[-1] = f"{parts[-1]} and {part}"
+            else:
+                parts.append(part)
+        for part in parts:
+            part = " ".join(part.split())
+            if part.lower() == "and" or part.lower().startswith("and "):
+                part = part[4:]
+            if not part:
+                continue
+            quantity, unit, dish = _leading_quantity(part)
+            if dish and quantity > 0:
+                items.append(MealItem(text=part, dish_name=dish, quantity=quantity, unit=unit))
+    return items
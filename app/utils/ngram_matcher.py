@@ -0,0 +1,167 @@
+# Character n-gram TF-IDF matcher for large, read-only food description snapshots.
+# Requires numpy (`poetry install -E matcher`).
+import json
+import math
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Protocol, Tuple
+import numpy as np
+from app.utils.calorie_estimation_utils import composite_score, normalize
+
+MATRIX_FORMAT = 1
+# n-grams in more than this share of the catalog ("ing", "ed ") are skipped at query time
+MAX_DF_RATIO = 0.1
+
+
+class DescriptionLookup(Protocol):
+    """Anything indexable by doc id that returns the description (list, catalog, ...)."""
+
+    def __getitem__(self, doc_id: int) -> str:
+        pass
+
+
+def char_ngrams(text: str, n: int) -> Counter[str]:
+    padded = f" {normalize(text)} "
+    return Counter(padded[i:i + n] for i in range(max(0, len(padded) - n + 1)))
+
+
+def _tf(count: int) -> float:
+    return 1.0 + math.log(count)  # sublinear term frequency
+
+
+class NgramMatcher:
+    """
+    Cosine similarity over L2-normalized TF-IDF character n-gram vectors.
+
+    The matrix is kept column-major (one postings list per n-gram) in .npy files that are
+    memory-mapped on load, so workers share one copy through the page cache. A query only
+    reads the postings of its own selective n-grams (see MAX_DF_RATIO), so its cost follows
+    those rather than catalog size.
+    """
+
+    def __init__(self, *, n: int, vocab: Dict[str, int], idf: np.ndarray, indptr: np.ndarray,
+                 indices: np.ndarray, data: np.ndarray, num_docs: int):
+        self._n = n
+        self._vocab = vocab
+        self._idf = idf
+        self._indptr = indptr
+        self._indices = indices
+        self._data = data
+        self._num_docs = num_docs
+
+    def __len__(self) -> int:
+        return self._num_docs
+
+    @classmethod
+    def build(cls, descriptions: Iterable[str], *, n: int = 3) -> "NgramMatcher":
+        vocab: Dict[str, int] = {}
+        postings: List[List[Tuple[int, float]]] = []
+        num_docs = 0
+        for doc_id, desc in enumerate(descriptions):
+            num_docs += 1
+            for gram, count in char_ngrams(desc, n).items():
+                col = vocab.setdefault(gram, len(vocab))
+                if col == len(postings):
+                    postings.append([])
+                postings[col].append((doc_id, _tf(count)))
+
+        df = np.array([len(p) for p in postings], dtype=np.float32)
+        idf = (np.log((1.0 + num_docs) / (1.0 + df)) + 1.0).astype(np.float32)
+
+        indptr = np.zeros(len(postings) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(df, dtype=np.int64)
+        indices = np.empty(int(indptr[-1]), dtype=np.int32)
+        data = np.empty(int(indptr[-1]), dtype=np.float32)
+        for col, plist in enumerate(postings):
+            lo, hi = indptr[col], indptr[col + 1]
+            indices[lo:hi] = [d for d, _ in plist]
+            data[lo:hi] = [w * idf[col] for _, w in plist]
+
+        # L2-normalize each document row so dot products are cosines
+        norms = np.zeros(num_docs, dtype=np.float64)
+        np.add.at(norms, indices, data.astype(np.float64) ** 2)
+        norms = np.sqrt(norms).astype(np.float32)
+        norms[norms == 0] = 1.0
+        data /= norms[indices]
+
+        return cls(n=n, vocab=vocab, idf=idf, indptr=indptr, indices=indices, data=data,
+                   num_docs=num_docs)
+
+    def _query_vector(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        cols, weights = [], []
+        for gram, count in char_ngrams(text, self._n).items():
+            col = self._vocab.get(gram)
+            if col is not None:
+                cols.append(col)
+                weights.append(_tf(count) * float(self._idf[col]))
+        w = np.asarray(weights, dtype=np.float32)
+        norm = float(np.linalg.norm(w))
+        return np.asarray(cols, dtype=np.int64), (w / norm if norm else w)
+
+    def _selective(self, cols: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Drop near-ubiquitous n-grams; their postings span the catalog but barely move scores."""
+        df = self._indptr[cols + 1] - self._indptr[cols]
+        keep = df <= MAX_DF_RATIO * self._num_docs
+        if not keep.any():
+            return cols, weights  # nothing selective to go on: fall back to every n-gram
+        return cols[keep], weights[keep]
+
+    def top_k(self, text: str, k: int) -> List[Tuple[int, float]]:
+        """(doc id, cosine over the query's selective n-grams) of the k best docs, best first."""
+        cols, weights = self._query_vector(text)
+        if cols.size == 0 or k <= 0:
+            return []
+        cols, weights = self._selective(cols, weights)
+        # score only the docs named in the selected postings, never the whole catalog
+        spans = [(self._indptr[c], self._indptr[c + 1]) for c in cols]
+        rows = np.concatenate([self._indices[lo:hi] for lo, hi in spans])
+        vals = np.concatenate([self._data[lo:hi] * w for (lo, hi), w in zip(spans, weights)])
+        docs, inverse = np.unique(rows, return_inverse=True)
+        scores = np.bincount(inverse, weights=vals)
+        k = min(k, docs.size)
+        if k == 0:
+            return []
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.lexsort((docs[best], -scores[best]))]  # score desc, then doc id
+        return [(int(docs[i]), float(scores[i])) for i in best]
+
+    def match(self, text: str, descriptions: DescriptionLookup, *, k: int = 10,
+              candidates: int = 50) -> List[Tuple[int, float]]:
+        """Vector top-`candidates`, then rerank those with the RapidFuzz composite score."""
+        query = normalize(text)
+        pool = self.top_k(text, candidates)
+        scored = [(doc_id, composite_score(normalize(descriptions[doc_id]), query))
+                  for doc_id, _ in pool]
+        scored.sort(key=lambda t: t[1], reverse=True)
+        return scored[:k]
+
+    # --- Persistence ---------------------------------------------------------------------------
+
+    def save(self, directory: str | Path) -> None:
+        d = Path(directory)
+        d.mkdir(parents=True, exist_ok=True)
+        np.save(d / "indptr.npy", self._indptr)
+        np.save(d / "indices.npy", self._indices)
+        np.save(d / "data.npy", self._data)
+        np.save(d / "idf.npy", self._idf)
+        meta = {"format": MATRIX_FORMAT, "n": self._n, "num_docs": self._num_docs,
+                "vocab": self._vocab}
+        (d / "ngram_meta.json").write_text(json.dumps(meta), encoding="utf-8")
+
+    @classmethod
+    def load(cls, directory: str | Path) -> "NgramMatcher":
+        """Load with the postings arrays memory-mapped read-only."""
+        d = Path(directory)
+        meta = json.loads((d / "ngram_meta.json").read_text(encoding="utf-8"))
+        if meta.get("format") != MATRIX_FORMAT:
+            raise ValueError(f"Unsupported n-gram matrix format: {meta.get('format')!r}")
+        return cls(
+            n=int(meta["n"]),
+            vocab=meta["vocab"],
+            idf=np.load(d / "idf.npy"),
+            indptr=np.load(d / "indptr.npy", mmap_mode="r"),
+            indices=np.load(d / "indices.npy", mmap_mode="r"),
+            data=np.load(d / "data.npy", mmap_mode="r"),
+            num_docs=int(meta["num_docs"]),
+        )
+
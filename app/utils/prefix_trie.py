@@ -0,0 +1,133 @@
+from typing import Dict, List, Optional, Tuple
+
+
+class _Term:
+    __slots__ = ("display", "weight")
+
+    def __init__(self, display: str, weight: float):
+        self.display = display
+        self.weight = weight
+
+
+def _rank(term: _Term) -> Tuple[float, int, str]:
+    return -term.weight, len(term.display), term.display
+
+
+class _Node:
+    __slots__ = ("edges", "term", "top")
+
+    def __init__(self):
+        self.edges: Dict[str, Tuple[str, "_Node"]] = {}  # first char -> (edge label, child)
+        self.term: Optional[_Term] = None
+        self.top: List[_Term] = []  # best `top_k` terms in this subtree, ranked
+
+
+def _common_prefix_len(a: str, b: str) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+class PrefixTrie:
+    """
+    Compressed (radix) prefix trie of weighted terms. Every node caches the `top_k` best terms
+    of its subtree, so a lookup is a walk down the prefix and a slice: no subtree scan.
+
+    Weights only ever grow, which keeps the cached lists exact: a term that falls out of a
+    node's list can only come back by being re-weighted, and that re-checks every node on its
+    path. Not thread-safe; the app only touches it from the event loop.
+    """
+
+    def __init__(self, *, top_k: int = 10, max_terms: int = 0):
+        self._root = _Node()
+        self._top_k = top_k
+        self._max_terms = max_terms  # 0 = unbounded
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: str) -> bool:
+        node = self._find(key, exact=True)
+        return node is not None and node.term is not None
+
+    def add(self, key: str, weight: float = 1.0, *, display: Optional[str] = None,
+            only_new: bool = False) -> bool:
+        """
+        Add `weight` to `key` (inserting it if needed). With `only_new`, an existing key is left
+        as it is. Returns False when nothing changed (existing key with `only_new`, or the trie
+        is full).
+        """
+        if not key:
+            return False
+        node, path, rest = self._root, [self._root], key
+        while rest:
+            edge = node.edges.get(rest[0])
+            if edge is None:
+                if self._full():
+                    return False
+                child = _Node()
+                node.edges[rest[0]] = (rest, child)
+                path.append(child)
+                node, rest = child, ""
+                break
+            label, child = edge
+            common = _common_prefix_len(label, rest)
+            if common < len(label):
+                if self._full():
+                    return False
+                # split the edge; the new middle node covers exactly the child's subtree
+                mid = _Node()
+                mid.edges[label[common]] = (label[common:], child)
+                mid.top = list(child.top)
+                node.edges[rest[0]] = (label[:common], mid)
+                child = mid
+            path.append(child)
+            node, rest = child, rest[common:]
+
+        term = node.term
+        if term is None:
+            if self._full():
+                return False
+            term = node.term = _Term(display or key, weight)
+            self._size += 1
+        elif only_new:
+            return False
+        else:
+            term.weight += weight
+
+        for n in path:
+            top = n.top
+            if term not in top:
+                if len(top) >= self._top_k and _rank(term) >= _rank(top[-1]):
+                    continue
+                top.append(term)
+            top.sort(key=_rank)
+            del top[self._top_k:]
+        return True
+
+    def _full(self) -> bool:
+        return bool(self._max_terms) and self._size >= self._max_terms
+
+    def _find(self, prefix: str, *, exact: bool = False) -> Optional[_Node]:
+        node, rest = self._root, prefix
+        while rest:
+            edge = node.edges.get(rest[0])
+            if edge is None:
+                return None
+            label, child = edge
+            if not exact and label.startswith(rest):
+                return child  # prefix ends inside this edge
+            if not rest.startswith(label):
+                return None
+            node, rest = child, rest[len(label):]
+        return node
+
+    def top(self, prefix: str, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """(display, weight) of the best terms starting with `prefix`, best first."""
+        node = self._find(prefix)
+        if node is None:
+            return []
+        return [(t.display, t.weight) for t in node.top[:limit]]
@@ -0,0 +1,169 @@
+import json
+import sys
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+from rapidfuzz.distance import OSA
+from app.core.config import get_settings
+from app.utils.calorie_estimation_utils import normalize
+
+# Bump when the on-disk layout changes so stale indexes are rejected instead of misread.
+INDEX_FORMAT = 1
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """All strings reachable from `word` by removing up to `max_distance` characters."""
+    out = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        nxt = set()
+        for w in frontier:
+            if len(w) <= 1:
+                continue
+            for i in range(len(w)):
+                nxt.add(w[:i] + w[i + 1:])
+        nxt -= out
+        out |= nxt
+        frontier = nxt
+    return out
+
+
+class SymSpellIndex:
+    """
+    Symmetric-delete spelling corrector over a food vocabulary.
+
+    Every vocabulary word is expanded into its deletes up front, so a lookup only has to
+    generate the deletes of the query token and verify the few words that share one.
+    """
+
+    def __init__(self, *, max_edit_distance: int = 2, min_token_length: int = 5):
+        self._max_distance = max_edit_distance
+        self._min_length = min_token_length
+        self._words: Dict[str, int] = {}
+        self._deletes: Dict[str, List[str]] = {}
+
+    @property
+    def max_edit_distance(self) -> int:
+        return self._max_distance
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __contains__(self, word: object) -> bool:
+        return word in self._words
+
+    def add(self, word: str, count: int = 1) -> None:
+        if not word or not word.isalpha():
+            return
+        if word not in self._words:
+            for d in _deletes(word, self._max_distance):
+                self._deletes.setdefault(d, []).append(word)
+        self._words[word] = self._words.get(word, 0) + count
+
+    def _allowed_distance(self, token: str) -> int:
+        # short words have too many neighbours to correct more than one edit safely
+        return min(self._max_distance, 1 if len(token) < 6 else 2)
+
+    def lookup(self, token: str) -> str:
+        """Return the best in-vocabulary correction for `token`, or `token` unchanged."""
+        if token in self._words or len(token) < self._min_length or not token.isalpha():
+            return token
+
+        max_d = self._allowed_distance(token)
+        candidates: Set[str] = set()
+        for d in _deletes(token, max_d):
+            candidates.update(self._deletes.get(d, ()))
+
+        best: Optional[tuple] = None
+        for cand in candidates:
+            if abs(len(cand) - len(token)) > max_d:
+                continue
+            dist = OSA.distance(token, cand, score_cutoff=max_d)
+            if dist > max_d:
+                continue
+            key = (dist, -self._words[cand], cand)
+            if best is None or key < best:
+                best = key
+        return best[2] if best else token
+
+    def correct(self, text: str) -> str:
+        """Normalize `text` and replace each out-of-vocabulary token with its best correction."""
+        return " ".join(self.lookup(t) for t in normalize(text).split())
+
+    # --- Construction / serialization ---------------------------------------------------------
+
+    @classmethod
+    def from_descriptions(cls, descriptions: Iterable[str], **kwargs) -> "SymSpellIndex":
+        """Build an index whose word frequencies come from normalized food descriptions."""
+        counts: Counter[str] = Counter()
+        for desc in descriptions:
+            counts.update(normalize(desc).split())
+        index = cls(**kwargs)
+        for word, count in counts.items():
+            index.add(word, count)
+        return index
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "format": INDEX_FORMAT,
+            "max_edit_distance": self._max_distance,
+            "min_token_length": self._min_length,
+            "words": self._words,
+            "deletes": self._deletes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "SymSpellIndex":
+        if data.get("format") != INDEX_FORMAT:
+            raise ValueError(f"Unsupported spell index format: {data.get('format')!r}")
+        index = cls(
+            max_edit_distance=int(data["max_edit_distance"]),  # type: ignore[arg-type]
+            min_token_length=int(data["min_token_length"]),  # type: ignore[arg-type]
+        )
+        # the delete map is stored precomputed so loading is a single JSON parse
+        index._words = dict(data["words"])  # type: ignore[arg-type]
+        index._deletes = dict(data["deletes"])  # type: ignore[arg-type]
+        return index
+
+    def save(self, path: str | Path) -> None:
+        Path(path).write_text(json.dumps(self.to_dict(), separators=(",", ":")), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SymSpellIndex":
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+@lru_cache
+def get_spell_index() -> Optional[SymSpellIndex]:
+    """
+    The configured index, or None when correction is off. A vocabulary that misses real foods
+    rewrites them into other foods (risotto -> ricotta), so correction only runs against an
+    index built from USDA descriptions and never falls back to a small built-in word list.
+    """
+    s = get_settings()
+    if not s.SPELL_CORRECTION_ENABLED or not s.SPELL_INDEX_PATH:
+        return None
+    return SymSpellIndex.load(s.SPELL_INDEX_PATH)
+
+
+def correct_query(text: str) -> str:
+    """Spell-correct a user query when a spell index is configured; otherwise return it as-is."""
+    index = get_spell_index()
+    if index is None:
+        return text
+    return index.correct(text)
+
+
+if __name__ == "__main__":
+    # Build an index from a file with one food description per line:
+    #   python -m app.utils.spell_correction descriptions.txt spell_index.json
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m app.utils.spell_correction <descriptions.txt> <index.json>")
+    with open(sys.argv[1], encoding="utf-8") as fh:
+        built = SymSpellIndex.from_descriptions(
+            (line for line in fh if line.strip()),
+            max_edit_distance=get_settings().SPELL_MAX_EDIT_DISTANCE,
+        )
+    built.save(sys.argv[2])
+    print(f"indexed {len(built)} words -> {sys.argv[2]}")
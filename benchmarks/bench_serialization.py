@@ -0,0 +1,82 @@
+"""
+JSON vs MessagePack for the calories payloads: serialization cost and payload size.
+
+    python -m benchmarks.bench_serialization [--number 20000]
+
+Server side measures the code paths the endpoints use (`encode` for responses,
+`model_validate_json` vs `model_validate(msgpack.unpackb(...))` for request bodies); client
+side is plain `json` vs `msgpack` on dicts. "batch" is 1,000 bulk-job result rows.
+"""
+import argparse
+import json
+import timeit
+from typing import Callable, List, Tuple
+import msgpack
+from app.core.content_negotiation import JSON, MSGPACK, encode
+from app.schemas.calories import CaloriesEstimate, CaloriesIn
+from app.schemas.jobs import MealLogRowResult
+
+REQUEST = CaloriesIn(dish_name="grilled chicken caesar salad", servings=2)
+RESPONSE = CaloriesEstimate(
+    dish_name="grilled chicken caesar salad",
+    servings=2.0,
+    calories_per_serving=412.5,
+    total_calories=825.0,
+    basis="per serving (label)",
+    ingredients=["romaine lettuce", "chicken breast", "parmesan cheese", "croutons",
+                 "caesar dressing", "lemon juice", "black pepper"],
+)
+BATCH = [
+    MealLogRowResult(row=i, dish_name="grilled salmon", servings=1.5, calories_per_serving=234.0,
+                     total_calories=351.0, basis="per serving (label)").model_dump(mode="json")
+    for i in range(1, 1001)
+]
+
+
+def _time(fn: Callable[[], object], number: int) -> float:
+    """Best of 5 runs, in microseconds per call."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def run(number: int) -> List[Tuple[str, float, float, int, int]]:
+    req_json, req_mp = REQUEST.model_dump_json().encode(), msgpack.packb(REQUEST.model_dump())
+    resp = RESPONSE.model_dump(mode="json")
+    batch_json = b"".join(json.dumps(r, separators=(",", ":")).encode() + b"\n" for r in BATCH)
+    batch_mp = b"".join(msgpack.packb(r) for r in BATCH)
+    batch_n = max(1, number // 1000)
+    return [
+        ("server: encode response", _time(lambda: encode(RESPONSE, JSON), number),
+         _time(lambda: encode(RESPONSE, MSGPACK), number),
+         len(encode(RESPONSE, JSON)), len(encode(RESPONSE, MSGPACK))),
+        ("server: parse request", _time(lambda: CaloriesIn.model_validate_json(req_json), number),
+         _time(lambda: CaloriesIn.model_validate(msgpack.unpackb(req_mp)), number),
+         len(req_json), len(req_mp)),
+        ("client: encode request", _time(lambda: json.dumps(REQUEST.model_dump()), number),
+         _time(lambda: msgpack.packb(REQUEST.model_dump()), number), len(req_json), len(req_mp)),
+        ("client: decode response", _time(lambda: json.loads(encode(RESPONSE, JSON)), number),
+         _time(lambda: msgpack.unpackb(encode(RESPONSE, MSGPACK)), number),
+         len(json.dumps(resp)), len(msgpack.packb(resp))),
+        ("client: decode batch (1k rows)",
+         _time(lambda: [json.loads(line) for line in batch_json.splitlines()], batch_n),
+         _time(lambda: _unpack_all(batch_mp), batch_n),
+         len(batch_json), len(batch_mp)),
+    ]
+
+
+def _unpack_all(data: bytes) -> list:
+    unpacker = msgpack.Unpacker(raw=False)
+    unpacker.feed(data)
+    return list(unpacker)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="calls per timing run")
+    args = parser.parse_args()
+    print(f"{'case':<32}{'json us':>10}{'msgpack us':>12}{'json B':>10}{'msgpack B':>11}{'size':>8}")
+    for name, t_json, t_mp, n_json, n_mp in run(args.number):
+        print(f"{name:<32}{t_json:>10.2f}{t_mp:>12.2f}{n_json:>10}{n_mp:>11}{n_mp / n_json:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
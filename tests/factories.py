@@ -5,7 +5,9 @@ from app.core.security import hash_password
 class FakeUSDAClient:
     def __init__(self, data: Mapping[str, Any] | None = None, err: Exception | None = None):
         self._data, self._err = data or {"foods": []}, err
+        self.queries: list[str] = []
     async def search(self, query: str, *, page_size: Optional[int] = None) -> Mapping[str, Any]:
+        self.queries.append(query)
         if self._err: raise self._err
         return self._data
 
@@ -16,3 +16,33 @@ def test_register_with_duplicate_email(client):
         "first_name":"A","last_name":"B","email":"testduplicate@example.com","password":"pass12345"
     })
     assert r.status_code in (400,409)
+
+def _login(client, email):
+    client.post("/auth/register", json={
+        "first_name":"A","last_name":"B","email":email,"password":"pass12345"
+    })
+    r = client.post("/auth/login", json={"email":email,"password":"pass12345"})
+    assert r.status_code == 200
+    return r.json()
+
+def test_refresh_rotates_and_rejects_reuse(client):
+    tokens = _login(client, "refresh@example.com")
+    r = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert r.status_code == 200
+    rotated = r.json()
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+    r2 = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert r2.status_code == 401
+    # an access token is not accepted as a refresh token
+    r3 = client.post("/auth/refresh", json={"refresh_token": rotated["access_token"]})
+    assert r3.status_code == 401
+
+def test_logout_revokes_access_token(client):
+    tokens = _login(client, "logout@example.com")
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    assert client.get("/meals", headers=headers).status_code == 200
+    r = client.post("/auth/logout", headers=headers, json={"refresh_token": tokens["refresh_token"]})
+    assert r.status_code == 204
+    assert client.get("/meals", headers=headers).status_code == 401
+    r = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert r.status_code == 401
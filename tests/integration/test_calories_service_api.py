@@ -114,3 +114,87 @@ def test_get_calories_usda_error_with_status_503(client):
         assert resp.status_code == 503
     finally:
         _clear_overrides()
+
+
+def test_get_calories_cacheable_etag_and_304(client):
+    try:
+        foods = {"foods": [usda_food(description="Grilled Salmon",
+                                     labelNutrients={"calories": {"value": 233}})]}
+        _use_fake_service(foods)
+        resp = client.get("/calories", params={"dish": "Griled  Salmon!", "servings": 2})
+        assert resp.status_code == 200
+        assert resp.json()["dish_name"] == "grilled salmon"
+        assert resp.json()["total_calories"] == 466.0
+        etag = resp.headers["etag"]
+        assert etag.startswith('"') and resp.headers["cache-control"].startswith("public, max-age=")
+
+        # a different spelling of the same dish revalidates against the same ETag
+        resp2 = client.get("/calories", params={"dish": "grilled salmon", "servings": 2},
+                           headers={"If-None-Match": etag})
+        assert resp2.status_code == 304
+        assert resp2.headers["etag"] == etag and not resp2.content
+
+        resp3 = client.get("/calories", params={"dish": "grilled salmon", "servings": 3},
+                           headers={"If-None-Match": etag})
+        assert resp3.status_code == 200
+    finally:
+        _clear_overrides()
+
+
+def test_get_calories_cacheable_not_found(client):
+    try:
+        _use_fake_service({"foods": []})
+        resp = client.get("/calories", params={"dish": "non-existing-dish"})
+        assert resp.status_code == 404
+    finally:
+        _clear_overrides()
+
+
+def test_get_calories_overloaded_returns_503_with_retry_after(client):
+    from app.core.admission import Overloaded
+    try:
+        _use_fake_service(err=Overloaded(retry_after_s=4))
+        resp = client.post("/get-calories", json={"dish_name": "x", "servings": 1})
+        assert resp.status_code == 503
+        assert resp.headers["retry-after"] == "4"
+    finally:
+        _clear_overrides()
+
+
+def test_get_calories_msgpack_request_and_response(client):
+    import msgpack
+    salmon = {"foods": [usda_food(description="Grilled Salmon")]}
+    try:
+        _use_fake_service(salmon)
+        body = msgpack.packb({"dish_name": "grilled salmon", "servings": 2})
+        resp = client.post("/get-calories", content=body, headers={
+            "Content-Type": "application/msgpack", "Accept": "application/msgpack"})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/msgpack"
+        as_msgpack = msgpack.unpackb(resp.content)
+
+        resp_json = client.post("/get-calories", json={"dish_name": "grilled salmon", "servings": 2},
+                                headers={"Accept": "application/json, application/msgpack;q=0.5"})
+        assert resp_json.headers["content-type"] == "application/json"
+        assert resp_json.json() == as_msgpack
+
+        bad = client.post("/get-calories", content=msgpack.packb({"dish_name": "x", "servings": 0}),
+                          headers={"Content-Type": "application/msgpack"})
+        assert bad.status_code == 422 and bad.json()["detail"][0]["loc"] == ["body", "servings"]
+        not_utf8 = client.post("/get-calories",
+                               content=msgpack.packb({"dish_name": b"\xff\xfe", "servings": 1}),
+                               headers={"Content-Type": "application/msgpack"})
+        assert not_utf8.status_code == 422
+        assert not_utf8.json()["detail"][0]["loc"] == ["body", "dish_name"]
+        garbled = client.post("/get-calories", content=b"\xc1",
+                              headers={"Content-Type": "application/msgpack"})
+        assert garbled.status_code == 400
+
+        get_json = client.get("/calories", params={"dish": "grilled salmon"})
+        get_mp = client.get("/calories", params={"dish": "grilled salmon"},
+                            headers={"Accept": "application/msgpack"})
+        assert msgpack.unpackb(get_mp.content) == get_json.json()
+        assert get_mp.headers["etag"] != get_json.headers["etag"]
+        assert "Accept" in get_mp.headers["vary"]
+    finally:
+        _clear_overrides()
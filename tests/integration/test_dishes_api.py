@@ -0,0 +1,29 @@
+from app.main import app
+from app.controllers.calories import get_service
+from app.services.calorie_service import CalorieService
+from app.services.dish_suggestion_service import DishSuggester, get_dish_suggester
+from tests.factories import FakeUSDAClient, usda_food
+
+
+def test_suggest_learns_from_resolved_dishes_without_calling_usda(client):
+    suggester = DishSuggester(max_terms=1000)
+    suggester.add_aliases()
+    fake = FakeUSDAClient({"foods": [usda_food(description="Paneer Tikka Masala")]})
+    app.dependency_overrides[get_dish_suggester] = lambda: suggester
+    app.dependency_overrides[get_service] = lambda: CalorieService(fake, suggester)
+    try:
+        assert client.get("/dishes/suggest", params={"prefix": "pan"}).json()["suggestions"] == []
+        assert client.post("/get-calories", json={"dish_name": "paneer tikka masala",
+                                                  "servings": 1}).status_code == 200
+
+        resp = client.get("/dishes/suggest", params={"prefix": "Paneer t"})
+        assert resp.status_code == 200
+        assert resp.json() == {"prefix": "Paneer t", "suggestions": ["Paneer Tikka Masala"]}
+        assert client.get("/dishes/suggest", params={"prefix": "fett"}).json()["suggestions"] == [
+            "fettuccine alfredo"
+        ]
+        assert len(fake.queries) == 1
+        assert client.get("/dishes/suggest").status_code == 422
+    finally:
+        app.dependency_overrides.pop(get_dish_suggester, None)
+        app.dependency_overrides.pop(get_service, None)
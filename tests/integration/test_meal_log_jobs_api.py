@@ -0,0 +1,119 @@
+import json
+import threading
+import msgpack
+import pytest
+from app.main import app
+from app.controllers.jobs import get_bulk_service
+from app.services.calorie_service import CalorieService
+from app.services import meal_log_job_service as jobs_module
+from app.services.meal_log_job_service import (MealLogJobService, TooManyActiveJobs,
+                                               get_job_service)
+from tests.factories import FakeUSDAClient, usda_food
+
+
+@pytest.fixture()
+def fake_usda(tmp_path):
+    fake = FakeUSDAClient({"foods": [usda_food(description="Grilled Salmon",
+                                                labelNutrients={"calories": {"value": 200}})]})
+    jobs = MealLogJobService(workdir=str(tmp_path), concurrency=2)
+    app.dependency_overrides[get_bulk_service] = lambda: CalorieService(fake)
+    app.dependency_overrides[get_job_service] = lambda: jobs
+    yield fake
+    app.dependency_overrides.pop(get_bulk_service, None)
+    app.dependency_overrides.pop(get_job_service, None)
+
+
+def test_csv_job_dedupes_dishes_and_streams_ndjson(client, fake_usda):
+    body = "dish_name,servings\ngrilled salmon,2\nGrilled  Salmon!,1\n,3\ngrilled salmon,\n"
+    r = client.post("/jobs/meal-logs", content=body, headers={"Content-Type": "text/csv"})
+    assert r.status_code == 202
+    job_id = r.json()["id"]
+
+    status = client.get(f"/jobs/{job_id}").json()
+    assert status["status"] == "completed"
+    assert status["rows_read"] == 4 and status["rows_failed"] == 1
+    assert status["dishes_total"] == 1
+    assert len(fake_usda.queries) == 1
+
+    r = client.get(f"/jobs/{job_id}/results")
+    rows = [json.loads(line) for line in r.text.splitlines()]
+    assert [row["total_calories"] for row in rows] == [400.0, 200.0, None, 200.0]
+    assert rows[2]["error"] == "Invalid row"
+
+
+def test_ndjson_job_results_as_csv(client, fake_usda):
+    body = '{"dish_name": "grilled salmon", "servings": 1.5}\n\n{"dish_name": "grilled salmon"}\n'
+    r = client.post("/jobs/meal-logs", content=body,
+                    headers={"Content-Type": "application/x-ndjson"})
+    job_id = r.json()["id"]
+    r = client.get(f"/jobs/{job_id}/results", params={"format": "csv"})
+    assert r.status_code == 200
+    lines = r.text.strip().splitlines()
+    assert lines[0].startswith("row,dish_name,servings")
+    assert len(lines) == 3
+
+
+def test_msgpack_job_round_trip(client, fake_usda):
+    rows = [{"dish_name": "grilled salmon", "servings": 2}, {"dish_name": "grilled salmon"}, [1, 2]]
+    body = b"".join(msgpack.packb(r) for r in rows) + b"\xc1"  # trailing byte is corrupt
+    r = client.post("/jobs/meal-logs", content=body, headers={"Content-Type": "application/msgpack"})
+    assert r.status_code == 202
+    job_id = r.json()["id"]
+    assert client.get(f"/jobs/{job_id}").json()["rows_failed"] == 2
+
+    r = client.get(f"/jobs/{job_id}/results", params={"format": "msgpack"})
+    assert r.headers["content-type"] == "application/msgpack"
+    unpacker = msgpack.Unpacker(raw=False)
+    unpacker.feed(r.content)
+    results = list(unpacker)
+    assert [row["total_calories"] for row in results] == [400.0, 200.0, None, None]
+    assert results[3]["error"] == "Invalid row"
+
+
+def test_unsupported_upload_type_is_415(client, fake_usda):
+    r = client.post("/jobs/meal-logs", content="{}", headers={"Content-Type": "application/json"})
+    assert r.status_code == 415
+
+
+def test_unknown_job_is_404(client):
+    assert client.get("/jobs/nope").status_code == 404
+
+
+async def test_row_passes_run_off_the_event_loop(tmp_path, monkeypatch):
+    loop_thread = threading.get_ident()
+    seen = set()
+
+    def _key(dish_name):
+        seen.add(threading.get_ident())
+        return dish_name.lower()
+
+    monkeypatch.setattr(jobs_module, "canonical_dish_key", _key)
+    fake = FakeUSDAClient({"foods": [usda_food(description="Grilled Salmon",
+                                                labelNutrients={"calories": {"value": 200}})]})
+    jobs = MealLogJobService(workdir=str(tmp_path))
+
+    async def _chunks():
+        yield b"dish_name\ngrilled salmon\n"
+
+    job = await jobs.create(_chunks(), "csv")
+    await jobs.run(job, CalorieService(fake))
+    assert job.status.status == "completed" and job.status.rows_written == 1
+    assert seen and loop_thread not in seen
+
+
+async def test_active_jobs_are_never_evicted(tmp_path):
+    jobs = MealLogJobService(workdir=str(tmp_path), max_retained=1)
+
+    async def _chunks():
+        yield b"dish_name\ngrilled salmon\n"
+
+    queued = await jobs.create(_chunks(), "csv")
+    with pytest.raises(TooManyActiveJobs):
+        await jobs.create(_chunks(), "csv")
+    assert jobs.get(queued.id) is queued and queued.input_path.exists()
+
+    fake = FakeUSDAClient({"foods": [usda_food(description="Grilled Salmon",
+                                                labelNutrients={"calories": {"value": 200}})]})
+    await jobs.run(queued, CalorieService(fake))
+    newer = await jobs.create(_chunks(), "csv")  # the finished job now makes room
+    assert jobs.get(queued.id) is None and jobs.get(newer.id) is newer
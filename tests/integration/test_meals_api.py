@@ -0,0 +1,104 @@
+import uuid
+import pytest
+from app.main import app
+from app.controllers.calories import get_service
+from app.core.security import create_access_token
+from app.services.calorie_service import CalorieService
+from tests.factories import FakeUSDAClient, make_user, usda_food
+
+
+@pytest.fixture()
+def auth_headers(db_session):
+    user = make_user(db_session, email=f"meals-{uuid.uuid4().hex[:8]}@example.com")
+    return {"Authorization": f"Bearer {create_access_token(str(user.id))}"}
+
+
+@pytest.fixture()
+def fake_service():
+    foods = {"foods": [usda_food(description="Grilled Salmon",
+                                 labelNutrients={"calories": {"value": 200}})]}
+    app.dependency_overrides[get_service] = lambda: CalorieService(FakeUSDAClient(foods))
+    yield
+    app.dependency_overrides.pop(get_service, None)
+
+
+def test_meals_require_auth(client):
+    assert client.get("/meals").status_code == 401
+    assert client.get("/meals", headers={"Authorization": "Bearer nope"}).status_code == 401
+
+
+def test_log_list_delete_and_summaries(client, auth_headers, fake_service):
+    r = client.post("/meals", headers=auth_headers,
+                    json={"dish_name": "grilled salmon", "servings": 2,
+                          "eaten_at": "2024-05-06T12:00:00Z"})
+    assert r.status_code == 201
+    salmon = r.json()
+    assert salmon["total_calories"] == 400.0
+
+    for hour in (8, 19):
+        r = client.post("/meals", headers=auth_headers,
+                        json={"dish_name": "toast", "servings": 1, "total_calories": 100,
+                              "eaten_at": f"2024-05-06T{hour:02d}:00:00Z"})
+        assert r.status_code == 201
+
+    r = client.get("/meals/summary/daily", headers=auth_headers, params={"day": "2024-05-06"})
+    assert r.json() == {"day": "2024-05-06", "total_calories": 600.0, "entry_count": 3}
+
+    page = client.get("/meals", headers=auth_headers, params={"limit": 2}).json()
+    assert [m["dish_name"] for m in page["items"]] == ["toast", "grilled salmon"]
+    page2 = client.get("/meals", headers=auth_headers,
+                       params={"limit": 2, "cursor": page["next_cursor"]}).json()
+    assert len(page2["items"]) == 1 and page2["next_cursor"] is None
+
+    assert client.delete(f"/meals/{salmon['id']}", headers=auth_headers).status_code == 204
+    assert client.delete(f"/meals/{salmon['id']}", headers=auth_headers).status_code == 404
+
+    week = client.get("/meals/summary/weekly", headers=auth_headers,
+                      params={"start": "2024-05-05"}).json()
+    assert week["total_calories"] == 200.0 and week["entry_count"] == 2
+    assert [d["total_calories"] for d in week["days"]][:2] == [0.0, 200.0]
+
+
+def test_bad_cursor_is_400(client, auth_headers):
+    r = client.get("/meals", headers=auth_headers, params={"cursor": "!!!"})
+    assert r.status_code == 400
+
+
+class MenuClient:
+    """Fake search that only knows a few foods (everything else: no results)."""
+    def __init__(self, menu):
+        self.menu, self.queries = menu, []
+    async def search(self, query, *, page_size=None):
+        self.queries.append(query)
+        kcal = self.menu.get(query.lower())
+        desc = query.title()
+        return {"foods": [usda_food(description=desc, labelNutrients={"calories": {"value": kcal}})]
+                if kcal else []}
+
+
+def test_estimate_free_text_meal_dedupes_items(client):
+    menu = MenuClient({"eggs": 70, "toast": 80, "orange juice": 110})
+    app.dependency_overrides[get_service] = lambda: CalorieService(menu)
+    try:
+        r = client.post("/meals/estimate", json={
+            "text": "2 eggs, 1 slice toast and a cup of orange juice; 1 egg + 2 Eggs, moon cheese"
+        })
+    finally:
+        app.dependency_overrides.pop(get_service, None)
+    assert r.status_code == 200
+    body = r.json()
+    assert [(i["dish_name"], i["quantity"], i["total_calories"]) for i in body["items"]] == [
+        ("eggs", 2.0, 140.0), ("toast", 1.0, 80.0), ("orange juice", 1.0, 110.0),
+        ("egg", 1.0, None), ("Eggs", 2.0, 140.0), ("moon cheese", 1.0, None),
+    ]
+    assert body["items"][1]["unit"] == "slice"
+    assert body["items"][5]["error"] == "Dish not found"
+    assert body["total_calories"] == 470.0 and body["unresolved"] == 2
+    assert sorted(q.lower() for q in menu.queries) == ["egg", "eggs", "moon cheese", "orange juice", "toast"]
+
+
+def test_estimate_rejects_too_many_items(client):
+    r = client.post("/meals/estimate", json={"text": ", ".join(["toast"] * 21)})
+    assert r.status_code == 422
+    for text in ("3 1/0 cups rice", "9" * 400 + " eggs"):
+        assert client.post("/meals/estimate", json={"text": text}).status_code == 422
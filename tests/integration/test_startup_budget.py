@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative import time allowed for `app.main`, in ms. Most of it is FastAPI/Pydantic itself;
+# override with IMPORT_TIME_BUDGET_MS on slow CI machines.
+IMPORT_TIME_BUDGET_MS = int(os.environ.get("IMPORT_TIME_BUDGET_MS", "2500"))
+
+
+def _import_app(*args: str, **env: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", "import app.main"],
+        cwd=ROOT, env={**os.environ, **env}, capture_output=True, text=True, timeout=60,
+    )
+
+
+def test_import_does_not_build_engine():
+    # psycopg is not needed (or installed) for tests, so an eager create_engine would fail here
+    proc = _import_app(DATABASE_URL="postgresql+psycopg://nobody@localhost:1/nowhere")
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_import_time_within_budget():
+    proc = _import_app("-X", "importtime")
+    assert proc.returncode == 0, proc.stderr
+    line = next(ln for ln in proc.stderr.splitlines() if ln.rstrip().endswith("| app.main"))
+    cumulative_us = int(line.split("|")[1])
+    assert cumulative_us / 1000 < IMPORT_TIME_BUDGET_MS, line
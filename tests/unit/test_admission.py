@@ -0,0 +1,45 @@
+import asyncio
+import pytest
+from app.adapters.http.admitted_search import AdmittedFoodSearchClient
+from app.core.admission import AdmissionController, Overloaded
+
+
+class SlowClient:
+    def __init__(self, hits=()):
+        self.hits, self.release, self.calls = set(hits), asyncio.Event(), 0
+    def cached(self, query, *, page_size=None):
+        return {"foods": ["cached"]} if query in self.hits else None
+    async def search(self, query, *, page_size=None):
+        self.calls += 1
+        await self.release.wait()
+        return {"foods": []}
+
+
+@pytest.mark.anyio
+async def test_sheds_when_queue_is_full_but_cache_hits_pass():
+    inner = SlowClient(hits={"hot"})
+    client = AdmittedFoodSearchClient(
+        inner, AdmissionController(max_in_flight=1, max_queue=1, queue_timeout_s=5, retry_after_s=3)
+    )
+    running = asyncio.create_task(client.search("a"))
+    queued = asyncio.create_task(client.search("b"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(Overloaded) as exc:
+        await client.search("c")
+    assert exc.value.retry_after_s == 3
+    assert await client.search("hot") == {"foods": ["cached"]}
+
+    inner.release.set()
+    await asyncio.gather(running, queued)
+    assert inner.calls == 2
+
+
+@pytest.mark.anyio
+async def test_queued_request_times_out():
+    adm = AdmissionController(max_in_flight=1, max_queue=5, queue_timeout_s=0.01, retry_after_s=1)
+    async with adm.slot():
+        with pytest.raises(Overloaded):
+            async with adm.slot():
+                pass
+    assert adm.in_flight == 0 and adm.waiting == 0
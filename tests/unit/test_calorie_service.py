@@ -21,3 +21,37 @@ async def test_usda_error():
     svc = CalorieService(FakeUSDAClient(err=USDAError("boom")))
     with pytest.raises(USDAError):
         await svc.calculate(dish_name="x", servings=1)
+
+class DetailsClient(FakeUSDAClient):
+    """Fake search + /foods details, recording each batched details call."""
+    def __init__(self, data, details):
+        super().__init__(data)
+        self.details, self.detail_calls = details, []
+    async def foods(self, fdc_ids):
+        self.detail_calls.append(list(fdc_ids))
+        return {i: self.details[i] for i in fdc_ids if i in self.details}
+
+def _branded(fdc_id, description="Chicken Salad"):
+    return {"fdcId": fdc_id, "description": description, "dataType": "Branded",
+            "foodNutrients": [{"nutrientName": "Protein", "unitName": "G", "value": 12}]}
+
+@pytest.mark.anyio
+async def test_missing_energy_recovered_from_one_batched_details_call():
+    hits = {"foods": [_branded(1), _branded(2), _branded(3, "Chicken Salad Kit")]}
+    details = {2: {"fdcId": 2, "servingSize": 150, "servingSizeUnit": "g",
+                   "foodNutrients": [{"nutrient": {"name": "Energy", "unitName": "kcal"},
+                                      "amount": 180}]}}
+    client = DetailsClient(hits, details)
+    out = await CalorieService(client).calculate(dish_name="chicken salad", servings=2)
+    assert client.detail_calls == [[1, 2, 3]]
+    assert out.calories_per_serving == 270.0  # 180 kcal/100 g * 150 g
+    assert out.basis == "per serving (derived from per 100 g)"
+
+@pytest.mark.anyio
+async def test_missing_energy_without_details_is_still_lookup_error():
+    client = DetailsClient({"foods": [_branded(1)]}, {})
+    with pytest.raises(LookupError, match="Energy not found"):
+        await CalorieService(client).calculate(dish_name="chicken salad", servings=1)
+    with pytest.raises(LookupError, match="Energy not found"):  # provider without /foods
+        await CalorieService(FakeUSDAClient({"foods": [_branded(1)]})).calculate(
+            dish_name="chicken salad", servings=1)
@@ -48,3 +48,10 @@ def test_composite_score_prefers_better_match():
     s_exact = util.composite_score(exact, qn)
     s_weak = util.composite_score(weak, qn)
     assert s_exact > s_weak
+
+def test_find_energy_kcal_from_food_details_formats():
+    full = {"foodNutrients": [{"nutrient": {"name": "Protein", "unitName": "g"}, "amount": 3},
+                              {"nutrient": {"name": "Energy", "unitName": "kcal"}, "amount": 95}]}
+    abridged = {"foodNutrients": [{"name": "Energy", "unitName": "KJ", "amount": 418.4}]}
+    assert util.find_energy_kcal(full) == (95.0, "per 100 g")
+    assert math.isclose(util.find_energy_kcal(abridged)[0], 100.0)
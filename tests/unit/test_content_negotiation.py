@@ -0,0 +1,22 @@
+import pytest
+from app.core.content_negotiation import JSON, MSGPACK, is_msgpack, preferred_media_type
+
+
+@pytest.mark.parametrize("accept,expected", [
+    (None, JSON),
+    ("*/*", JSON),
+    ("application/msgpack", MSGPACK),
+    ("application/x-msgpack, */*", MSGPACK),
+    ("application/json, application/msgpack;q=0.9", JSON),
+    ("application/json;q=0.5, application/vnd.msgpack", MSGPACK),
+    ("application/msgpack;q=0", JSON),
+    ("application/msgpack;q=oops, application/json", JSON),
+])
+def test_preferred_media_type(accept, expected):
+    assert preferred_media_type(accept) == expected
+
+
+def test_is_msgpack_ignores_parameters_and_case():
+    assert is_msgpack("Application/MsgPack; charset=binary")
+    assert not is_msgpack("application/json")
+    assert not is_msgpack(None)
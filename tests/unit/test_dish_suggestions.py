@@ -0,0 +1,110 @@
+import pytest
+from app.adapters.http.recorded_search import SearchRecordingStore
+from app.controllers import calories as calories_controller, jobs as jobs_controller
+from app.controllers.calories import get_service
+from app.controllers.jobs import get_bulk_service
+from app.services import dish_suggestion_service as suggestion_module
+from app.services.calorie_service import CalorieService
+from app.services.dish_suggestion_service import DishSuggester, get_dish_suggester
+from app.utils.prefix_trie import PrefixTrie
+from tests.factories import FakeUSDAClient, usda_food
+
+
+def test_trie_ranks_by_weight_and_splits_edges():
+    trie = PrefixTrie(top_k=3)
+    for key, w in [("chicken salad", 2), ("chicken curry", 5), ("chickpea stew", 1), ("chili", 1)]:
+        trie.add(key, w)
+    assert trie.top("chi") == [("chicken curry", 5), ("chicken salad", 2), ("chili", 1)]
+    assert trie.top("chick") == [("chicken curry", 5), ("chicken salad", 2), ("chickpea stew", 1)]
+    assert trie.top("chicken s") == [("chicken salad", 2)]
+    assert trie.top("x") == []
+    assert "chicken" not in trie and "chili" in trie
+
+    trie.add("chickpea stew", 10)  # re-weighting re-enters every cached list on its path
+    assert trie.top("chi")[0] == ("chickpea stew", 11)
+    assert not trie.add("chili", 5, only_new=True)
+    assert trie.top("chil") == [("chili", 1)]
+
+
+def test_trie_respects_max_terms():
+    trie = PrefixTrie(max_terms=2)
+    assert trie.add("rice") and trie.add("rye")
+    assert not trie.add("ramen")
+    assert trie.add("rice", 1)  # existing keys still gain weight
+    assert len(trie) == 2
+
+
+def test_suggester_sources_and_display():
+    s = DishSuggester(max_terms=1000, max_results=5, min_query_count=1)
+    s.add_aliases({"mac n cheese": "macaroni and cheese"})
+    s.add_foods([usda_food(description="Macaroni, cooked, enriched")])
+    s.add_query("Macaroni salad")
+    assert s.suggest("MACA") == ["macaroni salad", "macaroni and cheese", "Macaroni, cooked, enriched"]
+    assert s.suggest("   ") == []
+
+
+def test_suggester_seeds_from_recording(tmp_path):
+    store = SearchRecordingStore(tmp_path / "rec.ndjson")
+    store.append([{"q": "Pad Thai", "ms": 1, "r": {"foods": [usda_food(description="Pad thai, chicken")]}},
+                  {"q": "zzz", "ms": 1, "r": {"foods": []}}])
+    s = DishSuggester(max_terms=1000)
+    s.add_recording(store)
+    assert s.suggest("pad") == ["pad thai", "Pad thai, chicken"]
+    assert s.suggest("zz") == []
+
+
+@pytest.mark.anyio
+async def test_calorie_service_feeds_suggester():
+    s = DishSuggester(max_terms=1000)
+    svc = CalorieService(FakeUSDAClient({"foods": [usda_food(description="Grilled Chicken Salad")]}), s)
+    await svc.calculate(dish_name="grilled chicken salad", servings=1)
+    assert s.suggest("grilled") == ["Grilled Chicken Salad"]  # query and description share a key
+
+
+def test_queries_need_repeat_resolutions_before_they_are_suggested():
+    s = DishSuggester(max_terms=1000, min_query_count=3)
+    s.add_query("Grandma's secret stew")
+    s.add_query("GRANDMA'S  secret stew!")
+    assert s.suggest("grand") == []
+    s.add_query("Grandma's secret stew")
+    assert s.suggest("grand") == ["grandma s secret stew"]
+
+
+@pytest.mark.anyio
+async def test_only_the_interactive_service_feeds_the_shared_suggester(monkeypatch):
+    shared = DishSuggester(max_terms=1000, min_query_count=1)
+    fake = FakeUSDAClient({"foods": [usda_food(description="Grilled Chicken Salad")]})
+    monkeypatch.setattr(suggestion_module, "_singleton", shared)
+    monkeypatch.setattr(jobs_controller, "get_food_search_client", lambda: fake)
+    monkeypatch.setattr(calories_controller, "get_food_search_client", lambda: fake)
+
+    await get_bulk_service().calculate(dish_name="Chicken Salad Bowl", servings=1)
+    assert shared.suggest("chicken") == [] and shared.suggest("grilled") == []
+
+    interactive = get_service(get_dish_suggester())
+    await interactive.calculate(dish_name="Chicken Salad Bowl", servings=1)
+    assert shared.suggest("chicken") == ["chicken salad bowl"]
+    assert shared.suggest("grilled") == ["Grilled Chicken Salad"]
+
+
+def test_cached_top_lists_stay_exact_as_terms_are_added():
+    trie = PrefixTrie(top_k=5)
+    weights = {f"food item {i} with some longer description": float(i % 97) for i in range(20_000)}
+
+    def _expected(prefix):
+        ranked = sorted((k for k in weights if k.startswith(prefix)),
+                        key=lambda k: (-weights[k], len(k), k))
+        return [(k, weights[k]) for k in ranked[:5]]
+
+    for key, w in weights.items():
+        trie.add(key, w)
+    prefixes = ["food item 12", "food item 1", "food item 19999", "food"]
+    assert all(trie.top(p) == _expected(p) for p in prefixes)
+
+    # re-weight buried terms, insert new ones and split existing edges
+    for key, w in [("food item 123 with some longer description", 500.0),
+                   ("food item 12", 200.0), ("food item 1x", 300.0),
+                   ("food item 19999 with some longer description", 1.0)]:
+        trie.add(key, w)
+        weights[key] = weights.get(key, 0.0) + w
+    assert all(trie.top(p) == _expected(p) for p in prefixes)
@@ -0,0 +1,59 @@
+import json
+import httpx
+import pytest
+from app.adapters.http.admitted_search import AdmittedFoodSearchClient
+from app.adapters.http.usda_client import USDAClient
+from app.core.admission import AdmissionController
+from app.services.calorie_service import CalorieService
+
+ENERGY = [{"nutrient": {"name": "Energy", "unitName": "kcal"}, "amount": 120}]
+
+
+class FakeUSDA:
+    """Search + /foods endpoints; every search hit lacks energy, details have it."""
+    def __init__(self):
+        self.requests: list[httpx.Request] = []
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path.endswith("/search"):
+            return httpx.Response(200, json={"foods": [
+                {"fdcId": 11, "description": "Greek Yogurt", "foodNutrients": []},
+                {"fdcId": 12, "description": "Greek Yogurt Plain", "foodNutrients": []},
+            ]})
+        ids = json.loads(request.content)["fdcIds"]
+        return httpx.Response(200, json=[{"fdcId": i, "foodNutrients": ENERGY} for i in ids if i != 99])
+
+
+def _client(fake: FakeUSDA) -> USDAClient:
+    return USDAClient(client=httpx.AsyncClient(transport=httpx.MockTransport(fake)),
+                      base_url="http://usda/fdc/v1/foods/search", foods_url="http://usda/fdc/v1/foods",
+                      api_key="k", cache_ttl_s=600)
+
+
+@pytest.mark.anyio
+async def test_details_are_batched_and_cached_by_fdc_id():
+    fake = FakeUSDA()
+    usda = _client(fake)
+    assert usda.cached_foods([11]) is None
+    got = await usda.foods([11, 99, 11])
+    assert list(got) == [11]
+    assert len(fake.requests) == 1
+    body = json.loads(fake.requests[0].content)
+    assert body["fdcIds"] == [11, 99] and body["format"] == "full"
+
+    # 11 and the unknown 99 are both cached now; only 12 goes upstream
+    assert usda.cached_foods([11, 99]) == got
+    assert list(await usda.foods([99, 11, 12])) == [11, 12]
+    assert json.loads(fake.requests[1].content)["fdcIds"] == [12]
+
+
+@pytest.mark.anyio
+async def test_fallback_costs_one_round_trip_and_later_queries_none():
+    fake = FakeUSDA()
+    svc = CalorieService(AdmittedFoodSearchClient(_client(fake), AdmissionController(max_in_flight=4)))
+    out = await svc.calculate(dish_name="greek yogurt", servings=1)
+    assert out.calories_per_serving == 120.0
+    assert [r.method for r in fake.requests] == ["GET", "POST"]
+
+    await svc.calculate(dish_name="greek yogurt plain", servings=1)  # new search, same foods
+    assert [r.method for r in fake.requests] == ["GET", "POST", "GET"]
@@ -0,0 +1,36 @@
+from datetime import date, datetime, timezone
+from app.adapters.db.sqlalchemy_meal_repository import SqlAlchemyMealRepository
+from tests.factories import make_user
+
+
+def test_daily_totals_track_adds_and_deletes(db_session):
+    user = make_user(db_session, email="mealrepo@example.com")
+    repo = SqlAlchemyMealRepository(db_session)
+    day = datetime(2024, 3, 1, 12, tzinfo=timezone.utc)
+    first = repo.add(user.id, "toast", 1, 120.0, day)
+    repo.add(user.id, "eggs", 2, 150.0, day.replace(hour=8))
+    repo.add(user.id, "pizza", 1, 300.0, datetime(2024, 3, 2, 1, tzinfo=timezone.utc))
+
+    totals = repo.daily_totals(user.id, date(2024, 3, 1), date(2024, 3, 2))
+    assert [(t.day, t.total_calories, t.entry_count) for t in totals] == [
+        (date(2024, 3, 1), 270.0, 2), (date(2024, 3, 2), 300.0, 1)
+    ]
+
+    repo.delete(first)
+    db_session.expire_all()
+    [mar1] = repo.daily_totals(user.id, date(2024, 3, 1), date(2024, 3, 1))
+    assert (mar1.total_calories, mar1.entry_count) == (150.0, 1)
+
+
+def test_list_page_is_keyset_ordered(db_session):
+    user = make_user(db_session, email="mealpage@example.com")
+    repo = SqlAlchemyMealRepository(db_session)
+    ts = datetime(2024, 3, 1, 12, tzinfo=timezone.utc)
+    a = repo.add(user.id, "a", 1, 1.0, ts)
+    b = repo.add(user.id, "b", 1, 1.0, ts)
+    c = repo.add(user.id, "c", 1, 1.0, ts.replace(hour=13))
+
+    page1 = repo.list_page(user.id, limit=2)
+    assert [e.id for e in page1] == [c.id, b.id]
+    page2 = repo.list_page(user.id, limit=2, before=(page1[-1].eaten_at, page1[-1].id))
+    assert [e.id for e in page2] == [a.id]
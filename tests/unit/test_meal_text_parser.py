@@ -0,0 +1,35 @@
+import pytest
+from app.utils.meal_text_parser import InvalidQuantity, MealItem, parse_meal_text
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("2 eggs, 1 slice toast and a cup of orange juice",
+     [("eggs", 2, None), ("toast", 1, "slice"), ("orange juice", 1, "cup")]),
+    ("macaroni and cheese and 2 cookies", [("macaroni and cheese", 1, None), ("cookies", 2, None)]),
+    ("1 1/2 cups rice; half a bagel", [("rice", 1.5, "cups"), ("bagel", 0.5, None)]),
+    ("a dozen oysters\n½ avocado + apple", [("oysters", 12, None), ("avocado", 0.5, None),
+                                           ("apple", 1, None)]),
+    ("2 dozen eggs, a couple of cookies plus three bowls of soup",
+     [("eggs", 24, None), ("cookies", 2, None), ("soup", 3, "bowls")]),
+    ("1/2 cup milk and 3/4 bowl oatmeal", [("milk", 0.5, "cup"), ("oatmeal", 0.75, "bowl")]),
+    ("1/4 pizza, 2.5 cups rice", [("pizza", 0.25, None), ("rice", 2.5, "cups")]),
+    ("1 and 1/2 cups rice", [("rice", 1.5, "cups")]),
+    ("two and a half eggs and 2 and ½ slices toast", [("eggs", 2.5, None), ("toast", 2.5, "slices")]),
+    ("half and half", [("half and half", 1, None)]),
+    ("coffee and half and half", [("coffee", 1, None), ("half and half", 1, None)]),
+    ("a slice", [("slice", 1, None)]),  # a unit with nothing after it is the dish
+    ("and, 3, ,", []),
+])
+def test_parse_meal_text(text, expected):
+    assert [(i.dish_name, i.quantity, i.unit) for i in parse_meal_text(text)] == expected
+
+
+def test_item_keeps_original_text():
+    assert parse_meal_text("  2   Eggs ") == [MealItem(text="2 Eggs", dish_name="Eggs", quantity=2.0)]
+
+
+@pytest.mark.parametrize("text", ["3 1/0 cups rice", "9" * 400 + " eggs", "1001 eggs",
+                                  "100 dozen eggs"])
+def test_invalid_quantities_are_rejected(text):
+    with pytest.raises(InvalidQuantity):
+        parse_meal_text(text)
@@ -0,0 +1,64 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from app.adapters.catalog.local_catalog_client import LocalCatalogSearchClient, build_catalog
+from app.services.calorie_service import CalorieService
+from app.utils.ngram_matcher import NgramMatcher
+from tests.factories import usda_food
+
+DESCRIPTIONS = [
+    "Chicken, broilers or fryers, breast, meat only, cooked, roasted",
+    "Salmon, Atlantic, farmed, cooked, dry heat",
+    "Grilled Chicken Salad",
+    "Rice, white, long-grain, regular, cooked",
+    "Pizza, cheese topping, regular crust, frozen, cooked",
+]
+
+
+def test_top_k_ranks_closest_description_first():
+    matcher = NgramMatcher.build(DESCRIPTIONS)
+    hits = matcher.top_k("grilld chiken salad", 3)
+    assert hits[0][0] == 2
+    assert [s for _, s in hits] == sorted((s for _, s in hits), reverse=True)
+    assert 0 < hits[0][1] <= 1.0 + 1e-6
+    assert matcher.top_k("zzzz", 3) == []
+
+
+def test_match_reranks_with_composite_score():
+    matcher = NgramMatcher.build(DESCRIPTIONS)
+    doc_id, score = matcher.match("white rice", DESCRIPTIONS, k=1)[0]
+    assert doc_id == 3
+    assert score > 0
+
+
+def test_save_and_mmap_load_round_trip(tmp_path):
+    built = NgramMatcher.build(DESCRIPTIONS)
+    built.save(tmp_path)
+    loaded = NgramMatcher.load(tmp_path)
+    assert len(loaded) == len(DESCRIPTIONS)
+    assert loaded.top_k("atlantic salmon", 2) == built.top_k("atlantic salmon", 2)
+
+
+@pytest.mark.anyio
+async def test_local_catalog_client_serves_calorie_service(tmp_path):
+    foods = [usda_food(description=d, fdcId=i) for i, d in enumerate(DESCRIPTIONS)]
+    assert build_catalog(foods, tmp_path) == len(foods)
+    client = LocalCatalogSearchClient(tmp_path, default_page_size=3)
+    try:
+        data = await client.search("grilled chicken salad")
+        assert data["foods"][0]["description"] == "Grilled Chicken Salad"
+        assert len(data["foods"]) <= 3
+        out = await CalorieService(client).calculate(dish_name="grilled chicken salad", servings=2)
+        assert out.total_calories == 500.0
+    finally:
+        await client.aclose()
+
+
+def test_top_k_skips_ngrams_common_to_most_of_the_catalog():
+    descriptions = [f"frozen food item {i}" for i in range(30)] + ["Mango lassi"]
+    matcher = NgramMatcher.build(descriptions)
+    # "food" is in nearly every doc, so only the selective "mango" n-grams are scored
+    assert [doc_id for doc_id, _ in matcher.top_k("mango food", 5)] == [30]
+    # a query made only of common n-grams still falls back to scoring them
+    assert len(matcher.top_k("frozen food", 5)) == 5
@@ -0,0 +1,162 @@
+import asyncio
+import httpx
+import pytest
+from fastapi import FastAPI
+from pydantic import SecretStr, ValidationError
+from app.adapters.http.peer_search import PeerFoodSearchClient
+from app.adapters.http.usda_client import USDAClient
+from app.controllers.peer import get_peer_client, router as peer_router
+from app.core.admission import (AdmissionController, Overloaded, get_admission_controller,
+                                overloaded_handler)
+from app.core.config import Settings, get_settings
+from app.utils.hash_ring import HashRing
+
+KEYS = [f"dish {i}" for i in range(400)]
+
+
+def test_ring_is_deterministic_and_moves_few_keys_when_growing():
+    nodes = ["http://a:8000", "http://b:8000", "http://c:8000"]
+    ring = HashRing(nodes)
+    assert ring.owner("chicken salad") == HashRing(reversed(nodes)).owner("chicken salad")
+    owners = [ring.owner(k) for k in KEYS]
+    assert all(owners.count(n) > len(KEYS) / 6 for n in nodes)
+
+    grown = HashRing(nodes + ["http://d:8000"])
+    moved = [k for k, o in zip(KEYS, owners) if grown.owner(k) != o]
+    assert all(grown.owner(k) == "http://d:8000" for k in moved)
+    assert len(moved) < len(KEYS) / 2
+
+
+class Upstream:
+    """Fake USDA endpoint counting calls, optionally slow."""
+    def __init__(self, delay_s=0.0):
+        self.calls, self._delay = 0, delay_s
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        await asyncio.sleep(self._delay)
+        return httpx.Response(200, json={"foods": [{"description": request.url.params["query"]}]})
+
+
+def _usda(upstream: Upstream) -> USDAClient:
+    return USDAClient(client=httpx.AsyncClient(transport=httpx.MockTransport(upstream)),
+                      base_url="http://usda/search", api_key="k", retries=0, cache_ttl_s=600)
+
+
+@pytest.fixture()
+def peer_token(monkeypatch):
+    monkeypatch.setattr(get_settings(), "PEER_TOKEN", SecretStr("s3cret"))
+    return "s3cret"
+
+
+def _provide(node):
+    return lambda: node
+
+
+def _cluster(n: int, upstream: Upstream, token: str,
+             admission: AdmissionController | None = None) -> list[PeerFoodSearchClient]:
+    """n nodes wired to each other's /internal/peer endpoint in-process."""
+    urls = [f"http://node{i}:8000" for i in range(n)]
+    ring = HashRing(urls)
+    apps: dict[str, httpx.ASGITransport] = {}
+
+    async def route(request: httpx.Request) -> httpx.Response:
+        base = f"{request.url.scheme}://{request.url.host}:{request.url.port}"
+        resp = await apps[base].handle_async_request(request)
+        await resp.aread()
+        return resp
+
+    nodes = []
+    for url in urls:
+        node = PeerFoodSearchClient(_usda(upstream), ring, url, token=token,
+                                    client=httpx.AsyncClient(transport=httpx.MockTransport(route)))
+        app = FastAPI()
+        app.include_router(peer_router)
+        app.dependency_overrides[get_peer_client] = _provide(node)
+        app.add_exception_handler(Overloaded, overloaded_handler)
+        if admission is not None:
+            app.dependency_overrides[get_admission_controller] = _provide(admission)
+        apps[url] = httpx.ASGITransport(app=app)
+        nodes.append(node)
+    return nodes
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("size", [1, 2, 4])
+async def test_upstream_calls_stay_flat_as_cluster_grows(peer_token, size):
+    upstream = Upstream()
+    nodes = _cluster(size, upstream, peer_token)
+    queries = [f"dish {i}" for i in range(12)]
+    for _ in range(3):  # round-robin balancer: every node sees every query
+        for node in nodes:
+            for q in queries:
+                data = await node.search(q)
+                assert data["foods"][0]["description"] == q
+    assert upstream.calls == len(queries)
+
+
+@pytest.mark.anyio
+async def test_owner_coalesces_concurrent_fetches(peer_token):
+    upstream = Upstream(delay_s=0.05)
+    owner, other = _cluster(2, upstream, peer_token)
+    query = next(k for k in KEYS if owner.owner(k) == "http://node0:8000")
+    results = await asyncio.gather(*(n.search(query) for n in [owner, other] * 10))
+    assert upstream.calls == 1
+    assert all(r == results[0] for r in results)
+
+
+@pytest.mark.anyio
+async def test_unreachable_owner_falls_back_to_upstream():
+    async def refuse(request):
+        raise httpx.ConnectError("connection refused", request=request)
+    upstream = Upstream()
+    node = PeerFoodSearchClient(_usda(upstream), HashRing(["http://dead:8000"]), "http://me:8000",
+                                client=httpx.AsyncClient(transport=httpx.MockTransport(refuse)))
+    assert (await node.search("rice"))["foods"]
+    assert upstream.calls == 1
+
+
+@pytest.mark.anyio
+async def test_peer_endpoint_requires_token(peer_token):
+    upstream = Upstream()
+    node = _cluster(1, upstream, peer_token)[0]
+    app = FastAPI()
+    app.include_router(peer_router)
+    app.dependency_overrides[get_peer_client] = lambda: node
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://t") as c:
+        assert (await c.get("/internal/peer/search", params={"q": "rice"})).status_code == 403
+        ok = await c.get("/internal/peer/search", params={"q": "rice"},
+                         headers={"X-Peer-Token": peer_token})
+        assert ok.status_code == 200
+    assert upstream.calls == 1
+
+
+@pytest.mark.anyio
+async def test_cancelled_leader_does_not_fail_coalesced_waiters():
+    upstream = Upstream(delay_s=0.05)
+    node = PeerFoodSearchClient(_usda(upstream), HashRing(["http://me:8000"]), "http://me:8000")
+    leader = asyncio.create_task(node.fetch_as_owner("rice"))
+    await asyncio.sleep(0.01)
+    waiters = [asyncio.create_task(node.fetch_as_owner("rice")) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    leader.cancel()  # e.g. the leading request's client disconnected
+    results = await asyncio.gather(*waiters)
+    assert all(r["foods"][0]["description"] == "rice" for r in results)
+    assert leader.cancelled()
+
+
+def test_peer_cache_without_token_is_rejected():
+    with pytest.raises(ValidationError, match="PEER_TOKEN"):
+        Settings(PEER_CACHE_ENABLED=True, PEER_TOKEN="")
+
+
+@pytest.mark.anyio
+async def test_owner_sheds_peer_misses_through_admission(peer_token):
+    upstream = Upstream()
+    full = AdmissionController(max_in_flight=1, max_queue=0, retry_after_s=7)
+    _, other = _cluster(2, upstream, peer_token, admission=full)
+    async with full.slot():  # owner already at capacity
+        query = next(k for k in KEYS if other.owner(k) == "http://node0:8000")
+        with pytest.raises(Overloaded) as exc:
+            await other.search(query)
+    assert exc.value.retry_after_s == 7
+    assert upstream.calls == 0
@@ -0,0 +1,58 @@
+import json
+import time
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.core import profiling
+from app.core.profiling import ProfilingMiddleware
+
+
+def _busy_handler():
+    end = time.perf_counter() + 0.05
+    while time.perf_counter() < end:
+        pass
+    return {"ok": True}
+
+
+def _app(**kw) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/work")
+    async def work():
+        return _busy_handler()
+
+    app.add_middleware(ProfilingMiddleware, **kw)
+    return app
+
+
+def test_requests_without_token_are_untouched():
+    client = TestClient(_app(token="s3cret"))
+    r = client.get("/work", headers={"X-Profile-Token": "wrong"})
+    assert r.json() == {"ok": True}
+
+
+def test_on_demand_profile_returns_speedscope_json():
+    client = TestClient(_app(token="s3cret", interval_s=0.001))
+    r = client.get("/work", headers={"X-Profile-Token": "s3cret"})
+    assert r.status_code == 200 and r.headers["x-profiled-status"] == "200"
+    doc = r.json()
+    profile = doc["profiles"][0]
+    assert profile["type"] == "sampled" and profile["samples"]
+    names = {doc["shared"]["frames"][i]["name"] for s in profile["samples"] for i in s}
+    assert "_busy_handler" in names
+
+
+def test_one_in_n_sampling_writes_profiles(tmp_path):
+    client = TestClient(_app(sample_every_n=2, out_dir=str(tmp_path)))
+    for _ in range(4):
+        assert client.get("/work").json() == {"ok": True}
+    files = list(tmp_path.glob("*.speedscope.json"))
+    assert len(files) == 2
+    assert json.loads(files[0].read_text())["profiles"][0]["type"] == "sampled"
+
+
+def test_one_in_n_sampling_is_off_without_out_dir(monkeypatch):
+    started = []
+    monkeypatch.setattr(profiling.SamplingProfiler, "start", lambda self: started.append(self))
+    client = TestClient(_app(sample_every_n=1))
+    assert client.get("/work").json() == {"ok": True}
+    assert not started
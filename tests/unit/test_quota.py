@@ -0,0 +1,70 @@
+import asyncio
+import httpx
+import pytest
+from app.adapters.http.usda_client import USDAClient
+from app.core.admission import Overloaded
+from app.core.quota import Priority, QuotaGovernor, call_priority, current_priority
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+    def __call__(self):
+        return self.now
+
+
+def _governor(**kw):
+    kw.setdefault("clock", Clock())
+    return QuotaGovernor(**{"per_hour": 100, "background_reserve": 0.2, "max_wait_s": 1.0, **kw})
+
+
+def test_headers_override_local_estimate():
+    gov = _governor()
+    gov.observe({"X-RateLimit-Limit": "500", "X-RateLimit-Remaining": "3"})
+    assert gov.tokens == 3
+    gov.observe({"X-RateLimit-Remaining": "oops"})
+    assert gov.tokens == 3
+
+
+@pytest.mark.anyio
+async def test_background_waits_below_reserve_while_interactive_proceeds():
+    gov = _governor()
+    gov.observe({"X-RateLimit-Remaining": "10"})  # below the 20-token reserve
+    await gov.acquire(Priority.INTERACTIVE)
+    assert gov.tokens == 9
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(gov.acquire(Priority.BACKGROUND), 0.1)
+
+    gov.observe({"X-RateLimit-Remaining": "50"})
+    await asyncio.wait_for(gov.acquire(Priority.BACKGROUND), 1)
+    assert gov.tokens == 49
+
+
+@pytest.mark.anyio
+async def test_priority_comes_from_context():
+    assert current_priority() is Priority.INTERACTIVE
+    gov = _governor()
+    gov.observe({"X-RateLimit-Remaining": "5"})
+    with call_priority(Priority.BACKGROUND):
+        assert current_priority() is Priority.BACKGROUND
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(gov.acquire(), 0.1)
+    await gov.acquire()
+    assert gov.tokens == 4
+
+
+@pytest.mark.anyio
+async def test_interactive_is_shed_after_429_instead_of_retrying():
+    calls = 0
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(429, headers={"Retry-After": "120", "X-RateLimit-Remaining": "0"})
+
+    gov = _governor()
+    usda = USDAClient(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                      base_url="http://usda/search", api_key="k", retries=3, quota=gov)
+    with pytest.raises(Overloaded) as exc:
+        await usda.search("rice")
+    assert calls == 1
+    assert exc.value.retry_after_s == 120
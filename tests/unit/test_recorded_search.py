@@ -0,0 +1,52 @@
+import time
+import pytest
+from app.adapters.http.recorded_search import (RecordingFoodSearchClient, ReplayFoodSearchClient,
+                                               SearchRecordingStore)
+from app.adapters.http.usda_client import USDAError
+from app.services.calorie_service import CalorieService
+from tests.factories import FakeUSDAClient, usda_food
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("name", ["rec.ndjson", "rec.ndjson.gz"])
+async def test_record_then_replay_round_trip(tmp_path, name):
+    foods = {"foods": [usda_food(description="Grilled Chicken Salad")]}
+    store = SearchRecordingStore(tmp_path / name)
+    live = FakeUSDAClient(foods)
+    recorder = RecordingFoodSearchClient(live, store, flush_every=1)
+    await recorder.search("Grilled Chicken Salad")
+    await recorder.search("grilled chicken salad ")  # same key: not recorded twice
+    await recorder.aclose()
+
+    replay = ReplayFoodSearchClient(SearchRecordingStore(tmp_path / name))
+    assert len(replay) == 1
+    assert await replay.search("GRILLED CHICKEN SALAD") == foods
+    out = await CalorieService(replay).calculate(dish_name="grilled chicken salad", servings=2)
+    assert out.total_calories == 500.0
+
+
+@pytest.mark.anyio
+async def test_replay_miss_and_latency(tmp_path):
+    store = SearchRecordingStore(tmp_path / "rec.ndjson")
+    store.append([{"q": "soup", "ms": 30.0, "r": {"foods": []}}])
+
+    assert await ReplayFoodSearchClient(store).search("unknown") == {"foods": []}
+    with pytest.raises(USDAError):
+        await ReplayFoodSearchClient(store, strict=True).search("unknown")
+
+    slow = ReplayFoodSearchClient(store, use_recorded_latency=True)
+    started = time.perf_counter()
+    await slow.search("soup")
+    assert time.perf_counter() - started >= 0.025
+
+
+@pytest.mark.anyio
+async def test_page_size_is_part_of_the_recording_key(tmp_path):
+    store = SearchRecordingStore(tmp_path / "rec.ndjson")
+    recorder = RecordingFoodSearchClient(FakeUSDAClient({"foods": [usda_food()]}), store)
+    await recorder.search("rice", page_size=5)
+    await recorder.aclose()
+
+    replay = ReplayFoodSearchClient(store)
+    assert (await replay.search("rice", page_size=5))["foods"]
+    assert await replay.search("rice") == {"foods": []}  # default page size was never recorded
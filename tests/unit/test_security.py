@@ -1,4 +1,7 @@
-from app.core.security import hash_password, verify_password, create_access_token
+import jwt
+import pytest
+from app.core.security import (hash_password, verify_password, create_access_token,
+                               create_refresh_token, decode_access_token)
 
 def test_password_hash_verify():
     pw_hashed = hash_password("secretpw123")
@@ -8,3 +11,10 @@ def test_password_hash_verify():
 def test_jwt_created():
     token = create_access_token("42", minutes=1, extra={"email": "a@b.com"})
     assert isinstance(token, str) and len(token) > 20
+
+def test_tokens_carry_unique_jti_and_type():
+    a, b = create_access_token("42"), create_access_token("42")
+    ca, cb = decode_access_token(a), decode_access_token(b)
+    assert ca["type"] == "access" and ca["jti"] != cb["jti"]
+    with pytest.raises(jwt.InvalidTokenError):
+        decode_access_token(create_refresh_token("42"))
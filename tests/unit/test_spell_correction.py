@@ -0,0 +1,57 @@
+import pytest
+from app.core.config import get_settings
+from app.services.calorie_service import canonical_dish_key
+from app.utils.spell_correction import SymSpellIndex, correct_query, get_spell_index
+
+USDA_LIKE = ["Broccoli, raw", "Spaghetti bolognese", "Soup, broccoli cheese", "Paneer tikka"]
+
+
+@pytest.fixture
+def index_path(tmp_path, monkeypatch):
+    path = tmp_path / "spell_index.json"
+    SymSpellIndex.from_descriptions(USDA_LIKE).save(path)
+    monkeypatch.setattr(get_settings(), "SPELL_INDEX_PATH", str(path))
+    get_spell_index.cache_clear()
+    yield path
+    get_spell_index.cache_clear()
+
+
+def test_index_corrects_common_typos():
+    idx = SymSpellIndex.from_descriptions(USDA_LIKE)
+    assert idx.correct("brocoli soup") == "broccoli soup"
+    assert idx.correct("Spagetti Bolognese") == "spaghetti bolognese"
+
+def test_known_and_short_tokens_are_untouched():
+    idx = SymSpellIndex.from_descriptions(USDA_LIKE)
+    assert idx.lookup("paneer") == "paneer"
+    assert idx.lookup("dish") == "dish"
+    assert idx.lookup("zzzzzzzz") == "zzzzzzzz"
+
+def test_frequency_breaks_ties():
+    idx = SymSpellIndex.from_descriptions(["Salted Butter", "Salted Butter", "Salted Batter"])
+    assert idx.lookup("bitter") == "butter"
+
+def test_index_round_trips_through_disk(tmp_path):
+    idx = SymSpellIndex.from_descriptions(["Spaghetti, cooked", "Broccoli, raw"])
+    path = tmp_path / "spell_index.json"
+    idx.save(path)
+    loaded = SymSpellIndex.load(path)
+    assert len(loaded) == len(idx)
+    assert loaded.lookup("spagetti") == "spaghetti"
+
+@pytest.mark.parametrize("dish", ["risotto", "quiche", "almond", "cashew", "oyster",
+                                  "nachos", "toasted", "paste"])
+def test_without_an_index_valid_foods_pass_through(dish):
+    # no SPELL_INDEX_PATH: nothing gets "corrected" into a neighbouring food
+    assert get_spell_index() is None
+    assert correct_query(dish) == dish
+    assert canonical_dish_key(f"{dish} bowl") == f"{dish} bowl"
+
+def test_configured_index_corrects_queries(index_path):
+    assert correct_query("brocoli soup") == "broccoli soup"
+    assert canonical_dish_key("Brocoli  Soup!") == "broccoli soup"
+
+def test_disabled_flag_wins_over_configured_index(index_path, monkeypatch):
+    monkeypatch.setattr(get_settings(), "SPELL_CORRECTION_ENABLED", False)
+    get_spell_index.cache_clear()
+    assert correct_query("brocoli") == "brocoli"
@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta, timezone
+from app.core.revocation import RevocationList
+from app.utils.bloom_filter import BloomFilter
+
+
+class FakeRevokedRepo:
+    def __init__(self):
+        self.rows: dict[str, datetime] = {}
+        self.lookups = 0
+    def add(self, jti, token_type, expires_at):
+        if jti in self.rows:
+            return False
+        self.rows[jti] = datetime.now(timezone.utc)
+        return True
+    def is_revoked(self, jti):
+        self.lookups += 1
+        return jti in self.rows
+    def revoked_since(self, since, now):
+        return [(j, t) for j, t in self.rows.items() if t >= since]
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bf = BloomFilter(1000, 0.01)
+    items = [f"jti-{i}" for i in range(1000)]
+    for i in items:
+        bf.add(i)
+    assert all(i in bf for i in items)
+    false_pos = sum(f"other-{i}" in bf for i in range(10000))
+    assert false_pos < 300
+
+def test_unrevoked_tokens_skip_the_database():
+    repo = FakeRevokedRepo()
+    revs = RevocationList(capacity=1000, error_rate=0.001, sync_interval_s=60)
+    exp = datetime.now(timezone.utc) + timedelta(hours=1)
+    revs.revoke("bad", "access", exp, repo)
+    assert revs.is_revoked("bad", repo)
+    lookups = repo.lookups
+    assert not revs.is_revoked("good", repo)
+    assert repo.lookups == lookups
+
+def test_revocations_from_other_workers_arrive_on_sync():
+    now = [0.0]
+    repo = FakeRevokedRepo()
+    revs = RevocationList(capacity=1000, error_rate=0.001, sync_interval_s=5, clock=lambda: now[0])
+    assert not revs.is_revoked("t1", repo)
+    repo.add("t1", "access", None)  # written by another worker
+    assert not revs.is_revoked("t1", repo)  # not synced yet
+    now[0] = 6.0
+    assert revs.is_revoked("t1", repo)